@@ -6,6 +6,7 @@
 """
 
 import os
+import re
 import json
 import requests
 from typing import Optional, Dict, Any
@@ -17,6 +18,10 @@ config_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.pat
 secrets_file = os.path.join(config_dir, 'secrets.env')
 load_dotenv(secrets_file)
 
+# 从推理内容中提取匹配原因时，句子中需包含的关键词
+REASON_KEYWORDS = ("属于", "符合", "匹配", "相关")
+REASON_KEYWORD_RE = re.compile('|'.join(REASON_KEYWORDS))
+
 
 class GLMClient(BaseAIClient):
     """智谱GLM API客户端 - 纯API调用器"""
@@ -192,7 +197,7 @@ class GLMClient(BaseAIClient):
                                 if "岗位" in reasoning_content:
                                     sentences = reasoning_content.split("。")
                                     for sentence in sentences:
-                                        if any(word in sentence for word in ["属于", "符合", "匹配", "相关"]):
+                                        if REASON_KEYWORD_RE.search(sentence):
                                             extracted_reason = sentence.strip()[:100]
                                             if len(extracted_reason) > 10:  # 确保提取的原因有意义
                                                 reason = extracted_reason
@@ -342,7 +347,7 @@ class GLMClient(BaseAIClient):
                                 if "岗位" in reasoning_content:
                                     sentences = reasoning_content.split("。")
                                     for sentence in sentences:
-                                        if any(word in sentence for word in ["属于", "符合", "匹配", "相关"]):
+                                        if REASON_KEYWORD_RE.search(sentence):
                                             extracted_reason = sentence.strip()[:100]
                                             if len(extracted_reason) > 10:  # 确保提取的原因有意义
                                                 reason = extracted_reason
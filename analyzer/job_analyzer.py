@@ -10,6 +10,11 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# 解析AI响应用的正则（每个岗位的分析结果都要解析，模块加载时编译一次）
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+TEXT_SCORE_RE = re.compile(r'评分[:：]\s*(\d+)')
+TEXT_OVERALL_SCORE_RE = re.compile(r'(?:总分|综合|评分|score).*?(\d+(?:\.\d+)?)', re.IGNORECASE)
+
 
 class JobAnalyzer:
     def __init__(self, ai_provider=None, model_name=None):
@@ -432,8 +437,7 @@ class JobAnalyzer:
         recommendation = '一般推荐'
         
         # 尝试提取评分
-        import re
-        score_match = re.search(r'评分[:：]\s*(\d+)', text)
+        score_match = TEXT_SCORE_RE.search(text)
         if score_match:
             score = min(10, max(1, int(score_match.group(1))))
         
@@ -499,7 +503,7 @@ class JobAnalyzer:
         """
         try:
             # 尝试提取JSON部分
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+            json_match = JSON_OBJECT_RE.search(response_text)
             if json_match:
                 json_str = json_match.group()
                 result = json.loads(json_str)
@@ -531,7 +535,7 @@ class JobAnalyzer:
         """
         try:
             # 尝试提取JSON部分
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+            json_match = JSON_OBJECT_RE.search(response_text)
             if json_match:
                 json_str = json_match.group()
                 result = json.loads(json_str)
@@ -587,7 +591,7 @@ class JobAnalyzer:
     def _parse_text_job_analysis(self, text: str) -> Dict[str, Any]:
         """从文本中解析岗位分析结果（从AIService移过来）"""
         # 尝试从文本中提取评分
-        score_match = re.search(r'(?:总分|综合|评分|score).*?(\d+(?:\.\d+)?)', text, re.IGNORECASE)
+        score_match = TEXT_OVERALL_SCORE_RE.search(text)
         score = float(score_match.group(1)) if score_match else 5.0
         
         # 判断推荐等级
@@ -4,16 +4,274 @@
 整合智能选择器系统，提供高质量的数据提取和验证
 """
 
+import functools
 import logging
 import asyncio
+import os
 import time
 import re
+from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from playwright.async_api import Page, ElementHandle
-from .smart_selector import SmartSelector, ExtractedField
+from .smart_selector import SmartSelector, ExtractedField, SALARY_TEXT_TRANS, candidate_selectors
 
 logger = logging.getLogger(__name__)
 
+# 岗位缺失字段时使用的固定占位文本（不依赖岗位内容，全局共享）
+DEFAULT_JOB_FIELDS = {
+    "job_requirements": "具体要求请查看岗位详情。",
+    "benefits": "具体福利待遇请查看岗位详情",
+    "experience_required": "相关经验",
+    "education_required": "相关学历",
+}
+
+# 字段类型到岗位数据字典键名的映射
+FIELD_KEY_MAP = {
+    "job_title": "title",
+    "company_name": "company",
+    "salary": "salary",
+    "location": "work_location",
+    "job_link": "url"
+}
+
+# 提取结果中表示字段获取失败的占位值
+INVALID_FIELD_VALUES = frozenset({"信息获取失败", "职位信息获取失败", "公司信息获取失败"})
+
+# 主要城市，用于地点识别和格式化
+MAJOR_CITIES = ('北京', '上海', '深圳', '杭州', '广州')
+LOCATION_PREFIX_CITIES = ('北京', '上海', '深圳', '杭州')
+FALLBACK_CITIES = ('北京', '上海', '广州', '深圳', '杭州', '南京', '武汉', '成都')
+
+# 城市列表预编译为正则交替式，一次扫描代替逐个城市的 in 判断
+MAJOR_CITY_RE = re.compile('|'.join(MAJOR_CITIES))
+LOCATION_PREFIX_CITY_RE = re.compile('|'.join(LOCATION_PREFIX_CITIES))
+FALLBACK_CITY_RE = re.compile('|'.join(FALLBACK_CITIES))
+
+# 岗位列表真实内容（非骨架屏）：岗位卡片、列表项、详情框、带数据ID的岗位、岗位主要信息
+CONTENT_READY_SELECTOR = '.job-card-wrapper, .job-list-item, .job-detail-box, li[data-jid], .job-primary'
+# 骨架屏/加载占位元素
+SKELETON_SELECTOR = '.skeleton, [class*="skeleton"], .loading-placeholder, [class*="loading"]'
+
+# 降级策略中判断容器是否为岗位的关键词
+CONTAINER_JOB_KEYWORDS = (
+    '工程师', '开发', '经理', '专员', '主管', '总监', '分析师',
+    '设计师', '产品', '运营', '市场', '销售', '财务', '人事',
+    'AI', '人工智能', '机器学习', '算法', '解决方案', '金融',
+    '咨询', '顾问', '架构师', '技术', '研发', '科技'
+)
+
+# 文本解析职位名称时使用的关键词，预编译为忽略大小写的交替式，一次扫描完成匹配
+TITLE_KEYWORDS = (
+    '工程师', '开发', '经理', '专员', '主管', '分析师', '架构师', '总监',
+    '风控', 'AI', '产品', '运营', '设计', '测试', '项目', '数据',
+    '前端', '后端', '算法', '研发', '技术', '咨询', '顾问', '专家',
+    'Java', 'Python', 'Go', 'C++', '解决方案', '售前', '售后'
+)
+TITLE_KEYWORD_RE = re.compile('|'.join(map(re.escape, TITLE_KEYWORDS)), re.IGNORECASE)
+
+SALARY_UNIT_RE = re.compile(r'\d+[KkWw万千]')
+SALARY_LOWER_K_RE = re.compile(r'k(?=[\d\-·])', re.IGNORECASE)
+# 降级文本解析用的字符/关键词检测，一次正则扫描代替逐个关键词的 in 判断
+NON_TITLE_CHARS_RE = re.compile(r'[K万元·]')
+NON_COMPANY_WORDS_RE = re.compile(r'K|万|年|经验|学历')
+SALARY_HINT_RE = re.compile(r'[K万薪元]')
+# 一次扫描取出所有非空行（已去除首尾空白），代替 split('\n') 后逐行 strip 两次
+NON_BLANK_LINE_RE = re.compile(r'^\s*(\S.*?)\s*$', re.M)
+
+# 有效岗位卡片的最短文本长度（不含），过短的通常是广告位或占位元素
+MIN_JOB_CARD_TEXT_LENGTH = 20
+
+# 页面加载中状态的标识（逐个检查，命中后等待对应元素隐藏）
+LOADING_INDICATOR_SELECTORS = ('.loading', '.spinner', '[class*="loading"]', '.skeleton')
+
+# 调试时统计的错误页面标识（只需要数量，在浏览器内计数，不为每个元素创建句柄）
+ERROR_INDICATOR_SELECTOR = '.error, .not-found, .empty, [class*="error"]'
+COUNT_ELEMENTS_JS = "(selector) => document.querySelectorAll(selector).length"
+
+# 页面覆盖层：登录弹窗和验证码
+LOGIN_MODAL_SELECTOR = '.login-dialog, .dialog-wrap, .modal'
+CAPTCHA_SELECTOR = '.captcha, .verify-wrap, [class*="captcha"]'
+
+# 一次调用检查全部覆盖层：登录弹窗/验证码是否可见，以及第一个可见的加载状态选择器
+# （可见性判断与Playwright的is_visible一致：有尺寸且visibility不为hidden）
+PAGE_OVERLAYS_JS = """
+([loginModalSelector, loadingSelectors, captchaSelector]) => {
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        return (rect.width > 0 || rect.height > 0) && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const firstVisible = selector => {
+        const el = document.querySelector(selector);
+        return el !== null && isVisible(el);
+    };
+    return {
+        loginModal: firstVisible(loginModalSelector),
+        loading: loadingSelectors.find(firstVisible) || null,
+        captcha: firstVisible(captchaSelector)
+    };
+}
+"""
+
+# 并发提取岗位卡片时同时进行的最大任务数
+EXTRACTION_CONCURRENCY = 8
+
+# 最小化示例数据：固定字段放在模板里，逐条只覆盖随序号变化的字段
+MINIMAL_FALLBACK_COMPANIES = ("科技公司", "互联网企业", "金融机构", "咨询公司", "制造企业")
+MINIMAL_FALLBACK_LOCATIONS = ("上海·浦东新区", "北京·朝阳区", "深圳·南山区", "杭州·余杭区")
+MINIMAL_FALLBACK_JOB_TEMPLATE = {
+    "salary": "薪资面议",
+    "url": "",
+    "job_description": "抱歉，页面加载异常，无法获取详细岗位信息。建议直接访问Boss直聘网站查看。",
+    "job_requirements": "具体要求请直接查看招聘网站",
+    "benefits": "具体福利待遇请查看岗位详情",
+    "experience_required": "相关经验",
+    "education_required": "相关学历",
+    "extraction_method": "minimal_fallback",
+    "engine_source": "Playwright最小化降级",
+    "fallback_extraction": True,
+    "note": "此为系统生成的最小化数据，请直接访问Boss直聘获取准确信息"
+}
+
+@functools.lru_cache(maxsize=64)
+def _join_selectors(selectors: Tuple[str, ...]) -> str:
+    """合并为CSS选择器列表；相同选择器组合复用同一个字符串，命中浏览器端的选择器解析缓存"""
+    return ", ".join(selectors)
+
+
+# 在浏览器内查询岗位容器、过滤并去重：不可见或文本过短的元素直接丢弃；
+# 有岗位详情链接的按链接地址去重（嵌套容器、重复渲染的同一岗位只保留第一个），否则按位置去重
+COLLECT_JOB_ELEMENTS_JS = """
+([selector, minTextLength]) => {
+    const seenKeys = new Set();
+    const result = [];
+    for (const el of document.querySelectorAll(selector)) {
+        // 可见性判断与Playwright的is_visible一致：有尺寸且visibility不为hidden
+        const rect = el.getBoundingClientRect();
+        if (!rect.width && !rect.height) continue;
+        if (getComputedStyle(el).visibility === 'hidden') continue;
+        // 岗位信息应该有一定长度
+        if ((el.innerText || '').trim().length <= minTextLength) continue;
+        // 优先按岗位详情链接去重（去掉查询参数），没有链接时退回到位置去重
+        const link = el.querySelector('a[href*="job_detail"]');
+        const href = link ? link.getAttribute('href') : null;
+        const key = href
+            ? 'url:' + href.split('?')[0]
+            : 'pos:' + Math.round(rect.x) + ',' + Math.round(rect.y);
+        if (seenKeys.has(key)) continue;
+        seenKeys.add(key);
+        result.push(el);
+    }
+    return result;
+}
+"""
+
+# 降级策略中Boss直聘常见的页面结构模式（按优先级排序）
+FALLBACK_CONTAINER_PATTERNS = [
+    'li[class*="job"]',     # 包含job的li元素
+    'div[class*="job"]',    # 包含job的div元素
+    'a[href*="job"]',       # 包含job链接的a元素
+    '[data-*]',             # 任何data属性元素
+    '.card, .item, .box',   # 常见容器类名
+    'li, div[class], a[class]'  # 有类名的基础元素
+]
+
+# 降级策略：按模式依次查询页面元素，保留可见、文本足够长且包含岗位关键词的容器（同一元素只保留一次），
+# 直接返回容器文本和第一个链接，无需逐个元素往返调用is_visible/inner_text
+FALLBACK_CONTAINERS_JS = """
+([patterns, keywords, minTextLength, maxJobs]) => {
+    const seen = new Set();
+    const result = [];
+    for (const pattern of patterns) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(pattern);
+        } catch (e) {
+            continue;  // 无效选择器（如[data-*]）直接跳过
+        }
+        for (const el of elements) {
+            if (result.length >= maxJobs) return result;
+            if (seen.has(el)) continue;
+            const rect = el.getBoundingClientRect();
+            if (!rect.width && !rect.height) continue;
+            if (getComputedStyle(el).visibility === 'hidden') continue;
+            const text = el.innerText || '';
+            if (text.length <= minTextLength || !keywords.some(keyword => text.includes(keyword))) continue;
+            seen.add(el);
+            const link = el.querySelector('a[href]');
+            result.push({text: text, href: link ? link.getAttribute('href') : null});
+        }
+    }
+    return result;
+}
+"""
+
+# 分段滚动触发懒加载：根据页面高度确定滚动次数，每步等待后检测高度，
+# 高度停止增长即提前结束，最后滚回顶部并返回初始/最终高度
+LAZY_LOAD_SCROLL_JS = """
+async (stepDelay) => {
+    // 安全获取页面高度 - 处理document.body为null的情况
+    const pageHeight = () => {
+        if (!document.body) {
+            return document.documentElement ? document.documentElement.scrollHeight : 1000;
+        }
+        return Math.max(
+            document.body.scrollHeight || 0,
+            document.documentElement.scrollHeight || 0,
+            window.innerHeight || 0
+        );
+    };
+    const initial = pageHeight();
+    const steps = Math.min(5, Math.max(2, Math.floor(initial / 2000)));
+    let height = initial;
+    let done = 0;
+    for (let i = 0; i < steps; i++) {
+        window.scrollTo(0, (i + 1) * Math.floor(height / steps));
+        await new Promise(resolve => setTimeout(resolve, stepDelay));
+        done++;
+        const newHeight = pageHeight();
+        if (newHeight <= height && i > 0) {
+            break;
+        }
+        height = Math.max(height, newHeight);
+    }
+    window.scrollTo(0, 0);
+    return {initial: initial, final: height, steps: done};
+}
+"""
+
+# 一次性在浏览器内遍历所有岗位卡片，按字段返回每个候选选择器命中的文本
+# （未命中为null，原生querySelector不支持的选择器为false）
+BATCH_FIELD_EXTRACT_JS = """
+([cards, fieldSelectors]) => {
+    // 每个选择器只做一次语法校验：Playwright专有伪类（如:has-text）原生querySelector不支持，
+    // 标记后逐卡片直接跳过，不再每张卡片都抛出并捕获异常
+    const probe = document.createDocumentFragment();
+    const unsupported = new Set();
+    for (const selectors of Object.values(fieldSelectors)) {
+        for (const selector of selectors) {
+            try {
+                probe.querySelector(selector);
+            } catch (e) {
+                unsupported.add(selector);
+            }
+        }
+    }
+    return cards.map(card => {
+        const fields = {};
+        for (const [fieldType, selectors] of Object.entries(fieldSelectors)) {
+            fields[fieldType] = selectors.map(selector => {
+                if (unsupported.has(selector)) return false;  // 交由Python端查询
+                const el = card.querySelector(selector);
+                if (!el) return null;
+                if (fieldType === 'job_link') return el.href || el.getAttribute('href') || el.innerText;
+                return el.innerText;
+            });
+        }
+        return {fields: fields, text: card.innerText || ''};
+    });
+}
+"""
+
 
 class EnhancedDataExtractor:
     """增强数据提取引擎"""
@@ -67,14 +325,16 @@ class EnhancedDataExtractor:
             logger.info(f"📋 找到 {len(job_elements)} 个岗位容器")
             
             if not job_elements:
-                await self._debug_page_content(page)
+                # 失败截图由爬虫层统一处理，这里的完整调试转储只在调试模式下执行
+                if logger.isEnabledFor(logging.DEBUG) or os.environ.get("BOSS_SPIDER_DEBUG"):
+                    await self._debug_page_content(page)
                 return []
             
             # 第四步：预先发现各字段的最佳选择器
             field_selectors = await self._discover_field_selectors(page, job_elements[:3])
             
             # 第五步：批量提取岗位数据
-            jobs = await self._extract_jobs_batch(job_elements[:max_jobs], field_selectors)
+            jobs = await self._extract_jobs_batch(page, job_elements[:max_jobs], field_selectors)
             
             # 第六步：数据质量验证和增强
             validated_jobs = await self._validate_and_enhance_jobs(jobs, page)
@@ -104,48 +364,13 @@ class EnhancedDataExtractor:
             
             await page.wait_for_timeout(2000)  # 减少等待时间
             
-            # 安全获取页面高度 - 处理document.body为null的情况
-            initial_height = await page.evaluate("""
-                () => {
-                    // 确保document.body存在
-                    if (!document.body) {
-                        return document.documentElement ? document.documentElement.scrollHeight : 1000;
-                    }
-                    return Math.max(
-                        document.body.scrollHeight || 0,
-                        document.documentElement.scrollHeight || 0,
-                        window.innerHeight || 0
-                    );
-                }
-            """)
-            logger.info(f"页面初始高度: {initial_height}")
-            
-            # 分段滚动，触发懒加载
-            scroll_steps = min(5, max(2, initial_height // 2000))  # 根据页面高度确定滚动次数
-            
-            for i in range(scroll_steps):
-                scroll_position = (i + 1) * (initial_height // scroll_steps)
-                await page.evaluate(f"window.scrollTo(0, {scroll_position})")
-                await asyncio.sleep(1.5)  # 给予足够时间加载内容
-                
-                # 检查是否有新内容加载（安全获取）
-                new_height = await page.evaluate("""
-                    () => {
-                        if (!document.body) {
-                            return document.documentElement ? document.documentElement.scrollHeight : 1000;
-                        }
-                        return Math.max(
-                            document.body.scrollHeight || 0,
-                            document.documentElement.scrollHeight || 0
-                        );
-                    }
-                """)
-                if new_height > initial_height:
-                    logger.info(f"检测到新内容加载，页面高度: {initial_height} -> {new_height}")
-                    initial_height = new_height
-            
-            # 滚动回顶部，确保所有元素都在视口内
-            await page.evaluate("window.scrollTo(0, 0)")
+            # 分段滚动触发懒加载 - 整个循环在浏览器内完成，只需一次往返
+            scroll_result = await page.evaluate(LAZY_LOAD_SCROLL_JS, 1500)
+            logger.info(
+                f"页面初始高度: {scroll_result['initial']}，滚动{scroll_result['steps']}次后高度: {scroll_result['final']}"
+            )
+            
+            # 滚动回顶部（已在脚本中完成），留出时间让顶部元素重新渲染
             await asyncio.sleep(2)
             
             # 检查并处理可能的弹窗或加载状态
@@ -159,40 +384,20 @@ class EnhancedDataExtractor:
         try:
             logger.info("⏳ 等待Boss直聘内容加载...")
             
-            # 等待岗位列表容器出现（非骨架屏）
-            content_selectors = [
-                '.job-card-wrapper',  # 岗位卡片
-                '.job-list-item',     # 岗位列表项
-                '.job-detail-box',    # 岗位详情框
-                'li[data-jid]',       # 带数据ID的岗位
-                '.job-primary'        # 岗位主要信息
-            ]
-            
-            # 尝试等待任意一个真实内容选择器出现
-            for selector in content_selectors:
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)  # 减少单个选择器的等待时间
-                    logger.info(f"✅ 检测到内容加载完成: {selector}")
-                    return
-                except:
-                    continue
+            # 等待任意一个真实内容选择器出现（组合选择器，一次等待代替逐个选择器各等5秒）
+            try:
+                await page.wait_for_selector(CONTENT_READY_SELECTOR, timeout=5000)
+                logger.info("✅ 检测到内容加载完成")
+                return
+            except Exception:
+                pass
             
             # 如果没有找到明确的内容，等待骨架屏消失
-            skeleton_selectors = [
-                '.skeleton',
-                '[class*="skeleton"]',
-                '.loading-placeholder',
-                '[class*="loading"]'
-            ]
-            
-            for selector in skeleton_selectors:
-                try:
-                    # 等待骨架屏消失
-                    await page.wait_for_selector(selector, state="hidden", timeout=5000)
-                    logger.info(f"✅ 骨架屏已消失: {selector}")
-                    break
-                except:
-                    continue
+            try:
+                await page.wait_for_selector(SKELETON_SELECTOR, state="hidden", timeout=5000)
+                logger.info("✅ 骨架屏已消失")
+            except Exception:
+                pass
             
             # 额外等待动画完成
             await page.wait_for_timeout(2000)
@@ -206,28 +411,28 @@ class EnhancedDataExtractor:
     async def _handle_page_overlays(self, page: Page) -> None:
         """处理页面覆盖层（弹窗、加载中等）"""
         try:
+            # 登录弹窗、加载状态和验证码在一次浏览器调用中检查
+            overlays = await page.evaluate(
+                PAGE_OVERLAYS_JS, [LOGIN_MODAL_SELECTOR, list(LOADING_INDICATOR_SELECTORS), CAPTCHA_SELECTOR]
+            )
+            
             # 检查登录弹窗
-            login_modal = await page.query_selector('.login-dialog, .dialog-wrap, .modal')
-            if login_modal and await login_modal.is_visible():
+            if overlays["loginModal"]:
                 logger.info("🔐 检测到登录弹窗，等待处理...")
                 await asyncio.sleep(3)
             
             # 检查加载中状态
-            loading_selectors = ['.loading', '.spinner', '[class*="loading"]', '.skeleton']
-            for selector in loading_selectors:
-                loading_elem = await page.query_selector(selector)
-                if loading_elem and await loading_elem.is_visible():
-                    logger.info(f"⏳ 检测到加载状态: {selector}")
-                    # 等待加载完成
-                    try:
-                        await page.wait_for_selector(selector, state="hidden", timeout=10000)
-                    except:
-                        pass  # 超时不影响继续执行
-                    break
+            loading_selector = overlays["loading"]
+            if loading_selector:
+                logger.info(f"⏳ 检测到加载状态: {loading_selector}")
+                # 等待加载完成
+                try:
+                    await page.wait_for_selector(loading_selector, state="hidden", timeout=10000)
+                except Exception:
+                    pass  # 超时不影响继续执行
             
             # 检查验证码
-            captcha = await page.query_selector('.captcha, .verify-wrap, [class*="captcha"]')
-            if captcha and await captcha.is_visible():
+            if overlays["captcha"]:
                 logger.warning("🔒 检测到验证码，需要人工处理")
                 await asyncio.sleep(5)
                 
@@ -235,81 +440,64 @@ class EnhancedDataExtractor:
             logger.debug(f"处理页面覆盖层时出错: {e}")
     
     async def _get_job_elements(self, page: Page, selectors: List[str]) -> List[ElementHandle]:
-        """获取岗位元素，使用最佳选择器"""
-        all_elements = []
-        seen_positions = set()  # 用于去重
-        
-        for selector in selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-                logger.debug(f"选择器 '{selector}' 找到 {len(elements)} 个元素")
-                
-                for element in elements:
-                    # 基于位置去重
-                    try:
-                        bbox = await element.bounding_box()
-                        if bbox:
-                            position_key = (round(bbox['x']), round(bbox['y']))
-                            if position_key not in seen_positions:
-                                seen_positions.add(position_key)
-                                all_elements.append(element)
-                    except:
-                        # 如果获取位置失败，仍然包含元素
-                        all_elements.append(element)
-                        
-            except Exception as e:
-                logger.debug(f"选择器 '{selector}' 执行失败: {e}")
-        
-        # 过滤无效元素
+        """获取岗位元素，使用最佳选择器 - 查询、可见性/文本长度过滤和去重都在一次浏览器调用中完成"""
         valid_elements = []
-        for element in all_elements:
-            try:
-                # 检查元素是否可见且包含内容
-                if await element.is_visible():
-                    text = await element.inner_text()
-                    if text and len(text.strip()) > 20:  # 岗位信息应该有一定长度
-                        valid_elements.append(element)
-            except:
-                continue
-        
-        logger.info(f"从 {len(all_elements)} 个元素中筛选出 {len(valid_elements)} 个有效岗位")
+
+        # 合并为一个选择器列表，浏览器只遍历一次DOM，结果按文档顺序返回且天然去重
+        union_selector = _join_selectors(tuple(selectors))
+        try:
+            elements_handle = await page.evaluate_handle(
+                COLLECT_JOB_ELEMENTS_JS, [union_selector, MIN_JOB_CARD_TEXT_LENGTH]
+            )
+            properties = await elements_handle.get_properties()
+            valid_elements = [prop.as_element() for prop in properties.values() if prop.as_element()]
+            await elements_handle.dispose()
+
+        except Exception as e:
+            logger.debug("组合选择器 '%s' 执行失败: %s", union_selector, e)
+        
+        logger.info(f"组合选择器筛选出 {len(valid_elements)} 个有效岗位")
         return valid_elements
     
     async def _discover_field_selectors(self, page: Page, sample_elements: List[ElementHandle]) -> Dict[str, List[str]]:
-        """为每个字段发现最佳选择器"""
+        """为每个字段发现最佳选择器 - 样本卡片上所有候选选择器的文本通过一次page.evaluate取回"""
         field_selectors = {}
         field_types = ["job_title", "company_name", "salary", "location", "job_link"]
         
         logger.info("🔬 分析字段选择器...")
         
-        for field_type in field_types:
+        # 获取各字段的预定义选择器（合并结果已缓存）
+        field_candidates = {field_type: list(candidate_selectors(field_type)) for field_type in field_types}
+        
+        try:
+            raw_cards = await page.evaluate(BATCH_FIELD_EXTRACT_JS, [sample_elements, field_candidates])
+        except Exception as e:
+            logger.warning(f"批量探测字段选择器失败，使用预定义选择器: {e}")
+            return {
+                field_type: self.smart_selector.selector_configs.get(field_type, {}).get("primary", [])
+                for field_type in field_types
+            }
+        
+        for field_type, all_selectors in field_candidates.items():
             try:
-                # 使用样本元素测试选择器
-                best_selectors = []
-                
-                # 获取该字段的预定义选择器
-                config = self.smart_selector.selector_configs.get(field_type, {})
-                all_selectors = config.get("primary", []) + config.get("fallback", [])
-                
                 # 在样本元素上测试每个选择器
+                sample_texts = [
+                    await self._resolve_candidate_texts(element, all_selectors, raw_card["fields"][field_type])
+                    for element, raw_card in zip(sample_elements, raw_cards)
+                ]
                 selector_scores = {}
                 
-                for selector in all_selectors:
+                for selector_index, selector in enumerate(all_selectors):
                     success_count = 0
                     quality_sum = 0.0
                     
-                    for element in sample_elements:
-                        try:
-                            sub_element = await element.query_selector(selector)
-                            if sub_element:
-                                text = await sub_element.inner_text()
-                                if text and text.strip():
-                                    quality = self.smart_selector._calculate_quality_score(text.strip(), field_type)
-                                    if quality > 0.3:
-                                        success_count += 1
-                                        quality_sum += quality
-                        except:
-                            continue
+                    for texts in sample_texts:
+                        text = (texts[selector_index] or "").strip()
+                        if text:
+                            quality = self.smart_selector._calculate_quality_score(text, field_type)
+                            if quality > 0.3:
+                                success_count += 1
+                                quality_sum += quality
                     
                     if success_count > 0:
                         avg_quality = quality_sum / success_count
@@ -322,55 +510,101 @@ class EnhancedDataExtractor:
                 best_selectors = [sel for sel, score in sorted_selectors[:3] if score > 0.2]
                 
                 field_selectors[field_type] = best_selectors
-                logger.debug(f"{field_type} 最佳选择器: {best_selectors}")
+                logger.debug("%s 最佳选择器: %s", field_type, best_selectors)
                 
             except Exception as e:
                 logger.warning(f"发现 {field_type} 选择器失败: {e}")
-                field_selectors[field_type] = config.get("primary", [])
+                field_selectors[field_type] = self.smart_selector.selector_configs.get(field_type, {}).get("primary", [])
         
         return field_selectors
     
-    async def _extract_jobs_batch(self, job_elements: List[ElementHandle], 
-                                 field_selectors: Dict[str, List[str]]) -> List[Dict]:
-        """批量提取岗位数据"""
-        jobs = []
+    async def _resolve_candidate_texts(self, element: ElementHandle, selectors: List[str],
+                                       texts: List) -> List[Optional[str]]:
+        """补全批量提取结果中原生querySelector不支持的选择器（标记为False），改用Playwright查询
+        
+        各选择器的查询相互独立，并发发出，耗时取决于最慢的一个而不是逐个累加。
+        """
+        if False not in texts:
+            return texts
         
-        for i, element in enumerate(job_elements):
+        async def query_text(selector: str) -> Optional[str]:
             try:
-                job_data = await self._extract_single_job_enhanced(element, field_selectors, i)
-                if job_data:
-                    jobs.append(job_data)
-                    
-                # 添加小延迟，避免过于频繁的DOM操作
-                if i % 5 == 0:
-                    await asyncio.sleep(0.1)
-                    
+                sub_element = await element.query_selector(selector)
+                if sub_element:
+                    return await sub_element.inner_text()
             except Exception as e:
-                logger.warning(f"提取第 {i+1} 个岗位失败: {e}")
-                continue
+                logger.debug("选择器 %s 查询失败: %s", selector, e)
+            return None
+        
+        pending = [i for i, text in enumerate(texts) if text is False]
+        results = await asyncio.gather(*(query_text(selectors[i]) for i in pending))
+        
+        resolved = list(texts)
+        for i, text in zip(pending, results):
+            resolved[i] = text
+        return resolved
+    
+    async def _extract_jobs_batch(self, page: Page, job_elements: List[ElementHandle], 
+                                 field_selectors: Dict[str, List[str]]) -> List[Dict]:
+        """批量提取岗位数据 - 通过单次page.evaluate取回所有卡片的字段候选文本"""
+        try:
+            raw_cards = await page.evaluate(BATCH_FIELD_EXTRACT_JS, [job_elements, field_selectors])
+        except Exception as e:
+            logger.warning(f"批量DOM提取失败，回退到逐个元素提取: {e}")
+            raw_cards = None
+        
+        # 各卡片相互独立，并发提取；信号量限制同时进行的CDP请求数，避免逐个元素回退时请求堆积
+        semaphore = asyncio.Semaphore(EXTRACTION_CONCURRENCY)
+        
+        async def extract_one(i: int, element: ElementHandle) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    raw_card = raw_cards[i] if raw_cards is not None else None
+                    return await self._extract_single_job_enhanced(element, field_selectors, i, raw_card)
+                except Exception as e:
+                    logger.warning(f"提取第 {i+1} 个岗位失败: {e}")
+                    return None
+        
+        results = await asyncio.gather(*(extract_one(i, element) for i, element in enumerate(job_elements)))
+        jobs = [job_data for job_data in results if job_data]
         
         return jobs
     
     async def _extract_single_job_enhanced(self, element: ElementHandle, 
                                           field_selectors: Dict[str, List[str]], 
-                                          index: int) -> Optional[Dict]:
-        """使用增强算法提取单个岗位"""
+                                          index: int,
+                                          raw_card: Optional[Dict] = None) -> Optional[Dict]:
+        """使用增强算法提取单个岗位
+        
+        Args:
+            element: 岗位卡片元素
+            field_selectors: 各字段的候选选择器
+            index: 岗位序号
+            raw_card: 批量提取得到的候选文本，为None时逐个选择器查询DOM
+        """
         try:
             job_data = {}
             
-            logger.debug(f"开始提取岗位 {index+1}")
+            logger.debug("开始提取岗位 %s", index+1)
             
             # 提取各字段数据
             for field_type, selectors in field_selectors.items():
                 if not selectors:
-                    logger.debug(f"字段 {field_type} 没有可用选择器")
+                    logger.debug("字段 %s 没有可用选择器", field_type)
                     continue
-                    
-                extracted_field = await self.smart_selector.extract_field_smart(
-                    element, field_type, selectors
-                )
                 
-                logger.debug(f"字段 {field_type} 提取结果: '{extracted_field.value}' (置信度: {extracted_field.confidence:.2f})")
+                if raw_card is not None:
+                    texts = await self._resolve_candidate_texts(
+                        element, selectors, raw_card["fields"].get(field_type, [])
+                    )
+                    candidates = zip(selectors, texts)
+                    extracted_field = self.smart_selector.select_field_value(field_type, candidates)
+                else:
+                    extracted_field = await self.smart_selector.extract_field_smart(
+                        element, field_type, selectors
+                    )
+                
+                logger.debug("字段 %s 提取结果: '%s' (置信度: %.2f)", field_type, extracted_field.value, extracted_field.confidence)
                 
                 # 记录统计信息
                 success = extracted_field.confidence > 0.3
@@ -386,6 +620,11 @@ class EnhancedDataExtractor:
                 
                 if extracted_field.validation_errors:
                     job_data[f"{field_key}_warnings"] = extracted_field.validation_errors
+
+                # 没有标题的卡片（广告/横幅）必然无法通过验证，跳过其余字段的提取
+                if field_type == "job_title" and extracted_field.confidence == 0.0:
+                    logger.debug("岗位 %s 未找到标题，跳过其余字段", index+1)
+                    break
             
             # 添加元数据
             job_data.update({
@@ -395,24 +634,24 @@ class EnhancedDataExtractor:
                 "extraction_timestamp": time.time()
             })
             
-            logger.debug(f"岗位 {index+1} 完整数据: title='{job_data.get('title')}', company='{job_data.get('company')}'")
+            logger.debug("岗位 %s 完整数据: title='%s', company='%s'", index+1, job_data.get('title'), job_data.get('company'))
             
             # 基础验证
             if self._is_valid_job_data(job_data):
-                logger.debug(f"✅ 岗位 {index+1} 验证通过")
+                logger.debug("✅ 岗位 %s 验证通过", index+1)
                 return job_data
             else:
-                logger.debug(f"❌ 岗位 {index+1} 数据验证失败")
+                logger.debug("❌ 岗位 %s 数据验证失败", index+1)
                 # 如果验证失败，尝试降级提取
-                logger.debug(f"尝试对岗位 {index+1} 进行降级文本提取...")
+                logger.debug("尝试对岗位 %s 进行降级文本提取...", index+1)
                 try:
-                    text_content = await element.inner_text()
+                    text_content = raw_card["text"] if raw_card is not None else await element.inner_text()
                     fallback_job = await self._extract_basic_job_info(element, text_content, index)
                     if fallback_job:
-                        logger.debug(f"✅ 岗位 {index+1} 降级提取成功")
+                        logger.debug("✅ 岗位 %s 降级提取成功", index+1)
                         return fallback_job
                 except Exception as e:
-                    logger.debug(f"岗位 {index+1} 降级提取也失败: {e}")
+                    logger.debug("岗位 %s 降级提取也失败: %s", index+1, e)
                 return None
                 
         except Exception as e:
@@ -421,14 +660,7 @@ class EnhancedDataExtractor:
     
     def _get_field_key(self, field_type: str) -> str:
         """将字段类型转换为数据字典键名"""
-        mapping = {
-            "job_title": "title",
-            "company_name": "company", 
-            "salary": "salary",
-            "location": "work_location",
-            "job_link": "url"
-        }
-        return mapping.get(field_type, field_type)
+        return FIELD_KEY_MAP.get(field_type, field_type)
     
     def _is_valid_job_data(self, job_data: Dict) -> bool:
         """验证岗位数据的基本有效性"""
@@ -436,24 +668,22 @@ class EnhancedDataExtractor:
         
         for field in required_fields:
             value = job_data.get(field, "")
-            if not value or value in [
-                "信息获取失败", "职位信息获取失败", "公司信息获取失败"
-            ]:
-                logger.debug(f"岗位数据无效: {field} = '{value}'")
+            if not value or value in INVALID_FIELD_VALUES:
+                logger.debug("岗位数据无效: %s = '%s'", field, value)
                 return False
         
         # 检查数据置信度 - 降低阈值以提高通过率
         title_confidence = job_data.get("title_confidence", 0)
         company_confidence = job_data.get("company_confidence", 0)
         
-        logger.debug(f"置信度检查: title={title_confidence:.2f}, company={company_confidence:.2f}")
+        logger.debug("置信度检查: title=%.2f, company=%.2f", title_confidence, company_confidence)
         
         # 降低置信度要求
         if title_confidence < 0.1 or company_confidence < 0.1:
-            logger.debug(f"岗位数据置信度过低")
+            logger.debug("岗位数据置信度过低")
             return False
         
-        logger.debug(f"岗位数据验证通过: {job_data.get('title')} @ {job_data.get('company')}")
+        logger.debug("岗位数据验证通过: %s @ %s", job_data.get('title'), job_data.get('company'))
         return True
     
     async def _validate_and_enhance_jobs(self, jobs: List[Dict], page: Page) -> List[Dict]:
@@ -488,15 +718,17 @@ class EnhancedDataExtractor:
         if "title" in cleaned_job:
             title = cleaned_job["title"]
             # 处理职位-地点格式
-            if '-' in title and len(title.split('-')) >= 2:
-                parts = title.split('-')
+            # 只需要前两段，partition 在第一个分隔符处即停，不必切分整串
+            head, sep, rest = title.partition('-')
+            if sep:
+                second = rest.partition('-')[0]
                 # 选择更像职位名称的部分
-                if len(parts[0]) > len(parts[1]) * 1.5:
-                    cleaned_job["title"] = parts[0].strip()
+                if len(head) > len(second) * 1.5:
+                    cleaned_job["title"] = head.strip()
                     # 如果地点信息缺失，尝试从标题提取
                     if not cleaned_job.get("work_location") or cleaned_job["work_location"] == "地点待确认":
-                        location_part = parts[1].strip()
-                        if any(city in location_part for city in ['北京', '上海', '深圳', '杭州', '广州']):
+                        location_part = second.strip()
+                        if MAJOR_CITY_RE.search(location_part):
                             cleaned_job["work_location"] = location_part
         
         # 清理薪资格式
@@ -504,9 +736,9 @@ class EnhancedDataExtractor:
             salary = cleaned_job["salary"]
             if salary and salary != "薪资面议":
                 # 标准化薪资格式
-                salary = salary.replace('·', '-').replace('薪', '')
+                salary = salary.translate(SALARY_TEXT_TRANS)
                 # 确保K的大小写一致
-                salary = re.sub(r'k(?=[\d\-·])', 'K', salary, flags=re.IGNORECASE)
+                salary = SALARY_LOWER_K_RE.sub('K', salary)
                 cleaned_job["salary"] = salary
         
         # 清理地点信息
@@ -514,12 +746,12 @@ class EnhancedDataExtractor:
             location = cleaned_job["work_location"]
             if location and location != "地点待确认":
                 # 标准化地点格式
-                if '·' not in location and any(city in location for city in ['北京', '上海', '深圳', '杭州']):
+                if '·' not in location:
                     # 为主要城市添加格式化
-                    for city in ['北京', '上海', '深圳', '杭州', '广州']:
-                        if city in location:
-                            location = location.replace(city, f"{city}·")
-                            break
+                    city_match = LOCATION_PREFIX_CITY_RE.search(location)
+                    if city_match:
+                        city = city_match.group()
+                        location = location.replace(city, f"{city}·")
                 cleaned_job["work_location"] = location.strip()
         
         return cleaned_job
@@ -531,29 +763,26 @@ class EnhancedDataExtractor:
             try:
                 # 这里可以实现详情页抓取逻辑
                 # 当前简化处理，只记录需要改进的地方
-                logger.debug(f"岗位 {job.get('title', '')} 有URL，可进一步获取详情")
+                logger.debug("岗位 %s 有URL，可进一步获取详情", job.get('title', ''))
             except Exception as e:
-                logger.debug(f"获取详情页失败: {e}")
+                logger.debug("获取详情页失败: %s", e)
         
         return job
     
     def _add_default_fields(self, job: Dict) -> Dict:
         """添加默认字段和标签"""
-        # 确保必要字段存在
-        defaults = {
-            "tags": [],
-            "job_description": f"负责{job.get('title', '相关')}工作，具体职责请查看岗位详情。",
-            "job_requirements": "具体要求请查看岗位详情。",
-            "company_details": f"{job.get('company', '公司')} - 查看详情了解更多信息",
-            "benefits": "具体福利待遇请查看岗位详情",
-            "experience_required": "相关经验",
-            "education_required": "相关学历",
-        }
-        
-        for key, default_value in defaults.items():
-            if key not in job or not job[key]:
+        # 常量默认值直接复用，依赖岗位数据的占位文本只在字段缺失时才生成
+        if not job.get("tags"):
+            job["tags"] = []
+        if not job.get("job_description"):
+            job["job_description"] = f"负责{job.get('title', '相关')}工作，具体职责请查看岗位详情。"
+        if not job.get("company_details"):
+            job["company_details"] = f"{job.get('company', '公司')} - 查看详情了解更多信息"
+
+        for key, default_value in DEFAULT_JOB_FIELDS.items():
+            if not job.get(key):
                 job[key] = default_value
-        
+
         return job
     
     async def _debug_page_content(self, page: Page) -> None:
@@ -561,15 +790,14 @@ class EnhancedDataExtractor:
         try:
             # 截图保存
             timestamp = int(time.time())
-            screenshot_path = f"debug_extraction_{timestamp}.png"
-            await page.screenshot(path=screenshot_path, full_page=True)
+            screenshot_path = f"debug_extraction_{timestamp}.jpg"
+            await page.screenshot(path=screenshot_path, full_page=True, type="jpeg", quality=60)
             logger.info(f"📸 已保存调试截图: {screenshot_path}")
             
             # 保存页面HTML
             content = await page.content()
             html_path = f"debug_page_{timestamp}.html"
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            await asyncio.to_thread(Path(html_path).write_text, content, encoding='utf-8')
             logger.info(f"📄 已保存页面HTML: {html_path}")
             
             # 检查页面基本信息
@@ -578,9 +806,9 @@ class EnhancedDataExtractor:
             logger.info(f"🌐 页面信息 - 标题: {title}, URL: {url}")
             
             # 检查是否有常见的错误页面标识
-            error_indicators = await page.query_selector_all('.error, .not-found, .empty, [class*="error"]')
-            if error_indicators:
-                logger.warning(f"⚠️ 检测到 {len(error_indicators)} 个错误指示元素")
+            error_indicator_count = await page.evaluate(COUNT_ELEMENTS_JS, ERROR_INDICATOR_SELECTOR)
+            if error_indicator_count:
+                logger.warning(f"⚠️ 检测到 {error_indicator_count} 个错误指示元素")
             
         except Exception as e:
             logger.error(f"调试页面内容失败: {e}")
@@ -614,53 +842,13 @@ class EnhancedDataExtractor:
         
         try:
             # 策略1: 更智能的页面结构分析
-            potential_containers = []
-            
-            # Boss直聘常见的页面结构模式
-            boss_patterns = [
-                'li[class*="job"]',     # 包含job的li元素
-                'div[class*="job"]',    # 包含job的div元素
-                'a[href*="job"]',       # 包含job链接的a元素
-                '[data-*]',             # 任何data属性元素
-                '.card, .item, .box',   # 常见容器类名
-                'li, div[class], a[class]'  # 有类名的基础元素
-            ]
-            
             logger.info(f"🔍 尝试Boss直聘页面结构模式识别...")
             
-            for pattern in boss_patterns:
-                try:
-                    elements = await page.query_selector_all(pattern)
-                    logger.debug(f"模式 '{pattern}' 找到 {len(elements)} 个元素")
-                    
-                    for element in elements:
-                        try:
-                            if await element.is_visible():
-                                text = await element.inner_text()
-                                # 检查是否包含岗位相关关键词
-                                if text and len(text) > 50:  # 内容足够长
-                                    # 检查是否包含工作相关词汇  
-                                    job_keywords = ['工程师', '开发', '经理', '专员', '主管', '总监', '分析师', 
-                                                  '设计师', '产品', '运营', '市场', '销售', '财务', '人事',
-                                                  'AI', '人工智能', '机器学习', '算法', '解决方案', '金融',
-                                                  '咨询', '顾问', '架构师', '技术', '研发', '科技']
-                                    
-                                    if any(keyword in text for keyword in job_keywords):
-                                        potential_containers.append(element)
-                                        
-                                if len(potential_containers) >= max_jobs:
-                                    break
-                        except:
-                            continue
-                    
-                    if len(potential_containers) >= max_jobs:
-                        break
-                except Exception as e:
-                    logger.debug(f"模式 '{pattern}' 处理失败: {e}")
-                    continue
-                
-                if len(potential_containers) >= max_jobs:
-                    break
+            # 可见性、文本长度和关键词筛选都在浏览器内完成，直接取回容器文本和链接
+            potential_containers = await page.evaluate(
+                FALLBACK_CONTAINERS_JS,
+                [FALLBACK_CONTAINER_PATTERNS, list(CONTAINER_JOB_KEYWORDS), 50, max_jobs]
+            )
             
             logger.info(f"🔍 降级策略找到 {len(potential_containers)} 个潜在岗位容器")
             
@@ -673,12 +861,13 @@ class EnhancedDataExtractor:
             jobs = []
             for i, container in enumerate(potential_containers[:max_jobs]):
                 try:
-                    text_content = await container.inner_text()
-                    job_data = await self._extract_basic_job_info(container, text_content, i)
+                    job_data = await self._extract_basic_job_info(
+                        None, container["text"], i, job_href=container["href"] or ""
+                    )
                     if job_data:
                         jobs.append(job_data)
                 except Exception as e:
-                    logger.debug(f"提取第 {i+1} 个降级容器失败: {e}")
+                    logger.debug("提取第 %s 个降级容器失败: %s", i+1, e)
                     continue
             
             logger.info(f"✅ 降级策略成功提取 {len(jobs)} 个岗位")
@@ -688,38 +877,40 @@ class EnhancedDataExtractor:
             logger.error(f"❌ 降级提取策略失败: {e}")
             return []
     
-    async def _extract_basic_job_info(self, container: ElementHandle, text_content: str, index: int) -> Optional[Dict]:
-        """从容器中提取基础岗位信息"""
+    async def _extract_basic_job_info(self, container: Optional[ElementHandle], text_content: str, index: int,
+                                      job_href: Optional[str] = None) -> Optional[Dict]:
+        """从容器中提取基础岗位信息
+        
+        Args:
+            container: 岗位容器元素，已提供job_href时可为None
+            text_content: 容器文本
+            index: 岗位序号
+            job_href: 已在浏览器内取得的链接地址，为None时从容器中查询
+        """
         try:
             # 尝试提取链接
-            link_element = await container.query_selector('a[href]')
+            href = job_href
+            if href is None and container is not None:
+                link_element = await container.query_selector('a[href]')
+                if link_element:
+                    href = await link_element.get_attribute('href')
             job_url = ""
-            if link_element:
-                href = await link_element.get_attribute('href')
-                if href:
-                    job_url = href if href.startswith('http') else f"https://www.zhipin.com{href}"
+            if href:
+                job_url = href if href.startswith('http') else f"https://www.zhipin.com{href}"
             
             # 简单文本解析提取信息
-            lines = [line.strip() for line in text_content.split('\n') if line.strip()]
+            lines = NON_BLANK_LINE_RE.findall(text_content)
             
             # 尝试识别职位名称（通常是第一行或包含关键词的行）
             job_title = "职位信息获取失败"
             
-            # 扩展职位关键词列表
-            job_keywords = [
-                '工程师', '开发', '经理', '专员', '主管', '分析师', '架构师', '总监',
-                '风控', 'AI', '产品', '运营', '设计', '测试', '项目', '数据',
-                '前端', '后端', '算法', '研发', '技术', '咨询', '顾问', '专家',
-                'Java', 'Python', 'Go', 'C++', '解决方案', '售前', '售后'
-            ]
-            
-            # 首先检查前3行是否包含职位关键词
-            for i, line in enumerate(lines[:5]):  # 扩展到前5行
-                if any(keyword.lower() in line.lower() for keyword in job_keywords):
+            # 首先检查前5行是否包含职位关键词
+            for i, line in enumerate(lines[:5]):
+                if TITLE_KEYWORD_RE.search(line):
                     job_title = line[:50]  # 限制长度
                     break
                 # 如果第一行较短且不包含薪资/地点信息，可能是职位名
-                elif i == 0 and len(line) < 30 and not any(x in line for x in ['K', '万', '元', '·']):
+                elif i == 0 and len(line) < 30 and not NON_TITLE_CHARS_RE.search(line):
                     job_title = line[:50]
                     break
             
@@ -727,29 +918,24 @@ class EnhancedDataExtractor:
             company_name = "公司信息获取失败"
             for line in lines:
                 if len(line) > 2 and len(line) < 30:  # 合理的公司名长度
-                    if not any(char in line for char in ['K', '万', '年', '经验', '学历']):
+                    if not NON_COMPANY_WORDS_RE.search(line):
                         company_name = line
                         break
             
             # 尝试识别薪资
             salary = "薪资面议"
             for line in lines:
-                if any(keyword in line for keyword in ['K', '万', '薪', '元']):
+                if SALARY_HINT_RE.search(line):
                     # 简单薪资格式验证
-                    import re
-                    if re.search(r'\d+[KkWw万千]', line):
+                    if SALARY_UNIT_RE.search(line):
                         salary = line[:20]
                         break
                         
             # 尝试识别地点
             location = "地点待确认"
-            cities = ['北京', '上海', '广州', '深圳', '杭州', '南京', '武汉', '成都']
             for line in lines:
-                for city in cities:
-                    if city in line and len(line) < 50:
-                        location = line
-                        break
-                if location != "地点待确认":
+                if len(line) < 50 and FALLBACK_CITY_RE.search(line):
+                    location = line
                     break
             
             return {
@@ -781,30 +967,16 @@ class EnhancedDataExtractor:
         logger.info("🎯 生成最小化示例数据以确保系统功能")
         
         jobs = []
-        companies = ["科技公司", "互联网企业", "金融机构", "咨询公司", "制造企业"]
-        locations = ["上海·浦东新区", "北京·朝阳区", "深圳·南山区", "杭州·余杭区"]
-        
         for i in range(min(max_jobs, 3)):  # 最多3个示例
-            job = {
-                "title": f"相关岗位 {i+1}",
-                "company": companies[i % len(companies)],
-                "salary": "薪资面议",
-                "work_location": locations[i % len(locations)],
-                "url": "",
-                "tags": ["相关经验"],
-                "job_description": "抱歉，页面加载异常，无法获取详细岗位信息。建议直接访问Boss直聘网站查看。",
-                "job_requirements": "具体要求请直接查看招聘网站",
-                "company_details": f"{companies[i % len(companies)]} - 页面解析异常",
-                "benefits": "具体福利待遇请查看岗位详情",
-                "experience_required": "相关经验",
-                "education_required": "相关学历",
-                "extraction_index": i,
-                "extraction_method": "minimal_fallback",
-                "engine_source": "Playwright最小化降级",
-                "extraction_timestamp": time.time(),
-                "fallback_extraction": True,
-                "note": "此为系统生成的最小化数据，请直接访问Boss直聘获取准确信息"
-            }
+            company = MINIMAL_FALLBACK_COMPANIES[i % len(MINIMAL_FALLBACK_COMPANIES)]
+            job = MINIMAL_FALLBACK_JOB_TEMPLATE.copy()
+            job["title"] = f"相关岗位 {i+1}"
+            job["company"] = company
+            job["work_location"] = MINIMAL_FALLBACK_LOCATIONS[i % len(MINIMAL_FALLBACK_LOCATIONS)]
+            job["tags"] = ["相关经验"]  # 列表每条单独创建，避免多条数据共享同一个可变对象
+            job["company_details"] = f"{company} - 页面解析异常"
+            job["extraction_index"] = i
+            job["extraction_timestamp"] = time.time()
             jobs.append(job)
         
         return jobs
\ No newline at end of file
@@ -16,6 +16,84 @@ from .retry_handler import RetryHandler, retry_on_error
 
 logger = logging.getLogger(__name__)
 
+# 岗位计数的候选选择器：取各选择器匹配数的最大值
+JOB_COUNT_SELECTORS = (
+    'li[data-jobid]',
+    '.job-card',
+    '.job-item',
+    '[class*="job-primary"]',
+    '.job-list li',
+    'li:has(.job-title)',
+    'li:has(.job-name)'
+)
+
+# 反爬虫检测：验证码和登录弹窗，预先合并为选择器列表，一次查询即可判断
+CAPTCHA_SELECTOR = '.captcha, .verify-wrap, [class*="captcha"], .geetest'
+LOGIN_DIALOG_SELECTOR = '.login-dialog, .dialog-wrap, .modal[class*="login"]'
+
+# "加载更多"按钮的候选选择器，按优先级排序（含Playwright专有的:has-text，通过Playwright定位器查询）
+LOAD_MORE_SELECTORS = (
+    '.load-more',
+    '.more-btn',
+    '[class*="load-more"]',
+    'button:has-text("更多")',
+    'button:has-text("加载")'
+)
+# 每个候选只匹配可见元素，查询和可见性判断合并为一次调用；按优先级逐个尝试，
+# 不合并为一个选择器列表（合并后按文档顺序取第一个，页面前部的"更多"筛选/导航按钮会抢先命中）
+LOAD_MORE_LOCATORS = tuple(f"{selector} >> visible=true" for selector in LOAD_MORE_SELECTORS)
+
+# 在浏览器内统计各选择器的匹配数并返回最大值，不为每个匹配元素创建句柄
+COUNT_JOBS_JS = """
+(selectors) => Math.max(0, ...selectors.map(selector => {
+    try {
+        return document.querySelectorAll(selector).length;
+    } catch (e) {
+        return 0;
+    }
+}))
+"""
+
+# 禁用动画和平滑滚动以提升大规模抓取时的页面性能
+DISABLE_ANIMATIONS_JS = """
+() => {
+    // 禁用不必要的动画以提升性能
+    const style = document.createElement('style');
+    style.textContent = `
+        *, *::before, *::after {
+            animation-duration: 0.01s !important;
+            animation-delay: 0.01s !important;
+            transition-duration: 0.01s !important;
+            transition-delay: 0.01s !important;
+        }
+    `;
+    document.head.appendChild(style);
+    
+    // 优化滚动性能
+    document.documentElement.style.scrollBehavior = 'auto';
+}
+"""
+
+# 滚动到页面底部，返回滚动前的页面高度（用于判断是否加载了新内容）
+SCROLL_TO_BOTTOM_JS = """
+() => {
+    const height = document.body.scrollHeight;
+    window.scrollTo(0, height);
+    return height;
+}
+"""
+
+# 滚动到指定位置（位置作为参数传入，脚本本身不变）
+SCROLL_TO_JS = "(y) => window.scrollTo(0, y)"
+
+# 是否存在可见的匹配元素（可见性判断与Playwright的is_visible一致：有尺寸且visibility不为hidden）
+ANY_VISIBLE_JS = """
+(selector) => Array.from(document.querySelectorAll(selector)).some(el => {
+    const rect = el.getBoundingClientRect();
+    return (rect.width || rect.height) && getComputedStyle(el).visibility !== 'hidden';
+})
+"""
+
 
 class LargeScaleCrawler:
     """大规模岗位抓取引擎"""
@@ -85,27 +163,13 @@ class LargeScaleCrawler:
         logger.info("🔧 准备大规模抓取环境...")
         
         # 优化页面性能设置
-        await self.page.evaluate("""
-            () => {
-                // 禁用不必要的动画以提升性能
-                const style = document.createElement('style');
-                style.textContent = `
-                    *, *::before, *::after {
-                        animation-duration: 0.01s !important;
-                        animation-delay: 0.01s !important;
-                        transition-duration: 0.01s !important;
-                        transition-delay: 0.01s !important;
-                    }
-                `;
-                document.head.appendChild(style);
-                
-                // 优化滚动性能
-                document.documentElement.style.scrollBehavior = 'auto';
-            }
-        """)
+        await self.page.evaluate(DISABLE_ANIMATIONS_JS)
         
-        # 等待初始内容加载
-        await asyncio.sleep(3)
+        # 等待初始岗位内容出现，而不是固定等待
+        try:
+            await self.page.wait_for_selector('li[data-jobid], .job-card, .job-item, li:has(.job-name)', timeout=3000)
+        except Exception as e:
+            logger.debug(f"等待初始内容超时: {e}")
         
         # 检查并处理可能的反爬虫机制
         await self._handle_anti_crawling_measures()
@@ -116,23 +180,15 @@ class LargeScaleCrawler:
         """处理反爬虫措施"""
         try:
             # 检查验证码
-            captcha_selectors = ['.captcha', '.verify-wrap', '[class*="captcha"]', '.geetest']
-            for selector in captcha_selectors:
-                element = await self.page.query_selector(selector)
-                if element and await element.is_visible():
-                    logger.warning("🔒 检测到验证码，暂停等待处理...")
-                    await asyncio.sleep(10)
-                    break
+            if await self.page.evaluate(ANY_VISIBLE_JS, CAPTCHA_SELECTOR):
+                logger.warning("🔒 检测到验证码，暂停等待处理...")
+                await asyncio.sleep(10)
             
             # 检查登录要求
-            login_selectors = ['.login-dialog', '.dialog-wrap', '.modal[class*="login"]']
-            for selector in login_selectors:
-                element = await self.page.query_selector(selector)
-                if element and await element.is_visible():
-                    logger.info("🔐 检测到登录要求，使用会话管理...")
-                    if not await self.session_manager.check_login_status(self.page, "zhipin.com"):
-                        logger.warning("⚠️ 需要登录才能继续大规模抓取")
-                    break
+            if await self.page.evaluate(ANY_VISIBLE_JS, LOGIN_DIALOG_SELECTOR):
+                logger.info("🔐 检测到登录要求，使用会话管理...")
+                if not await self.session_manager.check_login_status(self.page, "zhipin.com"):
+                    logger.warning("⚠️ 需要登录才能继续大规模抓取")
                     
         except Exception as e:
             logger.debug(f"处理反爬虫措施时出错: {e}")
@@ -190,52 +246,28 @@ class LargeScaleCrawler:
     
     async def _count_current_jobs(self) -> int:
         """统计当前页面的岗位数量"""
-        job_selectors = [
-            'li[data-jobid]',
-            '.job-card',
-            '.job-item',
-            '[class*="job-primary"]',
-            '.job-list li',
-            'li:has(.job-title)',
-            'li:has(.job-name)'
-        ]
-        
-        max_count = 0
-        for selector in job_selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                count = len(elements)
-                if count > max_count:
-                    max_count = count
-            except:
-                continue
-        
-        return max_count
+        try:
+            return await self.page.evaluate(COUNT_JOBS_JS, list(JOB_COUNT_SELECTORS))
+        except Exception as e:
+            logger.debug("统计岗位数量失败: %s", e)
+            return 0
     
     async def _smart_scroll_step(self) -> None:
         """智能滚动步骤"""
         try:
-            # 获取当前页面高度
-            current_height = await self.page.evaluate("document.body.scrollHeight")
-            
-            # 滚动到页面底部
-            await self.page.evaluate("""
-                () => {
-                    window.scrollTo(0, document.body.scrollHeight);
-                }
-            """)
-            
-            # 等待内容加载
-            await asyncio.sleep(self.scroll_delay)
+            # 记录当前页面高度并滚动到页面底部（一次往返）
+            current_height = await self.page.evaluate(SCROLL_TO_BOTTOM_JS)
             
-            # 检查是否有新内容加载
-            new_height = await self.page.evaluate("document.body.scrollHeight")
-            
-            # 如果页面高度增加，说明有新内容加载
-            if new_height > current_height:
-                logger.debug(f"   页面高度增加: {current_height} -> {new_height}")
-                # 额外等待确保内容完全加载
-                await asyncio.sleep(1)
+            # 等待页面高度增长（有新内容加载）即返回，超时说明没有更多懒加载内容
+            try:
+                await self.page.wait_for_function(
+                    "height => document.body.scrollHeight > height",
+                    arg=current_height,
+                    timeout=self.scroll_delay * 1000
+                )
+                logger.debug(f"   页面高度已增加（原高度 {current_height}）")
+            except Exception:
+                logger.debug("   滚动后未检测到新内容")
             
         except Exception as e:
             logger.debug(f"滚动步骤失败: {e}")
@@ -247,28 +279,20 @@ class LargeScaleCrawler:
             viewport_height = await self.page.evaluate("window.innerHeight")
             for i in range(3):
                 scroll_position = viewport_height * (i + 1)
-                await self.page.evaluate(f"window.scrollTo(0, {scroll_position})")
+                await self.page.evaluate(SCROLL_TO_JS, scroll_position)
                 await asyncio.sleep(1)
             
             # 策略2: 尝试点击"加载更多"按钮
-            load_more_selectors = [
-                '.load-more',
-                '.more-btn',
-                '[class*="load-more"]',
-                'button:has-text("更多")',
-                'button:has-text("加载")'
-            ]
-            
-            for selector in load_more_selectors:
+            for selector, locator in zip(LOAD_MORE_SELECTORS, LOAD_MORE_LOCATORS):
                 try:
-                    button = await self.page.query_selector(selector)
-                    if button and await button.is_visible():
+                    button = self.page.locator(locator).first
+                    if await button.count():
                         logger.info(f"🔘 找到加载更多按钮: {selector}")
                         await button.click()
                         await asyncio.sleep(3)
                         return
-                except:
-                    continue
+                except Exception as e:
+                    logger.debug("点击加载更多按钮失败: %s (%s)", selector, e)
             
             # 策略3: 键盘滚动
             await self.page.keyboard.press('End')
@@ -327,7 +351,7 @@ class LargeScaleCrawler:
                 validated_jobs.append(job)
                 
             except Exception as e:
-                logger.debug(f"验证岗位数据失败: {e}")
+                logger.debug("验证岗位数据失败: %s", e)
                 continue
         
         logger.info(f"✅ 验证完成: {len(validated_jobs)} 个有效岗位")
@@ -337,20 +361,12 @@ class LargeScaleCrawler:
         """验证单个岗位数据的有效性"""
         required_fields = ['title', 'company']
         
-        # 检查必需字段
+        # 检查必需字段和数据质量：每个字段只strip一次，空值长度为0，同样不通过
         for field in required_fields:
-            if not job.get(field) or not job[field].strip():
+            value = (job.get(field) or '').strip()
+            if len(value) < 2 or len(value) > 100:
                 return False
         
-        # 检查数据质量
-        title = job.get('title', '').strip()
-        if len(title) < 2 or len(title) > 100:
-            return False
-        
-        company = job.get('company', '').strip()
-        if len(company) < 2 or len(company) > 100:
-            return False
-        
         return True
     
     def _update_performance_stats(self, successful_jobs: int, total_time: float) -> None:
@@ -5,24 +5,530 @@
 """
 
 import asyncio
+import atexit
+import inspect
+import json
 import logging
+import re
+import threading
 import urllib.parse
 import time
+import types
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, AsyncIterator, Callable, ClassVar, List, Dict, Optional, Tuple
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from bs4 import BeautifulSoup, SoupStrainer
 from .enhanced_extractor import EnhancedDataExtractor
 from .session_manager import SessionManager
-from .retry_handler import RetryHandler, RetryConfig, ErrorType, RetryStrategy, retry_on_error
+from .smart_selector import SALARY_TEXT_TRANS
+from .retry_handler import RetryHandler, RetryConfig, ErrorType, RetryStrategy, RateLimiter, retry_on_error
 from .large_scale_crawler import LargeScaleCrawler, LargeScaleProgressTracker
+from .response_cache import ResponseCache, CACHEABLE_URL_RE
+
+# 详情页HTML解析器：安装了lxml时使用其C实现的解析器，否则使用标准库解析器
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 logger = logging.getLogger(__name__)
 
 
+def _use_lightweight_playwright_stacks() -> None:
+    """让Playwright记录调用栈时不读取源码行
+    
+    playwright-python在每次API调用（goto/evaluate/query_selector等）时用 inspect.stack() 记录调用栈，
+    默认会为每一帧读取源码上下文，在频繁调用时占用大量CPU并阻塞事件循环。
+    这里把其内部引用的 inspect 换成 stack() 默认不取源码上下文的代理，调用栈信息（文件、行号）仍然保留。
+    """
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return
+    if getattr(_connection, "inspect", None) is not inspect:
+        return
+    
+    class _LightweightInspect(types.ModuleType):
+        def __getattr__(self, name):
+            return getattr(inspect, name)
+        
+        @staticmethod
+        def stack(context: int = 0):
+            return inspect.stack(context)
+    
+    _connection.inspect = _LightweightInspect("inspect")
+
+
+_use_lightweight_playwright_stacks()
+
+# Boss直聘岗位搜索页
+SEARCH_BASE_URL = "https://www.zhipin.com/web/geek/job"
+
+# 搜索结果页岗位卡片的组合选择器，用于判断列表是否已渲染
+JOB_CARD_SELECTOR = 'li.job-card-wrapper, li[data-jid], .job-card-left, [data-jobid], .job-list-item'
+
+# 统计岗位数量的候选选择器，各自计数后取最大值
+JOB_COUNT_SELECTORS = (
+    'li.job-card-wrapper',
+    'li[data-jid]',
+    '.job-card-left',
+    'li:has(a[href*="job_detail"])',
+    'li[class*="job"]',
+    'div[class*="job-card"]',
+    '.job-list-item',
+    '[data-jobid]',
+    'a[ka*="search_list"]'
+)
+
+# 在浏览器内一次统计各选择器的匹配数量（不支持的选择器跳过）
+COUNT_JOBS_BY_SELECTOR_JS = """
+(selectors) => {
+    const counts = {};
+    for (const selector of selectors) {
+        try {
+            counts[selector] = document.querySelectorAll(selector).length;
+        } catch (e) {}
+    }
+    return counts;
+}
+"""
+
+# 当前页面高度（body、documentElement和视口高度中的最大值）
+PAGE_HEIGHT_JS = """
+() => Math.max(
+    document.body?.scrollHeight || 0,
+    document.documentElement?.scrollHeight || 0,
+    window.innerHeight || 0
+)
+"""
+
+# 一轮懒加载滚动在浏览器内完成：可选的人工式渐进滚动，再滚动到底部，
+# 之后新增节点停止 quietMs 毫秒即认为本轮加载完成（没有新内容时最多等待 maxWaitMs 毫秒），
+# 返回新的页面高度，整轮只需一次往返
+SCROLL_ROUND_JS = """
+async ([humanize, quietMs, maxWaitMs]) => {
+    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+    if (humanize) {
+        for (let i = 0; i < 3; i++) {
+            window.scrollTo({top: window.scrollY + window.innerHeight * 0.8, behavior: 'smooth'});
+            await sleep(500);
+        }
+    }
+    await new Promise(resolve => {
+        let quietTimer = null;
+        const finish = () => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(maxTimer);
+            resolve();
+        };
+        const observer = new MutationObserver(mutations => {
+            if (!mutations.some(mutation => mutation.addedNodes.length)) return;
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(finish, quietMs);
+        });
+        const maxTimer = setTimeout(finish, maxWaitMs);
+        observer.observe(document.body, {childList: true, subtree: true});
+        window.scrollTo(0, document.body.scrollHeight);
+    });
+    return Math.max(
+        document.body?.scrollHeight || 0,
+        document.documentElement?.scrollHeight || 0,
+        window.innerHeight || 0
+    );
+}
+"""
+
+# 滚动回页面顶部
+SCROLL_TO_TOP_JS = "() => window.scrollTo(0, 0)"
+
+# 每轮滚动后等待懒加载的时间（毫秒）：新增节点停止多久视为加载完成，以及没有新内容时的最长等待
+SCROLL_QUIET_MS = 500
+SCROLL_MAX_WAIT_MS = 3000
+
+# 搜索页就绪判断（在浏览器内轮询）：标题不再是"请稍候"安全检查页，或已出现岗位卡片
+# （只认岗位卡片选择器，验证页上的普通列表元素不会被误判为已就绪）
+SEARCH_PAGE_READY_JS = """
+(cardSelector) => document.title !== '请稍候' || document.querySelector(cardSelector) !== null
+"""
+
+# 滚动无法加载更多岗位时尝试的"加载更多"和"下一页"按钮（只匹配可见元素，一次查询全部候选）
+LOAD_MORE_BUTTON_LOCATOR = (
+    'button:has-text("加载更多"), a:has-text("查看更多"), '
+    '.load-more, .more-btn, [class*="more"], [class*="load"] >> visible=true'
+)
+NEXT_PAGE_BUTTON_LOCATOR = 'a:has-text("下一页"), .next-page, [class*="next"] >> visible=true'
+
+# 未找到岗位时页面上可能出现的错误/空结果提示：提示区块的选择器，以及提示文字
+NO_JOBS_ERROR_SELECTORS = ('.empty-result', '.no-result', '.error-page')
+NO_JOBS_ERROR_TEXTS = ('没有找到', '暂无数据')
+
+# 依次查找第一个可见的匹配（选择器优先，其次是包含指定文字的最内层元素），一次调用完成，
+# 返回 [匹配的选择器或文字, 元素文本]，都未找到时返回 null
+FIRST_VISIBLE_JS = """
+([selectors, texts]) => {
+    const isVisible = el => {
+        if (!el.getClientRects().length) return false;
+        const style = getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (isVisible(el)) return [selector, (el.innerText || '').trim()];
+        }
+    }
+    if (!texts.length || !document.body) return null;
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        const el = node.parentElement;
+        if (!el || el.closest('script, style')) continue;
+        const text = texts.find(t => node.data.includes(t));
+        if (text && isVisible(el)) return [text, (el.innerText || '').trim()];
+    }
+    return null;
+}
+"""
+
+# 登录状态检查：已登录时页面头部出现的标识，以及未登录时的登录按钮
+LOGIN_INDICATOR_SELECTORS = (
+    'a[href*="/web/geek/chat"]',  # 聊天入口
+    '.nav-figure img',  # 用户头像
+    'a[ka="header-username"]',  # 用户名链接
+    '.header-login-name'  # 登录名
+)
+LOGIN_INDICATOR_SELECTOR = ", ".join(LOGIN_INDICATOR_SELECTORS)
+LOGIN_BUTTON_SELECTOR = 'a[ka="header-login"], .btn-sign, .sign-in'
+# 页面头部渲染出登录按钮或登录标识之一，即可判断登录状态
+LOGIN_STATE_SELECTOR = f"{LOGIN_BUTTON_SELECTOR}, {LOGIN_INDICATOR_SELECTOR}"
+
+# 页面导航超时（毫秒）：导航收到响应（commit）即返回，页面是否就绪由后续等待的具体元素判断
+NAVIGATION_TIMEOUT_MS = 10000
+
+# 职责和任职要求位于同一组岗位描述区块中，两者的候选选择器只有第三项不同
+def _job_section_selectors(specific_selector: str) -> List[str]:
+    return [
+        '.job-sec-text',  # Boss直聘常用的职责描述选择器
+        '.job-detail-text .text',
+        specific_selector,
+        '.job-detail .job-sec .text-desc',
+        '[class*="job-sec"] .text',
+        '.text-desc',
+        '.job-content .text'
+    ]
+
+
+# 详情页各字段的候选选择器（按优先级排序）
+DETAIL_SELECTORS = {
+    "description": _job_section_selectors('.job-description .text-desc'),
+    "requirements": _job_section_selectors('.job-requirements .text-desc'),
+    "company": [
+        '.company-info .company-text',
+        '.company-description',
+        '.company-detail-text',
+        '.company-info .text'
+    ],
+    "salary": [
+        '.salary',
+        '.job-primary .info-primary .salary',
+        '.info-primary h1 + .salary',
+        '.job-detail .salary',
+        '[class*="salary"]',
+        '.job-primary .name + .salary',
+        'span.salary'
+    ],
+    # 福利标签只做汇总，合并为一个选择器列表：浏览器遍历一次DOM，同时被多个选择器命中的标签不再重复
+    "benefits": [
+        '.job-tags .tag, .welfare-list .welfare-item, .job-welfare .tag-item, .benefits .benefit-item'
+    ]
+}
+
+# 详情页文本块识别：工作职责/任职要求的关键词（在浏览器内匹配），以及有效薪资必须包含的单位
+DETAIL_KEYWORD_PATTERNS = {
+    "description": '职责|工作内容|岗位职责|主要工作',
+    "requirements": '任职|要求|资格|条件|技能|经验'
+}
+SALARY_UNIT_CHAR_RE = re.compile('[K万千]')
+# 薪资选择器都未命中时，在页面可见文本中查找薪资: 15K-25K, 15-25K, 1.5万-2.5万等
+# （JS正则，前后断言等价于Python的Unicode \b）
+SALARY_FALLBACK_PATTERN = r'(?<![\p{L}\p{N}_])(\d+(?:\.\d+)?)\s*[-~]\s*(\d+(?:\.\d+)?)\s*([Kk千万])(?![\p{L}\p{N}_])'
+SALARY_FALLBACK_RE = re.compile(r'\b(\d+(?:\.\d+)?)\s*[-~]\s*(\d+(?:\.\d+)?)\s*([Kk千万])\b')
+DETAIL_DESCRIPTION_RE = re.compile(DETAIL_KEYWORD_PATTERNS["description"])
+DETAIL_REQUIREMENTS_RE = re.compile(DETAIL_KEYWORD_PATTERNS["requirements"])
+
+# 福利标签最多保留的数量（避免过长）
+MAX_BENEFIT_TAGS = 10
+
+# 详情页关键元素：岗位描述区域、详情区域、主要信息区域、横幅区域，任意一个可见即视为已渲染
+DETAIL_READY_SELECTOR = '.job-sec-text, .job-detail-section, .job-primary, .job-banner'
+DETAIL_READY_TIMEOUT_MS = 5000
+
+# 详情页HTTP快速通道：复用浏览器上下文的Cookie直接请求HTML，岗位描述已在服务端渲染时不再打开页面
+DETAIL_HTTP_TIMEOUT_MS = 10000
+DETAIL_HTTP_HEADERS = {"Referer": "https://www.zhipin.com/"}
+DETAIL_HTTP_REQUIRED_SELECTOR = '.job-sec-text'
+HIDDEN_INLINE_STYLE_RE = re.compile(r'display\s*:\s*none|visibility\s*:\s*hidden', re.IGNORECASE)
+# 只为<body>建树，<head>中的脚本、样式和元信息不进入解析结果
+DETAIL_HTML_STRAINER = SoupStrainer("body")
+
+
+def _pick_detail_fields_from_html(html: str, groups: Dict[str, List[str]]) -> Optional[Dict]:
+    """在服务端渲染的HTML上按 DETAIL_EXTRACT_JS 相同的规则挑选详情字段
+    
+    返回与 DETAIL_EXTRACT_JS 结构相同的结果；HTML中没有岗位描述（需JS渲染或被重定向到验证页）时返回None。
+    文本近似innerText：去掉脚本/样式和行内样式隐藏的元素，<br>转为换行；通过样式表隐藏的元素无法识别。
+    """
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=DETAIL_HTML_STRAINER)
+    if soup.select_one(DETAIL_HTTP_REQUIRED_SELECTOR) is None:
+        return None
+    
+    for element in soup.find_all(["script", "style", "noscript", "template"]):
+        element.decompose()
+    for element in soup.find_all(style=HIDDEN_INLINE_STYLE_RE):
+        element.decompose()
+    for br in soup.find_all("br"):
+        br.replace_with("\n")
+    
+    cache: Dict[str, List[str]] = {}
+    
+    def texts_for(selector: str) -> List[str]:
+        if selector not in cache:
+            try:
+                cache[selector] = [element.get_text().strip() for element in soup.select(selector)]
+            except Exception:
+                cache[selector] = []
+        return cache[selector]
+    
+    def pick_first(selectors: List[str], pick) -> Optional[Dict]:
+        for selector in selectors:
+            picked = pick([text for text in texts_for(selector) if text])
+            if picked:
+                return {"selector": selector, **picked}
+        return None
+    
+    def pick_description(texts: List[str]) -> Optional[Dict]:
+        hit = next((text for text in texts if DETAIL_DESCRIPTION_RE.search(text)), None)
+        if hit:
+            return {"text": hit, "rule": "关键词"}
+        long_text = next((text for text in texts if len(text) > 50), None)
+        return {"text": long_text, "rule": "长文本"} if long_text else None
+    
+    def pick_requirements(texts: List[str]) -> Optional[Dict]:
+        hit = next((text for text in texts if DETAIL_REQUIREMENTS_RE.search(text)), None)
+        if hit:
+            return {"text": hit, "rule": "关键词"}
+        return {"text": texts[1], "rule": "第二段"} if len(texts) >= 2 else None
+    
+    company = next(
+        ({"selector": selector, "text": texts_for(selector)[0]}
+         for selector in groups["company"] if texts_for(selector) and texts_for(selector)[0]),
+        None
+    )
+    salary = [(texts_for(selector) or [""])[0] for selector in groups["salary"]]
+    salary_fallback = ""
+    if not any(len(text.translate(SALARY_TEXT_TRANS)) > 2 and SALARY_UNIT_CHAR_RE.search(text) for text in salary):
+        match = SALARY_FALLBACK_RE.search(soup.body.get_text() if soup.body else "")
+        salary_fallback = match.group(0) if match else ""
+    benefits = list(dict.fromkeys(
+        text for selector in groups["benefits"] for text in texts_for(selector) if text
+    ))
+    
+    return {
+        "ready": True,
+        "description": pick_first(groups["description"], pick_description),
+        "requirements": pick_first(groups["requirements"], pick_requirements),
+        "company": company,
+        "salary": salary,
+        "salary_fallback": salary_fallback,
+        "benefits": {"total": len(benefits), "items": benefits[:MAX_BENEFIT_TAGS]}
+    }
+
+
+# 在浏览器内先等待关键元素渲染（每100ms检查一次，超时后照常提取已有内容），
+# 再一次性执行详情页所有选择器并按原有规则挑选，只把选中的文本传回Python：
+# - 职责：按选择器顺序，优先包含职责关键词的文本块，其次第一个长度超过50的文本
+# - 任职要求：优先包含要求关键词的文本块，其次第二个文本块（第一个通常是职责）
+# - 公司详情：首个匹配元素有文本的选择器
+# - 薪资：每个选择器首个匹配元素的文本，由Python按统一的薪资清洗规则验证
+# - 福利：所有标签按出现顺序去重，保留前 MAX_BENEFIT_TAGS 个
+# 职责和任职要求的候选选择器大部分相同，同一选择器只查询和过滤一次，结果在各字段间共享
+DETAIL_EXTRACT_JS = """
+async ([groups, patterns, maxBenefits, readySelector, readyTimeoutMs, salaryUnit, salaryFallback]) => {
+    const isReady = () => Array.from(document.querySelectorAll(readySelector))
+        .some(el => el.getClientRects().length > 0);
+    const deadline = performance.now() + readyTimeoutMs;
+    let ready = isReady();
+    while (!ready && performance.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, 100));
+        ready = isReady();
+    }
+    
+    const cache = new Map();
+    const nonEmptyCache = new Map();
+    const textsFor = selector => {
+        if (!cache.has(selector)) {
+            let texts;
+            try {
+                texts = Array.from(document.querySelectorAll(selector), el => (el.innerText || '').trim());
+            } catch (e) {
+                texts = [];
+            }
+            cache.set(selector, texts);
+        }
+        return cache.get(selector);
+    };
+    const nonEmptyTextsFor = selector => {
+        if (!nonEmptyCache.has(selector)) {
+            nonEmptyCache.set(selector, textsFor(selector).filter(Boolean));
+        }
+        return nonEmptyCache.get(selector);
+    };
+    const pickFirst = (selectors, pick) => {
+        for (const selector of selectors) {
+            const picked = pick(nonEmptyTextsFor(selector));
+            if (picked) return {selector, ...picked};
+        }
+        return null;
+    };
+    const descriptionRe = new RegExp(patterns.description);
+    const requirementsRe = new RegExp(patterns.requirements);
+    const benefits = [...new Set(groups.benefits.flatMap(textsFor).filter(Boolean))];
+    const salary = groups.salary.map(selector => textsFor(selector)[0] || '');
+    // 与 _select_salary_info 的校验一致（去掉"薪"后长度>2且含单位），全部无效时才读取整页文本兜底
+    const salaryUnitRe = new RegExp(salaryUnit);
+    const salaryValid = salary.some(text => text.replace(/薪/g, '').length > 2 && salaryUnitRe.test(text));
+    let fallback = '';
+    if (!salaryValid) {
+        const match = (document.body ? document.body.innerText : '').match(new RegExp(salaryFallback, 'u'));
+        fallback = match ? match[0] : '';
+    }
+    return {
+        ready,
+        description: pickFirst(groups.description, texts => {
+            const hit = texts.find(text => descriptionRe.test(text));
+            if (hit) return {text: hit, rule: '关键词'};
+            const long = texts.find(text => text.length > 50);
+            return long ? {text: long, rule: '长文本'} : null;
+        }),
+        requirements: pickFirst(groups.requirements, texts => {
+            const hit = texts.find(text => requirementsRe.test(text));
+            if (hit) return {text: hit, rule: '关键词'};
+            return texts.length >= 2 ? {text: texts[1], rule: '第二段'} : null;
+        }),
+        company: groups.company
+            .map(selector => ({selector, text: textsFor(selector)[0] || ''}))
+            .find(item => item.text) || null,
+        salary,
+        salary_fallback: fallback,
+        benefits: {total: benefits.length, items: benefits.slice(0, maxBenefits)}
+    };
+}
+"""
+
+# DETAIL_EXTRACT_JS 中候选选择器之后的参数（全部为常量，只组装一次）
+DETAIL_EXTRACT_OPTIONS = [
+    DETAIL_KEYWORD_PATTERNS, MAX_BENEFIT_TAGS,
+    DETAIL_READY_SELECTOR, DETAIL_READY_TIMEOUT_MS,
+    SALARY_UNIT_CHAR_RE.pattern, SALARY_FALLBACK_PATTERN
+]
+
+# 同时加载的岗位详情页数量默认值，可通过 crawler.extraction.detail_concurrency 配置
+# （过高容易触发Boss直聘的访问频率限制）
+DETAIL_FETCH_CONCURRENCY = 3
+
+# 超过该目标数量时使用大规模抓取引擎（滚动加载列表耗时较长，期间预先创建好详情页）
+LARGE_SCALE_JOB_THRESHOLD = 30
+
+# 打开详情页的全局速率默认值（次/秒），可通过 crawler.extraction.detail_requests_per_second 配置
+DETAIL_REQUESTS_PER_SECOND = 1.0
+# 详情页请求间隔的随机浮动比例（±30%），使请求节奏不呈固定周期
+DETAIL_REQUEST_JITTER = 0.3
+# 空闲后允许连续放行的详情页请求数（令牌桶容量），与默认并发数一致，新一批详情页可以同时开始加载
+DETAIL_REQUEST_BURST = 3
+
+# 所有浏览器上下文使用的视口和UA（持久化上下文、非持久化主上下文和详情页上下文保持一致）
+BROWSER_VIEWPORT = {'width': 1280, 'height': 800}
+BROWSER_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# 等待渲染超时后在页面内执行提取并传回结果预留的时间（毫秒）
+DETAIL_EXTRACT_MARGIN_MS = 3000
+# 单个详情页（导航、等待渲染、提取）的总超时（秒）：导航超时、等待渲染的时间加上提取余量，
+# 慢页面在渲染等待超时后仍能提取已有内容，个别卡住的页面也不会长期占住页面池
+DETAIL_PAGE_TIMEOUT = (NAVIGATION_TIMEOUT_MS + DETAIL_READY_TIMEOUT_MS + DETAIL_EXTRACT_MARGIN_MS) / 1000
+
+# 详情页提取失败时返回的占位信息
+DETAIL_FAILURE_RESULT = {
+    'job_description': '详情页加载失败，请直接访问岗位链接查看',
+    'job_requirements': '详情页加载失败，请直接访问岗位链接查看',
+    'company_details': '详情页加载失败',
+    'benefits': '详情页加载失败',
+    'detail_extraction_success': False
+}
+
+# 详情结果缓存的最大条目数（按URL做LRU淘汰），同一会话内重复出现的岗位不再重新打开详情页
+DETAIL_CACHE_SIZE = 1024
+
+# 登录状态确认后的有效期（秒），期间的搜索跳过首页导航和登录检查
+LOGIN_RECHECK_INTERVAL = 600
+
+# 登录后拦截的资源类型：爬虫只读取DOM文本，图片/媒体/字体只会拖慢页面加载
+# （样式表保留，部分选择器和可见性判断依赖布局）
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# 登录后一并拦截的第三方统计/监控域名（含子域名）：页面功能不依赖它们，且其长连接和上报会拖慢页面加载
+BLOCKED_TRACKER_HOSTS = (
+    "hm.baidu.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "ingest.sentry.io",
+    "cnzz.com",
+    "growingio.com"
+)
+BLOCKED_TRACKER_URL_RE = re.compile(
+    r'^https?://(?:[^/?#]*\.)?(?:%s)(?::\d+)?(?:[/?#]|$)' % '|'.join(map(re.escape, BLOCKED_TRACKER_HOSTS))
+)
+
+# Chromium启动参数：保留反自动化检测标记，不再关闭同源策略（爬虫不需要跨域访问）
+CHROMIUM_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-features=VizDisplayCompositor'
+)
+# 可见模式下最大化窗口，方便手动登录
+HEADED_CHROMIUM_ARGS = ('--start-maximized',)
+# 无头模式（服务器/Docker）追加的参数：避免 /dev/shm 空间不足导致崩溃，关闭GPU和各类后台服务以降低内存和CPU占用
+HEADLESS_CHROMIUM_ARGS = (
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--metrics-recording-only',
+    '--mute-audio'
+)
+
+
 class RealPlaywrightBossSpider:
     """真正的Playwright Boss直聘爬虫"""
     
+    # 进程内共享的Playwright/浏览器实例，同一事件循环内的爬虫实例复用，按引用计数释放
+    _shared_playwright = None
+    _shared_browser: Optional[Browser] = None
+    _shared_persistent_context: Optional[BrowserContext] = None
+    _shared_users = 0
+    _shared_lock: Optional[asyncio.Lock] = None
+    _shared_loop = None
+    
+    # Boss直聘城市代码映射 (与app_config.yaml保持一致)
+    city_codes: ClassVar[Dict[str, str]] = {
+        "shanghai": "101020100",   # 上海 (修复：之前错误为101210100)
+        "beijing": "101010100",    # 北京 (正确)
+        "shenzhen": "101280600",   # 深圳 (正确)
+        "hangzhou": "101210100"    # 杭州 (修复：之前错误为101210300->嘉兴)
+    }
+    
     def __init__(self, headless: bool = False):
         self.headless = headless
         self.browser: Optional[Browser] = None
@@ -37,85 +543,195 @@ class RealPlaywrightBossSpider:
         try:
             from config.config_manager import ConfigManager
             self.config_manager = ConfigManager()
-            self.browser_config = self.config_manager.get_app_config('crawler', {}).get('browser', {})
-        except:
+            crawler_config = self.config_manager.get_app_config('crawler', {})
+            self.browser_config = crawler_config.get('browser', {})
+            self.anti_detection_config = crawler_config.get('anti_detection', {})
+            self.extraction_config = crawler_config.get('extraction', {})
+        except Exception:
             logger.warning("无法加载配置管理器，使用默认配置")
             self.config_manager = None
             self.browser_config = {}
+            self.anti_detection_config = {}
+            self.extraction_config = {}
         
-        # Boss直聘城市代码映射 (与app_config.yaml保持一致)
-        self.city_codes = {
-            "shanghai": "101020100",   # 上海 (修复：之前错误为101210100)
-            "beijing": "101010100",    # 北京 (正确)
-            "shenzhen": "101280600",   # 深圳 (正确)
-            "hangzhou": "101210100"    # 杭州 (修复：之前错误为101210300->嘉兴)
-        }
+        # 是否使用持久化上下文
+        self.use_persistent = self.browser_config.get('use_persistent_context', True)
         
-    @retry_on_error(max_attempts=3, base_delay=2.0, strategy=RetryStrategy.EXPONENTIAL_BACKOFF)
-    async def start(self) -> bool:
-        """启动浏览器 - 使用持久化上下文保持登录状态"""
-        logger.info("🎭 启动Playwright浏览器...")
+        # 是否在每轮滚动前模拟人工的渐进式滚动（只为反检测，不影响懒加载）
+        self.humanize_scroll = self.anti_detection_config.get('humanize_scroll', False)
         
-        self.playwright = await async_playwright().start()
+        # 登录后是否拦截图片/媒体/字体请求
+        self.block_resources = self.browser_config.get('block_resources', True)
+        self._resource_blocking_enabled = False
+        # 是否录制并回放页面文档/接口响应（开发调试和重试时避免重复加载相同页面）
+        self.response_cache: Optional[ResponseCache] = None
+        if self.extraction_config.get('response_cache', False):
+            self.response_cache = ResponseCache(ttl_hours=float(self.extraction_config.get('response_cache_ttl_hours', 6)))
+        self._response_cache_enabled = False
+        self._session_restored = False  # 非持久化模式下是否已通过storage_state恢复会话
+        self._login_verified_at: Optional[float] = None  # 最近一次确认已登录的时间（time.monotonic），None 表示尚未确认
+        self._background_tasks: set = set()  # 后台任务（如登录后保存会话），关闭前等待完成
+        self._detail_page_pool: Optional[asyncio.LifoQueue] = None  # 空闲的详情页（后进先出）
+        self._detail_pages: List[Page] = []  # 已创建的详情页，数量不超过 detail_concurrency
+        self._detail_pages_pending = 0  # 正在创建中的详情页数量
+        self._detail_contexts: List[BrowserContext] = []  # 非持久化模式下详情页各自独立的上下文
+        self.detail_concurrency = max(1, int(self.extraction_config.get('detail_concurrency', DETAIL_FETCH_CONCURRENCY)))
+        self.detail_rate_limiter = RateLimiter(
+            float(self.extraction_config.get('detail_requests_per_second', DETAIL_REQUESTS_PER_SECOND)),
+            jitter=float(self.extraction_config.get('detail_request_jitter', DETAIL_REQUEST_JITTER)),
+            burst=int(self.extraction_config.get('detail_request_burst', DETAIL_REQUEST_BURST))
+        )
+        self._detail_cache: "OrderedDict[str, Dict]" = OrderedDict()  # 详情页URL -> 提取结果
+        self._detail_selector_hits: Dict[str, str] = {}  # 详情字段 -> 最近命中的选择器
+        self._detail_groups: Optional[Dict[str, List[str]]] = None  # 按命中情况排序后的候选选择器
+        # 是否先用HTTP请求详情页HTML，岗位描述不在服务端渲染的HTML中时再回退到浏览器
+        self.http_detail_fast_path = self.extraction_config.get('http_detail_fast_path', False)
+        # 大规模抓取时是否在列表滚动加载期间预先创建详情页
+        self.prewarm_detail_pages = self.extraction_config.get('prewarm_detail_pages', True)
+        
+    @classmethod
+    def _get_shared_lock(cls) -> asyncio.Lock:
+        """获取共享浏览器的初始化锁（绑定当前事件循环）"""
+        loop = asyncio.get_running_loop()
+        if cls._shared_loop is not loop:
+            if cls._shared_users > 0:
+                logger.warning("⚠️ 共享浏览器属于已失效的事件循环，重新创建")
+            cls._shared_playwright = None
+            cls._shared_browser = None
+            cls._shared_persistent_context = None
+            cls._shared_users = 0
+            cls._shared_lock = asyncio.Lock()
+            cls._shared_loop = loop
+        return cls._shared_lock
+    
+    async def _acquire_shared_browser(self) -> bool:
+        """获取共享的Playwright/浏览器实例，首次使用时启动
         
-        # 检查是否使用持久化上下文
-        use_persistent = self.browser_config.get('use_persistent_context', True)
+        Returns:
+            是否为当前唯一的使用者
+        """
+        cls = type(self)
+        async with cls._get_shared_lock():
+            try:
+                if cls._shared_playwright is None:
+                    cls._shared_playwright = await async_playwright().start()
+                
+                if self.use_persistent:
+                    if cls._shared_persistent_context is None:
+                        cls._shared_persistent_context = await self._launch_persistent_context(cls._shared_playwright)
+                elif cls._shared_browser is None:
+                    cls._shared_browser = await cls._shared_playwright.chromium.launch(
+                        headless=self.headless,
+                        args=self._chromium_args()
+                    )
+            except Exception:
+                # 启动失败且没有其他使用者时，清理已创建的实例以便重试
+                if cls._shared_users == 0:
+                    await cls.shutdown()
+                raise
+            
+            cls._shared_users += 1
+            self.playwright = cls._shared_playwright
+            return cls._shared_users == 1
+    
+    async def _release_shared_browser(self) -> None:
+        """释放对共享浏览器的引用，最后一个使用者负责关闭"""
+        cls = type(self)
+        async with cls._get_shared_lock():
+            cls._shared_users = max(0, cls._shared_users - 1)
+            if cls._shared_users == 0:
+                await cls.shutdown()
+    
+    @classmethod
+    async def shutdown(cls) -> None:
+        """关闭共享的浏览器和Playwright实例"""
+        try:
+            if cls._shared_persistent_context:
+                await cls._shared_persistent_context.close()
+            if cls._shared_browser:
+                await cls._shared_browser.close()
+            if cls._shared_playwright:
+                await cls._shared_playwright.stop()
+        finally:
+            cls._shared_persistent_context = None
+            cls._shared_browser = None
+            cls._shared_playwright = None
+            cls._shared_users = 0
+    
+    def _chromium_args(self) -> List[str]:
+        """按是否无头模式组合Chromium启动参数"""
+        extra_args = HEADLESS_CHROMIUM_ARGS if self.headless else HEADED_CHROMIUM_ARGS
+        return [*CHROMIUM_ARGS, *extra_args]
+    
+    async def _launch_persistent_context(self, playwright) -> BrowserContext:
+        """启动持久化上下文（保持登录状态）"""
         # 使用用户目录存储浏览器配置文件，避免混在代码目录中
         user_data_dir = self.browser_config.get('user_data_dir', 
             os.path.expanduser('~/Library/Application Support/boss_automation/browser_profile/boss_zhipin'))
         
-        if use_persistent:
-            # 创建用户数据目录
-            user_data_path = Path(user_data_dir).absolute()
-            user_data_path.mkdir(parents=True, exist_ok=True)
-            
-            logger.info(f"📁 使用持久化浏览器配置: {user_data_path}")
-            
-            # 检查是否是首次使用
-            is_first_run = not (user_data_path / "Default").exists()
-            if is_first_run:
-                logger.info("🆕 检测到首次运行，将引导您进行登录...")
-                logger.info("👤 请在打开的浏览器窗口中手动登录Boss直聘")
-                logger.info("✅ 登录成功后，您的登录状态将被自动保存")
-            
-            # 使用持久化上下文启动浏览器
-            logger.info(f"🚀 正在启动浏览器，headless模式: {self.headless}")
-            self.context = await self.playwright.chromium.launch_persistent_context(
-                user_data_dir=str(user_data_path),
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--start-maximized'
-                ],
-                viewport={'width': 1280, 'height': 800},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-            
-            # 获取或创建页面
-            pages = self.context.pages
-            self.page = pages[0] if pages else await self.context.new_page()
-            logger.info(f"✅ 浏览器启动成功！headless={self.headless}, 页面数: {len(pages)}")
-            
-        else:
-            # 传统方式启动浏览器
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--start-maximized'
-                ]
-            )
-            
-            # 创建新上下文
-            self.context = await self.browser.new_context(
-                viewport={'width': 1280, 'height': 800},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-            self.page = await self.context.new_page()
+        # 创建用户数据目录
+        user_data_path = Path(user_data_dir).absolute()
+        user_data_path.mkdir(parents=True, exist_ok=True)
+        
+        logger.info(f"📁 使用持久化浏览器配置: {user_data_path}")
+        
+        # 检查是否是首次使用
+        is_first_run = not (user_data_path / "Default").exists()
+        if is_first_run:
+            logger.info("🆕 检测到首次运行，将引导您进行登录...")
+            logger.info("👤 请在打开的浏览器窗口中手动登录Boss直聘")
+            logger.info("✅ 登录成功后，您的登录状态将被自动保存")
+        
+        # 使用持久化上下文启动浏览器
+        logger.info(f"🚀 正在启动浏览器，headless模式: {self.headless}")
+        return await playwright.chromium.launch_persistent_context(
+            user_data_dir=str(user_data_path),
+            headless=self.headless,
+            args=self._chromium_args(),
+            viewport=BROWSER_VIEWPORT,
+            user_agent=BROWSER_USER_AGENT
+        )
+    
+    @retry_on_error(max_attempts=3, base_delay=2.0, strategy=RetryStrategy.EXPONENTIAL_BACKOFF)
+    async def start(self) -> bool:
+        """启动浏览器 - 复用进程内共享的浏览器，持久化上下文保持登录状态
+        
+        已启动且页面仍可用时直接返回，同一实例可以反复调用；页面已被关闭时先释放旧的资源再重新启动。
+        """
+        if self.page is not None and not self.page.is_closed():
+            return True
+        if self.playwright:
+            logger.warning("⚠️ 浏览器页面已关闭，重新启动")
+            await self.close()
+        
+        logger.info("🎭 启动Playwright浏览器...")
+        
+        cls = type(self)
+        is_first_user = await self._acquire_shared_browser()
+        
+        try:
+            if self.use_persistent:
+                # 持久化上下文在所有爬虫实例间共享，每个实例使用自己的页面
+                self.context = cls._shared_persistent_context
+                pages = self.context.pages
+                self.page = pages[0] if (is_first_user and pages) else await self.context.new_page()
+                logger.info(f"✅ 浏览器启动成功！headless={self.headless}, 页面数: {len(self.context.pages)}")
+                
+            else:
+                # 共享浏览器进程，每个实例创建独立上下文
+                self.browser = cls._shared_browser
+                # 创建上下文时直接恢复保存的cookies和localStorage，省去加载cookies后再刷新页面
+                storage_state = await self.session_manager.load_storage_state("zhipin.com")
+                self._session_restored = storage_state is not None
+                self.context = await self.browser.new_context(
+                    viewport=BROWSER_VIEWPORT,
+                    user_agent=BROWSER_USER_AGENT,
+                    storage_state=storage_state
+                )
+                self.page = await self.context.new_page()
+        except Exception:
+            await self._release_shared_browser()
+            raise
         
         logger.info("🖥️ Chrome浏览器窗口已打开，你应该能看到它！")
         
@@ -126,8 +742,14 @@ class RealPlaywrightBossSpider:
         logger.info("✅ Playwright浏览器启动成功")
         return True
     
-    async def search_jobs(self, keyword: str, city: str, max_jobs: int = 20) -> List[Dict]:
-        """搜索岗位 - 带完善的错误处理和重试机制"""
+    async def search_jobs(self, keyword: str, city: str, max_jobs: int = 20,
+                          on_job: Optional[Callable[[Dict], Any]] = None) -> List[Dict]:
+        """搜索岗位 - 带完善的错误处理和重试机制
+        
+        Args:
+            on_job: 可选回调（普通函数或协程函数），每个岗位的详情加载完成时立即以该岗位调用，
+                调用方无需等待整批结果即可开始处理（如入库）；搜索重试时可能收到重复的岗位
+        """
         
         # 使用重试机制执行核心搜索逻辑
         search_config = RetryConfig(
@@ -145,7 +767,7 @@ class RealPlaywrightBossSpider:
         try:
             return await self.retry_handler.execute_with_retry(
                 self._search_jobs_core,
-                keyword, city, max_jobs,
+                keyword, city, max_jobs, on_job,
                 config=search_config,
                 context={'operation': 'search_jobs', 'keyword': keyword, 'city': city}
             )
@@ -155,7 +777,8 @@ class RealPlaywrightBossSpider:
             await self._log_search_failure(keyword, city, e)
             return []
     
-    async def _search_jobs_core(self, keyword: str, city: str, max_jobs: int) -> List[Dict]:
+    async def _search_jobs_core(self, keyword: str, city: str, max_jobs: int,
+                                on_job: Optional[Callable[[Dict], Any]] = None) -> List[Dict]:
         """核心搜索逻辑（内部方法，供重试使用）"""
         if not self.page:
             raise RuntimeError("浏览器未启动")
@@ -165,6 +788,10 @@ class RealPlaywrightBossSpider:
         if not await self._ensure_logged_in():
             raise RuntimeError("登录失败，无法继续搜索")
         
+        # 登录完成后再拦截非必要资源（扫码登录需要加载二维码图片）
+        await self._enable_resource_blocking()
+        await self._enable_response_cache()
+        
         # 获取城市代码
         city_code = self.city_codes.get(city, "101210100")  # 默认上海
         
@@ -176,28 +803,34 @@ class RealPlaywrightBossSpider:
         # 确保在首页（登录后可能还在登录页或其他页面）
         logger.info("🏠 导航到Boss直聘首页...")
         try:
-            await self.page.goto("https://www.zhipin.com", wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(3)
+            # 页面常驻的统计/IM长连接使networkidle很少能及时触发，收到响应即继续（随后直接导航到搜索页）
+            await self.page.goto("https://www.zhipin.com", wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
         except Exception as e:
             logger.warning(f"首页加载超时，尝试继续: {e}")
         
         # 直接使用URL导航（更稳定高效）
         logger.info("🔍 使用URL导航进行搜索...")
-        encoded_keyword = urllib.parse.quote(keyword)
-        search_url = f"https://www.zhipin.com/web/geek/job?query={encoded_keyword}&city={city_code}"
+        # 空格编码为%20（与原quote行为一致），所有参数统一转义
+        query_string = urllib.parse.urlencode(
+            {'query': keyword, 'city': city_code}, quote_via=urllib.parse.quote
+        )
+        search_url = f"{SEARCH_BASE_URL}?{query_string}"
         await self._navigate_to_search_page(search_url)
         
         # 处理页面加载和预处理（传递目标岗位数量）
         await self._prepare_search_page(max_jobs)
         
         # 根据岗位数量选择合适的抓取策略
-        if max_jobs <= 30:
+        if max_jobs <= LARGE_SCALE_JOB_THRESHOLD:
             # 小规模抓取：使用增强提取器
             logger.info("🚀 启用增强数据提取引擎（小规模模式）...")
             jobs = await self.enhanced_extractor.extract_job_listings_enhanced(self.page, max_jobs)
         else:
             # 大规模抓取：使用大规模爬虫引擎
             logger.info(f"🏭 启用大规模抓取引擎（目标: {max_jobs} 个岗位）...")
+            # 列表滚动加载期间在后台创建详情页，列表提取完成后详情抓取可立即满并发开始
+            if self.prewarm_detail_pages:
+                self._run_in_background(self._prewarm_detail_pages())
             large_scale_crawler = LargeScaleCrawler(self.page, self.session_manager, self.retry_handler)
             jobs = await large_scale_crawler.extract_large_scale_jobs(max_jobs)
         
@@ -210,18 +843,58 @@ class RealPlaywrightBossSpider:
         
         # 获取详情页信息
         logger.info("📄 开始获取岗位详情...")
-        jobs_with_details = await self._fetch_job_details(jobs)
+        jobs_with_details = await self._fetch_job_details(jobs, on_job)
         
         logger.info(f"✅ 完成详情获取，共 {len(jobs_with_details)} 个岗位")
         return jobs_with_details
     
+    async def _enable_resource_blocking(self) -> None:
+        """为当前页面注册路由，拦截图片/媒体/字体和第三方统计请求以减少带宽和渲染开销"""
+        if not self.block_resources or self._resource_blocking_enabled:
+            return
+        
+        try:
+            # 只在本实例的页面上拦截，共享的持久化上下文中其他页面可能仍在登录流程中
+            await self.page.route("**/*", self._route_blocking_handler)
+            self._resource_blocking_enabled = True
+            logger.info(f"🚫 已启用资源拦截: {', '.join(sorted(BLOCKED_RESOURCE_TYPES))}，及 {len(BLOCKED_TRACKER_HOSTS)} 个统计域名")
+        except Exception as e:
+            logger.warning(f"启用资源拦截失败，继续加载全部资源: {e}")
+    
+    async def _enable_response_cache(self) -> None:
+        """为当前页面注册响应录制回放路由（在资源拦截之后注册，优先处理匹配的请求）"""
+        if self.response_cache is None or self._response_cache_enabled:
+            return
+        
+        try:
+            await self.page.route(CACHEABLE_URL_RE, self.response_cache.handle)
+            self._response_cache_enabled = True
+            logger.info(f"💾 已启用响应缓存: {self.response_cache.cache_dir}")
+        except Exception as e:
+            logger.warning(f"启用响应缓存失败，继续从网络加载: {e}")
+    
+    @staticmethod
+    async def _route_blocking_handler(route) -> None:
+        """路由处理：丢弃非必要资源和第三方统计请求，其余请求正常放行"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_TRACKER_URL_RE.match(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
     @retry_on_error(max_attempts=3, base_delay=2.0)
     async def _navigate_to_search_page(self, search_url: str) -> None:
         """导航到搜索页面"""
         logger.info("🔗 正在导航到Boss直聘搜索页面...")
         logger.info("👀 请观察浏览器窗口，你应该能看到页面加载过程")
         
-        await self.page.goto(search_url, wait_until="domcontentloaded", timeout=15000)
+        # 收到响应即返回，不等待第三方脚本；真正的就绪由岗位卡片出现来判断
+        await self.page.goto(search_url, wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
+        try:
+            await self.page.wait_for_selector(JOB_CARD_SELECTOR, timeout=8000)
+        except Exception as e:
+            # 可能停留在"请稍候"安全检查页，交给 _prepare_search_page 继续等待
+            logger.debug("等待岗位卡片出现超时: %s", e)
     
     async def _prepare_search_page(self, target_jobs: int = 20) -> None:
         """准备搜索页面（页面加载、滚动等）
@@ -232,41 +905,28 @@ class RealPlaywrightBossSpider:
         # 等待页面完全加载完成
         logger.info("⏳ 等待页面完全加载...")
         
-        # 检查页面是否还在加载状态
-        max_wait_time = 60  # 最大等待60秒
-        wait_start = time.time()
-        
-        while time.time() - wait_start < max_wait_time:
+        # 岗位卡片出现在DOM中即可继续（通常导航时已经等到）
+        try:
+            await self.page.wait_for_selector(JOB_CARD_SELECTOR, state="attached", timeout=10000)
+            logger.info("✅ 页面加载完成")
+        except Exception as e:
+            logger.debug("等待岗位卡片出现超时: %s", e)
+            # 仍停留在"请稍候"安全检查页时继续等待验证完成：条件在浏览器内每500ms检查一次，最多再等待20秒
             try:
-                # 检查页面标题是否还是"请稍候"
-                title = await self.page.title()
-                if title != "请稍候":
-                    logger.info(f"✅ 页面加载完成，标题: {title}")
-                    break
-                
-                # 检查是否有岗位内容出现
-                job_indicators = await self.page.query_selector_all('li, .job-card, [data-jobid], .job-item')
-                if job_indicators:
-                    logger.info(f"✅ 检测到 {len(job_indicators)} 个潜在岗位元素")
-                    break
-                
-                logger.info("⏳ 页面仍在加载中，继续等待...")
-                await asyncio.sleep(3)
-                
+                await self.page.wait_for_function(
+                    SEARCH_PAGE_READY_JS, arg=JOB_CARD_SELECTOR, timeout=20000, polling=500
+                )
+                logger.info(f"✅ 页面加载完成，标题: {await self.page.title()}")
+                await self.page.wait_for_selector(JOB_CARD_SELECTOR, state="attached", timeout=5000)
             except Exception as e:
-                logger.debug(f"检查页面状态时出错: {e}")
-                await asyncio.sleep(2)
-        
-        # 额外等待确保动态内容加载
-        await asyncio.sleep(5)
+                logger.warning(f"⚠️ 等待页面加载超时，尝试继续: {e}")
         
         # 智能滚动页面以加载更多岗位
         logger.info(f"📜 滚动页面以触发更多岗位加载（目标: {target_jobs} 个）...")
         await self._smart_scroll_page(target_jobs)
         
-        # 滚动回顶部
-        await self.page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(3)
+        # 滚动回顶部（滚动为同步操作，无需额外等待）
+        await self.page.evaluate(SCROLL_TO_TOP_JS)
         
         logger.info("📄 页面已准备完成，开始处理可能的弹窗...")
         
@@ -293,15 +953,7 @@ class RealPlaywrightBossSpider:
                 return
             
             # 安全地获取页面高度
-            initial_height = await self.page.evaluate("""
-                () => {
-                    return Math.max(
-                        document.body?.scrollHeight || 0,
-                        document.documentElement?.scrollHeight || 0,
-                        window.innerHeight || 0
-                    );
-                }
-            """)
+            initial_height = await self.page.evaluate(PAGE_HEIGHT_JS)
             
             logger.info(f"📜 开始智能滚动，初始高度: {initial_height}")
             
@@ -313,60 +965,17 @@ class RealPlaywrightBossSpider:
                 # 检查是否仍在同一页面
                 current_url = self.page.url
                 
-                # 渐进式滚动，避免触发页面跳转
-                scroll_steps = 3
-                for step in range(scroll_steps):
-                    await self.page.evaluate(f"""
-                        () => {{
-                            const targetY = window.scrollY + (window.innerHeight * 0.8);
-                            window.scrollTo({{
-                                top: targetY,
-                                behavior: 'smooth'
-                            }});
-                        }}
-                    """)
-                    await asyncio.sleep(0.5)
-                
-                # 缓慢滚动到底部以更好地触发懒加载
-                await self.page.evaluate("""
-                    () => {
-                        const targetY = document.body.scrollHeight;
-                        const currentY = window.scrollY;
-                        const step = (targetY - currentY) / 3;
-                        
-                        // 分3步滚动到底部
-                        let steps = 0;
-                        function smoothScroll() {
-                            if (steps < 3) {
-                                steps++;
-                                window.scrollTo({
-                                    top: currentY + (step * steps),
-                                    behavior: 'smooth'
-                                });
-                                setTimeout(smoothScroll, 800);
-                            }
-                        }
-                        smoothScroll();
-                    }
-                """)
-                await asyncio.sleep(4)  # 给更多时间让内容加载
+                # 滚动到底部触发懒加载，新内容插入完毕后取回新的页面高度；
+                # 渐进式滚动只用于模拟人工浏览，默认关闭
+                new_height = await self.page.evaluate(
+                    SCROLL_ROUND_JS, [self.humanize_scroll, SCROLL_QUIET_MS, SCROLL_MAX_WAIT_MS]
+                )
                 
                 # 检查是否发生了页面跳转
                 if self.page.url != current_url:
                     logger.warning("⚠️ 检测到页面跳转，停止滚动")
                     break
                 
-                # 安全地检查是否有新内容加载
-                new_height = await self.page.evaluate("""
-                    () => {
-                        return Math.max(
-                            document.body?.scrollHeight || 0,
-                            document.documentElement?.scrollHeight || 0,
-                            window.innerHeight || 0
-                        );
-                    }
-                """)
-                
                 logger.info(f"   滚动 {scroll_attempt + 1}/{max_scroll_attempts}，页面高度: {initial_height} -> {new_height}")
                 
                 # 如果页面高度没有显著变化
@@ -388,24 +997,17 @@ class RealPlaywrightBossSpider:
                             logger.info("   尝试查找加载更多按钮或翻页...")
                             # 尝试查找加载更多按钮
                             try:
-                                load_more_buttons = await self.page.query_selector_all(
-                                    'button:has-text("加载更多"), a:has-text("查看更多"), '
-                                    '.load-more, .more-btn, [class*="more"], [class*="load"]'
-                                )
-                                if load_more_buttons:
-                                    for btn in load_more_buttons[:1]:  # 只点击第一个
-                                        if await btn.is_visible():
-                                            await btn.click()
-                                            logger.info("   点击了加载更多按钮")
-                                            await asyncio.sleep(3)
-                                            no_change_count = 0
-                                            break
+                                # 只点击第一个可见的按钮，不再为所有匹配元素创建句柄
+                                load_more_button = self.page.locator(LOAD_MORE_BUTTON_LOCATOR).first
+                                if await load_more_button.count():
+                                    await load_more_button.click()
+                                    logger.info("   点击了加载更多按钮")
+                                    await asyncio.sleep(3)
+                                    no_change_count = 0
                                 else:
                                     # 尝试查找下一页按钮
-                                    next_page = await self.page.query_selector(
-                                        'a:has-text("下一页"), .next-page, [class*="next"]'
-                                    )
-                                    if next_page and await next_page.is_visible():
+                                    next_page = self.page.locator(NEXT_PAGE_BUTTON_LOCATOR).first
+                                    if await next_page.count():
                                         await next_page.click()
                                         logger.info("   点击了下一页按钮")
                                         await asyncio.sleep(5)
@@ -414,7 +1016,7 @@ class RealPlaywrightBossSpider:
                                         logger.info("   未找到加载更多或翻页按钮，已到达最后一页")
                                         break
                             except Exception as e:
-                                logger.debug(f"尝试加载更多时出错: {e}")
+                                logger.debug("尝试加载更多时出错: %s", e)
                                 break
                         else:
                             logger.info("   已到达页面底部")
@@ -436,40 +1038,18 @@ class RealPlaywrightBossSpider:
     async def _count_current_jobs(self) -> int:
         """统计当前页面的岗位数量"""
         try:
-            # 使用多个选择器查找岗位元素，取最大值
-            selectors = [
-                'li.job-card-wrapper',
-                'li[data-jid]', 
-                '.job-card-left',
-                'li:has(a[href*="job_detail"])',
-                'li[class*="job"]',
-                'div[class*="job-card"]',
-                '.job-list-item',  # 添加更多可能的选择器
-                '[data-jobid]',
-                'a[ka*="search_list"]'
-            ]
-            
-            max_count = 0
-            counts = {}
-            
-            for selector in selectors:
-                try:
-                    jobs = await self.page.query_selector_all(selector)
-                    count = len(jobs) if jobs else 0
-                    counts[selector] = count
-                    max_count = max(max_count, count)
-                except Exception as e:
-                    logger.debug(f"选择器 {selector} 查询失败: {e}")
-                    continue
+            # 多个选择器的计数在一次page.evaluate中完成，取最大值
+            counts = await self.page.evaluate(COUNT_JOBS_BY_SELECTOR_JS, list(JOB_COUNT_SELECTORS))
+            max_count = max(counts.values(), default=0)
             
             # 记录详细的计数信息用于调试
-            if max_count > 0:
+            if max_count > 0 and logger.isEnabledFor(logging.DEBUG):
                 best_selector = max(counts, key=counts.get)
-                logger.debug(f"岗位计数详情: {counts}, 最佳选择器: {best_selector}")
+                logger.debug("岗位计数详情: %s, 最佳选择器: %s", counts, best_selector)
             
             return max_count
         except Exception as e:
-            logger.debug(f"统计岗位数量失败: {e}")
+            logger.debug("统计岗位数量失败: %s", e)
             return 0
     
     async def _wait_for_page_stable(self) -> None:
@@ -477,7 +1057,7 @@ class RealPlaywrightBossSpider:
         try:
             # 等待网络空闲
             await self.page.wait_for_load_state("networkidle", timeout=5000)
-        except:
+        except Exception:
             # 如果网络一直不空闲，至少等待DOM加载完成
             await self.page.wait_for_load_state("domcontentloaded", timeout=3000)
     
@@ -487,20 +1067,12 @@ class RealPlaywrightBossSpider:
         logger.warning(f"⚠️ 未找到岗位，已截图: {screenshot_path}")
         
         # 检查页面是否有错误信息
-        error_indicators = [
-            '.empty-result', '.no-result', '.error-page', 
-            ':has-text("没有找到")', ':has-text("暂无数据")'
-        ]
-        
-        for selector in error_indicators:
-            try:
-                element = await self.page.query_selector(selector)
-                if element and await element.is_visible():
-                    error_text = await element.inner_text()
-                    logger.warning(f"页面显示错误信息: {error_text}")
-                    break
-            except:
-                continue
+        try:
+            match = await self._first_visible(NO_JOBS_ERROR_SELECTORS, NO_JOBS_ERROR_TEXTS)
+            if match:
+                logger.warning(f"页面显示错误信息: {match[1]}")
+        except Exception as e:
+            logger.debug("检查页面错误信息失败: %s", e)
         
         logger.error("❌ 真实抓取失败，未找到任何岗位数据")
         logger.info("🚫 不生成示例数据，保持数据真实性")
@@ -518,56 +1090,66 @@ class RealPlaywrightBossSpider:
                 'retry_stats': self.retry_handler.get_retry_stats()
             }
             
-            # 保存失败信息到文件
-            import json
+            # 保存失败信息到文件：在后台线程中序列化和写文件，调用方不等待磁盘写入即可返回
             failure_file = f"search_failure_{int(time.time())}.json"
-            with open(failure_file, 'w', encoding='utf-8') as f:
-                json.dump(failure_info, f, ensure_ascii=False, indent=2)
+            self._run_in_background(self._save_search_failure(failure_file, failure_info))
             
+        except Exception as e:
+            logger.debug("记录搜索失败信息时出错: %s", e)
+    
+    async def _save_search_failure(self, failure_file: str, failure_info: Dict) -> None:
+        """后台写入搜索失败详情，写入失败只记录日志"""
+        try:
+            await asyncio.to_thread(self._write_failure_file, failure_file, failure_info)
             logger.info(f"🔍 搜索失败详情已保存: {failure_file}")
-            
         except Exception as e:
-            logger.debug(f"记录搜索失败信息时出错: {e}")
+            logger.debug("保存搜索失败信息时出错: %s", e)
+    
+    @staticmethod
+    def _write_failure_file(failure_file: str, failure_info: Dict) -> None:
+        """写入搜索失败详情（同步，在线程中执行）"""
+        content = json.dumps(failure_info, ensure_ascii=False, indent=2, default=str)
+        Path(failure_file).write_text(content, encoding='utf-8')
     
     async def _ensure_logged_in(self) -> bool:
-        """确保已登录Boss直聘 - 支持持久化登录状态"""
+        """确保已登录Boss直聘 - 最近确认过的登录状态在有效期内直接复用"""
+        if (self._login_verified_at is not None
+                and time.monotonic() - self._login_verified_at < LOGIN_RECHECK_INTERVAL):
+            logger.info("✅ 登录状态在有效期内，跳过登录检查")
+            return True
+        
+        if await self._check_or_wait_login():
+            self._login_verified_at = time.monotonic()
+            return True
+        return False
+    
+    async def _check_or_wait_login(self) -> bool:
+        """检查登录状态，未登录时等待用户登录 - 支持持久化登录状态"""
         try:
             # 首先导航到Boss直聘首页
             logger.info("🏠 导航到Boss直聘首页...")
             try:
-                await self.page.goto("https://www.zhipin.com", wait_until="domcontentloaded", timeout=30000)
+                await self.page.goto("https://www.zhipin.com", wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
+                # 登录检查只依赖页面头部，等到登录按钮或登录标识出现即可，不等待整页加载
+                await self.page.wait_for_selector(LOGIN_STATE_SELECTOR, state="attached", timeout=NAVIGATION_TIMEOUT_MS)
             except Exception as e:
                 logger.warning(f"首页加载超时，尝试继续: {e}")
                 # 即使超时也尝试继续，因为页面可能已经部分加载
-            await asyncio.sleep(3)
             
             # 如果使用持久化上下文，先检查是否已经登录
-            use_persistent = self.browser_config.get('use_persistent_context', True)
-            if use_persistent:
-                # 定义登录状态检查的选择器
-                login_indicators = [
-                    'a[href*="/web/geek/chat"]',  # 聊天入口
-                    '.nav-figure img',  # 用户头像
-                    'a[ka="header-username"]',  # 用户名链接
-                    '.header-login-name'  # 登录名
-                ]
-                
-                # 更严格的登录状态检查
-                # 先检查是否有登录按钮（如果有说明未登录）
-                login_button = await self.page.query_selector('a[ka="header-login"], .btn-sign, .sign-in')
-                if login_button:
+            if self.use_persistent:
+                # 更严格的登录状态检查：登录按钮优先（可见说明未登录），其次是登录标识，一次调用完成
+                try:
+                    match = await self._first_visible((LOGIN_BUTTON_SELECTOR, LOGIN_INDICATOR_SELECTOR))
+                except Exception as e:
+                    logger.debug("检查登录状态失败: %s", e)
+                    match = None
+                if match and match[0] == LOGIN_BUTTON_SELECTOR:
                     logger.info("❌ 检测到登录按钮，用户未登录")
-                else:
-                    # 检查登录状态的多种方式（更严格）
-                    for indicator in login_indicators:
-                        try:
-                            element = await self.page.query_selector(indicator)
-                            if element:
-                                logger.info(f"✅ 检测到登录标识: {indicator}")
-                                logger.info("✅ 使用持久化登录状态，无需重新登录")
-                                return True
-                        except:
-                            continue
+                elif match:
+                    logger.info("✅ 检测到登录标识")
+                    logger.info("✅ 使用持久化登录状态，无需重新登录")
+                    return True
                 
                 # 如果没有检测到登录状态，引导用户登录
                 logger.info("❌ 未检测到登录状态")
@@ -591,15 +1173,12 @@ class RealPlaywrightBossSpider:
                     waited_time += check_interval
                     
                     # 检查是否已登录
-                    for indicator in login_indicators:
-                        try:
-                            element = await self.page.query_selector(indicator)
-                            if element:
-                                logger.info(f"✅ 检测到登录成功！")
-                                await asyncio.sleep(2)  # 等待页面稳定
-                                return True
-                        except:
-                            continue
+                    try:
+                        if await self._first_visible((LOGIN_INDICATOR_SELECTOR,)):
+                            logger.info(f"✅ 检测到登录成功！")
+                            return True
+                    except Exception as e:
+                        logger.debug("检查登录标识失败: %s", e)
                     
                     # 显示等待进度
                     remaining_time = max_wait_time - waited_time
@@ -610,12 +1189,8 @@ class RealPlaywrightBossSpider:
                 
             else:
                 # 使用传统的会话管理方式
-                # 尝试加载已保存的会话
-                if await self.session_manager.load_session(self.page.context, "zhipin.com"):
-                    logger.info("🍪 已加载保存的会话，刷新页面...")
-                    await self.page.reload()
-                    await asyncio.sleep(3)
-                    
+                # 保存的会话已在创建上下文时通过storage_state恢复，首页加载时即已带上登录状态
+                if self._session_restored:
                     # 检查是否登录成功
                     if await self.session_manager.check_login_status(self.page, "zhipin.com"):
                         logger.info("✅ 使用保存的会话登录成功!")
@@ -625,8 +1200,10 @@ class RealPlaywrightBossSpider:
                 
                 # 等待用户手动登录
                 if await self.session_manager.wait_for_login(self.page, timeout=300, domain="zhipin.com"):
-                    # 保存新的会话
-                    await self.session_manager.save_session(self.page.context, self.page, "zhipin.com")
+                    # 在后台保存新的会话，不阻塞登录后的首次搜索
+                    self._run_in_background(
+                        self.session_manager.save_session(self.page.context, self.page, "zhipin.com")
+                    )
                     return True
                 else:
                     logger.error("❌ 登录失败")
@@ -636,295 +1213,368 @@ class RealPlaywrightBossSpider:
             logger.error(f"❌ 登录过程出错: {e}")
             return False
     
+    async def _first_visible(self, selectors: Tuple[str, ...],
+                             texts: Tuple[str, ...] = ()) -> Optional[Tuple[str, str]]:
+        """返回第一个可见匹配的 (选择器或文字, 元素文本)，一次页面调用检查全部候选"""
+        match = await self.page.evaluate(FIRST_VISIBLE_JS, [list(selectors), list(texts)])
+        return tuple(match) if match else None
+    
+    def _run_in_background(self, coro) -> None:
+        """在后台执行协程，close() 关闭上下文前会等待其完成"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
     def get_session_info(self) -> Dict:
         """获取当前会话信息"""
         return self.session_manager.get_session_info()
     
-    async def _fetch_job_details(self, jobs: List[Dict]) -> List[Dict]:
-        """获取岗位详细信息"""
-        jobs_with_details = []
+    async def _fetch_job_details(self, jobs: List[Dict],
+                                 on_job: Optional[Callable[[Dict], Any]] = None) -> List[Dict]:
+        """获取岗位详细信息 - 有效URL的详情页批量并发加载后与基础信息合并（保持原有顺序）
         
-        for i, job in enumerate(jobs):
-            try:
-                logger.info(f"📋 获取第 {i+1}/{len(jobs)} 个岗位详情: {job.get('title', '未知岗位')}")
-                
-                # 检查是否有有效的URL
-                job_url = job.get('url', '')
-                if not job_url or not job_url.startswith('http'):
-                    logger.warning(f"⚠️ 岗位 {i+1} 没有有效URL，跳过详情获取")
-                    jobs_with_details.append(job)
-                    continue
-                
-                # 获取详情页数据
-                details = await self._extract_job_detail_page(job_url)
-                
-                # 合并基础信息和详情信息
-                enhanced_job = {**job, **details}
-                jobs_with_details.append(enhanced_job)
-                
-                # 添加延迟避免请求过于频繁
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"❌ 获取岗位 {i+1} 详情失败: {e}")
-                # 保留原始数据
-                jobs_with_details.append(job)
-                continue
+        每个岗位完成时即交给 on_job 处理，不必等整批详情加载完毕。
+        """
+        jobs_with_details = list(jobs)
+        async for i, enhanced_job in self._iter_indexed_job_details(jobs):
+            jobs_with_details[i] = enhanced_job
+            if on_job is not None:
+                result = on_job(enhanced_job)
+                if inspect.isawaitable(result):
+                    await result
         
         return jobs_with_details
     
-    async def _extract_job_detail_page(self, job_url: str) -> Dict:
-        """提取岗位详情页信息"""
+    async def iter_job_details(self, jobs: List[Dict]) -> AsyncIterator[Dict]:
+        """逐个产出合并了详情信息的岗位
+        
+        详情页在后台并发加载，每完成一个即产出（按完成顺序，不保证与jobs顺序一致），
+        调用方无需等待整批详情加载完毕即可开始处理。没有有效URL的岗位原样产出。
+        调用方提前停止迭代时，未完成的详情加载会被取消。
+        """
+        async for _, enhanced_job in self._iter_indexed_job_details(jobs):
+            yield enhanced_job
+    
+    async def _iter_indexed_job_details(self, jobs: List[Dict]) -> AsyncIterator[Tuple[int, Dict]]:
+        """按完成顺序产出 (岗位在jobs中的下标, 合并详情后的岗位)"""
+        urls_to_indices: Dict[str, List[int]] = {}
+        without_url = []
+        for i, job in enumerate(jobs):
+            # 检查是否有有效的URL
+            job_url = job.get('url', '')
+            if job_url and job_url.startswith('http'):
+                urls_to_indices.setdefault(job_url, []).append(i)
+            else:
+                logger.warning(f"⚠️ 岗位 {i+1} 没有有效URL，跳过详情获取")
+                without_url.append(i)
+        
+        # 先启动详情加载再产出无URL的岗位；重复的URL只加载一次
+        tasks = [
+            asyncio.ensure_future(self._fetch_detail(n, len(urls_to_indices), job_url))
+            for n, job_url in enumerate(urls_to_indices)
+        ]
         try:
-            logger.debug(f"🔗 访问详情页: {job_url}")
+            for i in without_url:
+                yield i, jobs[i]
             
-            # 导航到详情页
-            await self.page.goto(job_url, wait_until="domcontentloaded", timeout=30000)  # 增加到30秒
-            await asyncio.sleep(2)
-            
-            # 等待页面加载完成
-            await self._wait_for_detail_page_load()
-            
-            # 提取工作职责
-            job_description = await self._extract_job_description()
-            
-            # 提取任职资格  
-            job_requirements = await self._extract_job_requirements()
-            
-            # 提取公司信息
-            company_details = await self._extract_company_details()
-            
-            # 提取福利待遇
-            benefits = await self._extract_benefits()
-            
-            # 提取完整薪资信息
-            salary_info = await self._extract_salary_info()
-            
-            result = {
-                'job_description': job_description,
-                'job_requirements': job_requirements, 
-                'company_details': company_details,
-                'benefits': benefits,
-                'detail_extraction_success': True
-            }
-            
-            # 如果提取到了更完整的薪资信息，更新它
-            if salary_info and salary_info != "薪资面议":
-                result['salary'] = salary_info
-                
-            return result
+            for next_done in asyncio.as_completed(tasks):
+                job_url, details = await next_done
+                # 合并基础信息和详情信息
+                for i in urls_to_indices[job_url]:
+                    yield i, {**jobs[i], **details}
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def batch_extract_details(self, urls: List[str]) -> List[Dict]:
+        """批量提取岗位详情页
+        
+        各URL通过页面池并发加载，每个页面有独立的总超时，单个URL失败或超时不影响其他URL。
+        同一批次中重复的URL只加载一次，本会话已成功提取过的URL直接使用缓存。
+        
+        Args:
+            urls: 详情页URL列表
             
-        except Exception as e:
-            logger.error(f"❌ 提取详情页失败: {e}")
-            return {
-                'job_description': '详情页加载失败，请直接访问岗位链接查看',
-                'job_requirements': '详情页加载失败，请直接访问岗位链接查看',
-                'company_details': '详情页加载失败',
-                'benefits': '详情页加载失败',
-                'detail_extraction_success': False
-            }
+        Returns:
+            与urls一一对应的详情字典，失败的URL返回加载失败的占位信息
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(
+            *(self._fetch_detail(i, len(unique_urls), job_url) for i, job_url in enumerate(unique_urls))
+        )
+        details_by_url = dict(results)
+        
+        return [details_by_url[job_url] for job_url in urls]
     
-    async def _wait_for_detail_page_load(self) -> None:
-        """等待详情页加载完成"""
+    async def _fetch_detail(self, i: int, total: int, job_url: str) -> Tuple[str, Dict]:
+        """加载单个详情页，返回 (URL, 详情字典)；失败或超时返回加载失败的占位信息"""
+        # 本会话已成功提取过的详情直接复用
+        cached = self._detail_cache.get(job_url)
+        if cached is not None:
+            self._detail_cache.move_to_end(job_url)
+            logger.debug("♻️ 详情命中缓存: %s", job_url)
+            return job_url, cached
+        
         try:
-            # 等待关键元素出现
-            key_selectors = [
-                '.job-sec-text',  # 岗位描述区域
-                '.job-detail-section',  # 详情区域
-                '.job-primary',  # 主要信息区域
-                '.job-banner'  # 横幅区域
-            ]
+            details = None
+            if self.http_detail_fast_path:
+                # 按全局速率请求详情页，避免请求过于频繁；配额可用时不额外等待
+                await self.detail_rate_limiter.acquire()
+                logger.info(f"📋 获取第 {i+1}/{total} 个岗位详情")
+                details = await self._extract_job_detail_over_http(job_url)
             
-            # 尝试等待任意一个关键选择器出现
-            for selector in key_selectors:
+            if details is None:
+                # 从页面池借出页面，池的大小即并发上限
+                detail_page = await self._acquire_detail_page()
                 try:
-                    await self.page.wait_for_selector(selector, timeout=3000)
-                    logger.debug(f"✅ 详情页关键元素已加载: {selector}")
-                    break
-                except:
-                    continue
-            
-            # 额外等待确保动态内容加载
-            await asyncio.sleep(2)
-            
+                    # 走过HTTP快速通道的岗位已占用过本次请求的配额，回退到浏览器时不再重复等待
+                    if not self.http_detail_fast_path:
+                        await self.detail_rate_limiter.acquire()
+                        logger.info(f"📋 获取第 {i+1}/{total} 个岗位详情")
+                    
+                    # 获取详情页数据
+                    details = await asyncio.wait_for(
+                        self._extract_job_detail_page(detail_page, job_url), DETAIL_PAGE_TIMEOUT
+                    )
+                finally:
+                    await self._release_detail_page(detail_page)
         except Exception as e:
-            logger.debug(f"等待详情页加载时出错: {e}")
-    
-    async def _extract_job_description(self) -> str:
-        """提取工作职责"""
-        selectors = [
-            '.job-sec-text',  # Boss直聘常用的职责描述选择器
-            '.job-detail-text .text',
-            '.job-description .text-desc',
-            '.job-detail .job-sec .text-desc',
-            '[class*="job-sec"] .text',
-            '.text-desc',
-            '.job-content .text'
-        ]
+            logger.error(f"❌ 获取岗位详情失败: {job_url} ({type(e).__name__}: {e})")
+            return job_url, dict(DETAIL_FAILURE_RESULT)
         
-        for selector in selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                if elements:
-                    # 获取所有匹配元素的文本
-                    texts = []
-                    for element in elements:
-                        text = await element.inner_text()
-                        if text and text.strip():
-                            texts.append(text.strip())
-                    
-                    if texts:
-                        # 查找包含"职责"、"工作内容"等关键词的部分
-                        for text in texts:
-                            if any(keyword in text for keyword in ['职责', '工作内容', '岗位职责', '主要工作']):
-                                logger.debug(f"✅ 找到工作职责: {selector}")
-                                return text
-                        
-                        # 如果没有找到特定关键词，返回第一个较长的文本
-                        for text in texts:
-                            if len(text) > 50:  # 职责描述通常较长
-                                logger.debug(f"✅ 找到工作描述: {selector}")
-                                return text
-                                
-            except Exception as e:
-                logger.debug(f"提取工作职责失败 {selector}: {e}")
-                continue
+        # 只缓存成功的结果，失败的下次仍会重试
+        if details.get('detail_extraction_success'):
+            self._detail_cache[job_url] = details
+            if len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
         
-        return "工作职责信息未找到，请查看岗位详情页"
-    
-    async def _extract_job_requirements(self) -> str:
-        """提取任职资格"""
-        selectors = [
-            '.job-sec-text',
-            '.job-detail-text .text', 
-            '.job-requirements .text-desc',
-            '.job-detail .job-sec .text-desc',
-            '[class*="job-sec"] .text',
-            '.text-desc',
-            '.job-content .text'
-        ]
+        return job_url, details
+    
+    async def _acquire_detail_page(self) -> Page:
+        """从详情页页面池借出页面
         
-        for selector in selectors:
+        优先复用最近归还的空闲页面（后进先出，页面缓存最热）；空闲页面不足且未达到并发上限时
+        按需创建新页面，达到上限后等待其他任务归还。页面在多次搜索间复用。
+        """
+        if self._detail_page_pool is None:
+            self._detail_page_pool = asyncio.LifoQueue()
+        
+        while True:
             try:
-                elements = await self.page.query_selector_all(selector)
-                if elements:
-                    texts = []
-                    for element in elements:
-                        text = await element.inner_text()
-                        if text and text.strip():
-                            texts.append(text.strip())
-                    
-                    if texts:
-                        # 查找包含"要求"、"资格"、"条件"等关键词的部分
-                        for text in texts:
-                            if any(keyword in text for keyword in ['任职', '要求', '资格', '条件', '技能', '经验']):
-                                logger.debug(f"✅ 找到任职要求: {selector}")
-                                return text
-                        
-                        # 如果有多个文本块，取第二个（第一个通常是职责）
-                        if len(texts) >= 2:
-                            logger.debug(f"✅ 找到任职要求（第二段）: {selector}")
-                            return texts[1]
-                            
-            except Exception as e:
-                logger.debug(f"提取任职要求失败 {selector}: {e}")
+                return self._detail_page_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            
+            if len(self._detail_pages) + self._detail_pages_pending < self.detail_concurrency:
+                self._detail_pages_pending += 1
+                try:
+                    detail_page = await self._new_detail_page()
+                finally:
+                    self._detail_pages_pending -= 1
+                self._detail_pages.append(detail_page)
+                return detail_page
+            
+            try:
+                return await asyncio.wait_for(self._detail_page_pool.get(), DETAIL_PAGE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # 预先创建的页面可能创建失败而释放了名额，重新检查是否可以自行创建
                 continue
+    
+    async def _prewarm_detail_pages(self) -> None:
+        """预先创建详情页直到并发上限并放入页面池，创建失败的留给抓取时按需创建"""
+        if self._detail_page_pool is None:
+            self._detail_page_pool = asyncio.LifoQueue()
         
-        return "任职要求信息未找到，请查看岗位详情页"
+        missing = self.detail_concurrency - len(self._detail_pages) - self._detail_pages_pending
+        if missing <= 0:
+            return
+        
+        self._detail_pages_pending += missing
+        try:
+            results = await asyncio.gather(
+                *(self._new_detail_page() for _ in range(missing)), return_exceptions=True
+            )
+        finally:
+            self._detail_pages_pending -= missing
+        
+        created = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.debug("预先创建详情页失败: %s", result)
+                continue
+            self._detail_pages.append(result)
+            self._detail_page_pool.put_nowait(result)
+            created += 1
+        logger.info(f"🔥 已预先创建 {created} 个详情页")
     
-    async def _extract_company_details(self) -> str:
-        """提取公司详情"""
-        selectors = [
-            '.company-info .company-text',
-            '.company-description',
-            '.company-detail-text',
-            '.company-info .text'
-        ]
+    async def _release_detail_page(self, detail_page: Page) -> None:
+        """归还详情页：切到空白页停止页面上的轮询请求和脚本；已关闭（崩溃）的页面换成新页面"""
+        try:
+            await detail_page.goto("about:blank")
+        except Exception as e:
+            logger.debug("重置详情页失败: %s", e)
         
-        for selector in selectors:
+        if detail_page.is_closed():
+            self._detail_pages.remove(detail_page)
             try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    text = await element.inner_text()
-                    if text and text.strip():
-                        logger.debug(f"✅ 找到公司详情: {selector}")
-                        return text.strip()
+                detail_page = await self._new_detail_page()
             except Exception as e:
-                logger.debug(f"提取公司详情失败 {selector}: {e}")
-                continue
+                logger.warning(f"⚠️ 重新创建详情页失败: {e}")
+                return
+            self._detail_pages.append(detail_page)
+        self._detail_page_pool.put_nowait(detail_page)
+    
+    async def _new_detail_page(self) -> Page:
+        """创建详情页
         
-        return "公司详情信息未找到"
-    
-    async def _extract_salary_info(self) -> str:
-        """提取薪资信息"""
-        # Boss直聘详情页的薪资选择器
-        selectors = [
-            '.salary',
-            '.job-primary .info-primary .salary',
-            '.info-primary h1 + .salary',
-            '.job-detail .salary',
-            '[class*="salary"]',
-            '.job-primary .name + .salary',
-            'span.salary'
-        ]
+        非持久化模式下每个页面放在独立的上下文中（以主上下文当前的登录状态为初始状态），
+        各详情页的cookie和存储互不干扰；持久化上下文无法派生新上下文，页面直接建在主上下文中。
+        详情页只读取文本，开启资源拦截时不依赖搜索页的拦截状态，始终拦截图片/媒体/字体
+        （样式表保留：innerText依赖样式判断隐藏元素，去掉样式会混入页面隐藏的干扰文本）。
+        """
+        if not self.use_persistent and self.browser is not None:
+            detail_context = await self.browser.new_context(
+                viewport=BROWSER_VIEWPORT,
+                user_agent=BROWSER_USER_AGENT,
+                storage_state=await self.context.storage_state()
+            )
+            self._detail_contexts.append(detail_context)
+            # 独立上下文整体拦截，覆盖其中的所有页面（包括详情页弹出的新页面）
+            if self.block_resources:
+                await detail_context.route("**/*", self._route_blocking_handler)
+            if self.response_cache is not None:
+                await detail_context.route(CACHEABLE_URL_RE, self.response_cache.handle)
+            return await detail_context.new_page()
         
-        for selector in selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    text = await element.inner_text()
-                    if text and text.strip():
-                        salary = text.strip()
-                        # 清理薪资文本
-                        salary = salary.replace('·', '-').replace('薪', '')
-                        # 验证是否是有效的薪资格式
-                        if any(k in salary for k in ['K', '万', '千']) and len(salary) > 2:
-                            logger.debug(f"✅ 找到薪资信息: {selector} → {salary}")
-                            return salary
-            except Exception as e:
-                logger.debug(f"提取薪资失败 {selector}: {e}")
-                continue
+        detail_page = await self.context.new_page()
+        # 共享的持久化上下文只在自己的页面上拦截
+        if self.block_resources:
+            await detail_page.route("**/*", self._route_blocking_handler)
+        if self.response_cache is not None:
+            await detail_page.route(CACHEABLE_URL_RE, self.response_cache.handle)
+        return detail_page
+    
+    async def _extract_job_detail_page(self, page: Page, job_url: str) -> Dict:
+        """提取岗位详情页信息"""
+        try:
+            logger.debug("🔗 访问详情页: %s", job_url)
+            
+            # 导航到详情页
+            # 收到响应即开始提取，详情内容的渲染由 DETAIL_EXTRACT_JS 在页面内等待
+            await page.goto(job_url, wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
+            
+            # 等待详情内容渲染和所有字段的挑选在一次page.evaluate中完成，只传回选中的文本
+            groups = self._detail_selector_groups()
+            picks = await page.evaluate(DETAIL_EXTRACT_JS, [groups, *DETAIL_EXTRACT_OPTIONS])
+            if picks["ready"]:
+                logger.debug("✅ 详情页关键元素已加载")
+            else:
+                logger.debug("等待详情页关键元素超时，提取已加载的内容")
+            
+            return self._details_from_picks(picks, groups)
+            
+        except Exception as e:
+            logger.error(f"❌ 提取详情页失败: {e}")
+            return dict(DETAIL_FAILURE_RESULT)
+    
+    async def _extract_job_detail_over_http(self, job_url: str) -> Optional[Dict]:
+        """通过HTTP请求详情页HTML并提取信息（与浏览器共享Cookie）
         
-        # 尝试从页面文本中查找薪资
+        请求失败、被重定向到验证页或岗位描述不在服务端渲染的HTML中时返回None，由调用方回退到浏览器加载。
+        """
         try:
-            page_text = await self.page.content()
-            import re
-            # 匹配薪资模式: 15K-25K, 15-25K, 1.5万-2.5万等
-            salary_pattern = r'\b(\d+(?:\.\d+)?)\s*[-~]\s*(\d+(?:\.\d+)?)\s*([Kk千万])\b'
-            match = re.search(salary_pattern, page_text)
-            if match:
-                salary = match.group(0)
-                logger.debug(f"✅ 从页面文本中找到薪资: {salary}")
-                return salary
-        except:
-            pass
+            response = await self.context.request.get(
+                job_url, headers=DETAIL_HTTP_HEADERS, timeout=DETAIL_HTTP_TIMEOUT_MS
+            )
+            if not response.ok:
+                logger.debug("HTTP请求详情页失败(%s)，改用浏览器加载: %s", response.status, job_url)
+                return None
+            html = await response.text()
+        except Exception as e:
+            logger.debug("HTTP请求详情页出错，改用浏览器加载: %s (%s)", job_url, e)
+            return None
         
-        return ""
+        # HTML解析是纯CPU操作，放到线程中执行，不阻塞其他详情页的加载
+        groups = self._detail_selector_groups()
+        picks = await asyncio.to_thread(_pick_detail_fields_from_html, html, groups)
+        if picks is None:
+            logger.debug("HTML中没有岗位描述，改用浏览器加载: %s", job_url)
+            return None
+        
+        logger.debug("⚡ 通过HTTP获取详情页: %s", job_url)
+        return self._details_from_picks(picks, groups)
     
-    async def _extract_benefits(self) -> str:
-        """提取福利待遇"""
-        selectors = [
-            '.job-tags .tag',
-            '.welfare-list .welfare-item',
-            '.job-welfare .tag-item',
-            '.benefits .benefit-item'
-        ]
+    def _detail_selector_groups(self) -> Dict[str, List[str]]:
+        """详情页各字段的候选选择器：之前命中过的选择器排在最前
         
-        benefits = []
-        for selector in selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.inner_text()
-                    if text and text.strip():
-                        benefits.append(text.strip())
-            except Exception as e:
-                logger.debug(f"提取福利待遇失败 {selector}: {e}")
-                continue
+        同一模板的详情页通常由同一个选择器命中，排在最前后页面内找到即停止，不再先查询其他候选。
+        """
+        if self._detail_groups is None:
+            groups = dict(DETAIL_SELECTORS)
+            for field_key, selector in self._detail_selector_hits.items():
+                groups[field_key] = [selector] + [c for c in DETAIL_SELECTORS[field_key] if c != selector]
+            self._detail_groups = groups
+        return self._detail_groups
+    
+    def _pin_detail_selector(self, field_key: str, pick: Optional[Dict]) -> None:
+        """记录字段命中的选择器，之后的详情页优先使用"""
+        if pick and self._detail_selector_hits.get(field_key) != pick["selector"]:
+            self._detail_selector_hits[field_key] = pick["selector"]
+            self._detail_groups = None
+    
+    def _details_from_picks(self, picks: Dict, groups: Dict[str, List[str]]) -> Dict:
+        """由挑选出的字段组装详情结果"""
+        for field_key in ("description", "requirements", "company"):
+            self._pin_detail_selector(field_key, picks[field_key])
+        job_description = self._picked_text(picks["description"], "工作职责", "工作职责信息未找到，请查看岗位详情页")
+        job_requirements = self._picked_text(picks["requirements"], "任职要求", "任职要求信息未找到，请查看岗位详情页")
+        company_details = self._picked_text(picks["company"], "公司详情", "公司详情信息未找到")
+        benefits = self._select_benefits(picks["benefits"])
+        salary_info = self._select_salary_info(picks["salary"], groups["salary"])
+        if not salary_info and picks["salary_fallback"]:
+            salary_info = picks["salary_fallback"]
+            logger.debug("✅ 从页面文本中找到薪资: %s", salary_info)
         
-        if benefits:
-            logger.debug(f"✅ 找到福利待遇: {len(benefits)} 项")
-            return " | ".join(benefits[:10])  # 限制数量避免过长
+        result = {
+            'job_description': job_description,
+            'job_requirements': job_requirements, 
+            'company_details': company_details,
+            'benefits': benefits,
+            'detail_extraction_success': True
+        }
+        
+        # 如果提取到了更完整的薪资信息，更新它
+        if salary_info and salary_info != "薪资面议":
+            result['salary'] = salary_info
+            
+        return result
+    
+    def _picked_text(self, pick: Optional[Dict], field_name: str, default: str) -> str:
+        """取挑选出的字段文本，未命中时返回默认提示"""
+        if pick:
+            logger.debug("✅ 找到%s: %s (%s)", field_name, pick["selector"], pick.get("rule", "首个匹配"))
+            return pick["text"]
+        return default
+    
+    def _select_salary_info(self, first_texts: List[str], selectors: List[str]) -> str:
+        """挑选薪资信息：各选择器首个匹配元素的文本清洗后需包含薪资单位"""
+        for selector, text in zip(selectors, first_texts):
+            if text:
+                # 清理薪资文本
+                salary = text.translate(SALARY_TEXT_TRANS)
+                # 验证是否是有效的薪资格式
+                if len(salary) > 2 and SALARY_UNIT_CHAR_RE.search(salary):
+                    logger.debug("✅ 找到薪资信息: %s → %s", selector, salary)
+                    self._pin_detail_selector("salary", {"selector": selector})
+                    return salary
+        
+        return ""
+    
+    def _select_benefits(self, benefits: Dict) -> str:
+        """汇总福利待遇标签（已在浏览器内去重并截取）"""
+        if benefits["items"]:
+            logger.debug("✅ 找到福利待遇: %s 项", benefits["total"])
+            return " | ".join(benefits["items"])
         
         return "福利待遇信息未找到"
     
@@ -935,6 +1585,8 @@ class RealPlaywrightBossSpider:
             login_modal = await self.page.query_selector('.login-dialog, .dialog-wrap')
             if login_modal:
                 logger.info("🔐 检测到登录弹窗，等待用户处理...")
+                # 登录可能已失效，下次搜索重新检查
+                self._login_verified_at = None
                 # 等待一段时间让用户处理
                 await asyncio.sleep(5)
             
@@ -983,9 +1635,13 @@ class RealPlaywrightBossSpider:
             
             if not filename:
                 timestamp = int(time.time())
-                filename = f"boss_real_screenshot_{timestamp}.png"
+                filename = f"boss_real_screenshot_{timestamp}.jpg"
             
-            await self.page.screenshot(path=filename, full_page=True)
+            # JPEG编码比无损PNG快且文件小得多，排查问题足够清晰
+            if filename.lower().endswith(('.jpg', '.jpeg')):
+                await self.page.screenshot(path=filename, full_page=True, type="jpeg", quality=60)
+            else:
+                await self.page.screenshot(path=filename, full_page=True)
             logger.info(f"📸 截图保存: {filename}")
             return filename
             
@@ -993,37 +1649,168 @@ class RealPlaywrightBossSpider:
             logger.error(f"❌ 截图失败: {e}")
             return ""
     
+    async def __aenter__(self) -> "RealPlaywrightBossSpider":
+        if not await self.start():
+            raise RuntimeError("浏览器启动失败")
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
     async def close(self):
-        """关闭浏览器"""
+        """关闭浏览器 - 只关闭本实例的页面/上下文，共享浏览器由最后一个使用者关闭"""
         try:
-            # 对于持久化上下文，只需要关闭上下文
-            if self.context:
-                await self.context.close()
-            # 对于非持久化模式，需要关闭浏览器
-            elif self.browser:
-                if self.page:
-                    await self.page.close()
-                await self.browser.close()
+            # 后台任务（保存会话等）依赖上下文，先等待完成
+            if self._background_tasks:
+                await asyncio.gather(*self._background_tasks, return_exceptions=True)
             
-            if self.playwright:
-                await self.playwright.stop()
+            # 关闭详情页页面池
+            for detail_page in self._detail_pages:
+                if not detail_page.is_closed():
+                    await detail_page.close()
+            for detail_context in self._detail_contexts:
+                await detail_context.close()
+            
+            if self.use_persistent:
+                # 持久化上下文共享，只关闭自己的页面
+                if self.page and not self.page.is_closed():
+                    await self.page.close()
+            elif self.context:
+                # 非持久化模式，关闭本实例独立的上下文
+                await self.context.close()
             
             logger.info("🔚 浏览器已关闭")
             
         except Exception as e:
             logger.error(f"❌ 关闭浏览器失败: {e}")
+        
+        finally:
+            if self.playwright:
+                self.playwright = None
+                await self._release_shared_browser()
+            self.page = None
+            self.context = None
+            self.browser = None
+            self._resource_blocking_enabled = False
+            self._response_cache_enabled = False
+            self._login_verified_at = None
+            self._detail_page_pool = None
+            self._detail_pages = []
+            self._detail_pages_pending = 0
+            self._detail_contexts = []
+
+
+# 异步调用方在多次搜索间复用同一个爬虫实例（浏览器、登录状态和详情页页面池），进程退出前调用 close_shared_spider
+_shared_spider: Optional[RealPlaywrightBossSpider] = None
+_shared_spider_lock: Optional[asyncio.Lock] = None
+_shared_spider_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_shared_spider(headless: bool = False) -> RealPlaywrightBossSpider:
+    """获取共享的爬虫实例，首次调用时启动浏览器；浏览器不可用时自动重新启动
+    
+    共享实例绑定创建它的事件循环，在其他事件循环中调用时创建新的实例。
+    """
+    global _shared_spider, _shared_spider_lock, _shared_spider_loop
+    loop = asyncio.get_running_loop()
+    if _shared_spider_loop is not loop:
+        _shared_spider, _shared_spider_lock, _shared_spider_loop = None, asyncio.Lock(), loop
+    
+    async with _shared_spider_lock:
+        if _shared_spider is None:
+            _shared_spider = RealPlaywrightBossSpider(headless=headless)
+        if not await _shared_spider.start():
+            raise RuntimeError("浏览器启动失败")
+        return _shared_spider
+
+
+async def close_shared_spider() -> None:
+    """关闭共享的爬虫实例"""
+    global _shared_spider
+    spider, _shared_spider = _shared_spider, None
+    if spider is not None:
+        await spider.close()
 
 
 # 同步包装器
+# 同步接口的协程统一提交到后台守护线程中常驻运行的事件循环，避免每次调用创建/销毁事件循环，
+# 也使同步接口可以在已有事件循环的线程（如Web请求处理）中调用
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """获取后台事件循环，首次调用时启动运行它的守护线程"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="playwright-event-loop", daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def _run_in_background_loop(coro):
+    """在后台事件循环中运行协程并等待结果"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
 class RealPlaywrightBossSpiderSync:
-    """真正的Playwright Boss直聘爬虫同步版本"""
+    """真正的Playwright Boss直聘爬虫同步版本
+    
+    作为上下文管理器使用时，浏览器在多次搜索间保持运行：
+    
+        with RealPlaywrightBossSpiderSync() as spider:
+            for keyword in keywords:
+                jobs = spider.search_jobs(keyword, "shanghai")
+    
+    直接调用search_jobs时每次启动并关闭浏览器。
+    """
     
     def __init__(self, headless: bool = False):
         self.headless = headless
         self.spider = None
+        self._started = False
+    
+    def __enter__(self) -> "RealPlaywrightBossSpiderSync":
+        self.spider = RealPlaywrightBossSpider(headless=self.headless)
+        try:
+            _run_in_background_loop(self.spider.start())
+        except Exception:
+            self.spider = None
+            raise
+        self._started = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def is_alive(self) -> bool:
+        """浏览器是否仍可用（窗口被手动关闭或浏览器断开时页面会被标记为已关闭）"""
+        return (
+            self._started
+            and self.spider is not None
+            and self.spider.page is not None
+            and not self.spider.page.is_closed()
+        )
+    
+    def close(self) -> None:
+        """关闭浏览器"""
+        if not self._started:
+            return
+        try:
+            if self.spider:
+                _run_in_background_loop(self.spider.close())
+        finally:
+            self._started = False
+            self.spider = None
     
     def search_jobs(self, keyword: str, city: str, max_jobs: int = 20) -> List[Dict]:
         """搜索岗位（同步版本）"""
+        if self._started:
+            # 复用已启动的浏览器和登录状态
+            return _run_in_background_loop(self.spider.search_jobs(keyword, city, max_jobs))
+        
         async def _search():
             self.spider = RealPlaywrightBossSpider(headless=self.headless)
             
@@ -1036,7 +1823,39 @@ class RealPlaywrightBossSpiderSync:
                 if self.spider:
                     await self.spider.close()
         
-        return asyncio.run(_search())
+        return _run_in_background_loop(_search())
+
+
+# 集成接口在多次调用间复用同一个同步爬虫（浏览器和登录状态），进程退出时关闭
+_shared_sync_spider: Optional[RealPlaywrightBossSpiderSync] = None
+_shared_sync_lock = threading.Lock()
+
+
+def _get_shared_sync_spider() -> RealPlaywrightBossSpiderSync:
+    """获取共享的同步爬虫，首次调用或浏览器已不可用时启动浏览器（调用方需持有 _shared_sync_lock）"""
+    global _shared_sync_spider
+    if _shared_sync_spider is not None and not _shared_sync_spider.is_alive():
+        logger.warning("⚠️ 复用的浏览器已不可用，重新启动")
+        _close_shared_sync_spider()
+    if _shared_sync_spider is None:
+        spider = RealPlaywrightBossSpiderSync(headless=False)  # 可见模式
+        spider.__enter__()
+        _shared_sync_spider = spider
+    return _shared_sync_spider
+
+
+def _close_shared_sync_spider() -> None:
+    """关闭共享的同步爬虫"""
+    global _shared_sync_spider
+    spider, _shared_sync_spider = _shared_sync_spider, None
+    if spider is not None:
+        try:
+            spider.close()
+        except Exception as e:
+            logger.debug("关闭共享爬虫失败: %s", e)
+
+
+atexit.register(_close_shared_sync_spider)
 
 
 # 集成接口
@@ -1045,8 +1864,8 @@ def search_with_real_playwright(keyword: str, city: str = "shanghai", max_jobs:
     logger.info(f"🎭 启动真正的Playwright自动化搜索: {keyword}")
     
     try:
-        spider = RealPlaywrightBossSpiderSync(headless=False)  # 可见模式
-        jobs = spider.search_jobs(keyword, city, max_jobs)
+        with _shared_sync_lock:
+            jobs = _get_shared_sync_spider().search_jobs(keyword, city, max_jobs)
         
         logger.info(f"✅ 真实搜索完成，找到 {len(jobs)} 个岗位")
         return jobs
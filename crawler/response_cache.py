@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+响应录制回放缓存
+首次访问时把页面文档和JSON接口的响应写入磁盘，有效期内再次访问相同请求时直接从磁盘返回，
+用于开发调试和失败重试时反复抓取同一批岗位的场景
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 参与缓存的请求：Boss直聘的 .html 页面文档和 .json 接口（注册路由时使用），静态资源交给浏览器自身的缓存
+CACHEABLE_URL_RE = re.compile(r'^https://www\.zhipin\.com/[^?#]*\.(?:html|json)(?:[?#]|$)')
+CACHEABLE_RESOURCE_TYPES = frozenset({"document", "xhr", "fetch"})
+
+# 每次访问都会变化、不影响响应内容的查询参数，计算缓存键前去掉
+VOLATILE_QUERY_PARAMS = frozenset({"lid", "securityId", "ka", "_t", "timestamp", "ts"})
+
+# 安全验证页和反爬虫拦截的响应不缓存，否则回放时会一直停留在验证页
+UNCACHEABLE_BODY_RE = re.compile('<title>请稍候</title>|security-check|"code"\\s*:\\s*37\\b'.encode('utf-8'))
+
+# 回放时不能照搬的响应头：body() 取到的已是解压后的完整内容
+DROPPED_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def normalize_url(url: str) -> str:
+    """去掉易变查询参数并对其余参数排序，使同一资源的不同访问得到相同的URL"""
+    parts = urllib.parse.urlsplit(url)
+    query = sorted(
+        (key, value) for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key not in VOLATILE_QUERY_PARAMS
+    )
+    return urllib.parse.urlunsplit(
+        (parts.scheme, parts.netloc, parts.path, urllib.parse.urlencode(query), "")
+    )
+
+
+def _read_cache_entry(meta_path: str, body_path: str, ttl: float) -> Optional[Tuple[Dict, bytes]]:
+    """读取未过期的缓存条目（在线程池中执行）"""
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if time.time() - meta["saved_at"] > ttl:
+            return None
+        with open(body_path, 'rb') as f:
+            return meta, f.read()
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_cache_entry(meta_path: str, body_path: str, meta: Dict, body: bytes) -> None:
+    """写入缓存条目（在线程池中执行），先写内容再写元数据，元数据存在即表示条目完整"""
+    with open(body_path, 'wb') as f:
+        f.write(body)
+    tmp_path = f"{meta_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, meta_path)
+
+
+class ResponseCache:
+    """响应录制回放缓存 - 通过路由拦截页面文档和接口请求
+    
+    用法：在页面或上下文的其他路由之后以 CACHEABLE_URL_RE 注册 handle，
+    未参与缓存的请求通过 route.fallback() 交给先注册的路由（如资源拦截）处理。
+    """
+    
+    def __init__(self, cache_dir: str = None, ttl_hours: float = 6):
+        self.cache_dir = cache_dir or os.path.join(os.path.dirname(__file__), 'response_cache')
+        self.ttl = ttl_hours * 3600
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+    
+    def _entry_paths(self, request) -> Tuple[str, str]:
+        """由请求签名（方法、规范化URL、请求体）计算缓存文件路径"""
+        signature = hashlib.sha1()
+        signature.update(request.method.encode('utf-8'))
+        signature.update(normalize_url(request.url).encode('utf-8'))
+        post_data = request.post_data_buffer
+        if post_data:
+            signature.update(hashlib.sha1(post_data).digest())
+        key = signature.hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json"), os.path.join(self.cache_dir, f"{key}.bin")
+    
+    async def handle(self, route) -> None:
+        """路由处理：命中缓存直接返回，未命中时请求网络并录制成功的响应"""
+        request = route.request
+        if request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            await route.fallback()
+            return
+        
+        meta_path, body_path = self._entry_paths(request)
+        entry = await asyncio.to_thread(_read_cache_entry, meta_path, body_path, self.ttl)
+        if entry is not None:
+            meta, body = entry
+            self.hits += 1
+            logger.debug("♻️ 响应命中缓存: %s", request.url)
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+        
+        self.misses += 1
+        try:
+            response = await route.fetch()
+            await route.fulfill(response=response)
+        except Exception as e:
+            # 网络错误或页面已关闭：不录制，交给其他路由或浏览器按默认方式处理
+            logger.debug("缓存路由请求失败，交由默认处理: %s (%s)", request.url, e)
+            try:
+                await route.fallback()
+            except Exception as fallback_error:
+                logger.debug("缓存路由回退失败: %s (%s)", request.url, fallback_error)
+            return
+        
+        try:
+            body = await response.body()
+        except Exception as e:
+            # 页面已拿到响应，读取内容失败只放弃录制
+            logger.debug("读取响应内容失败，跳过录制: %s (%s)", request.url, e)
+            return
+        
+        if response.status == 200 and not UNCACHEABLE_BODY_RE.search(body):
+            meta = {
+                "url": request.url,
+                "status": response.status,
+                "headers": {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in DROPPED_RESPONSE_HEADERS
+                },
+                "saved_at": time.time()
+            }
+            try:
+                await asyncio.to_thread(_write_cache_entry, meta_path, body_path, meta, body)
+            except OSError as e:
+                logger.debug("写入响应缓存失败: %s (%s)", request.url, e)
@@ -6,8 +6,10 @@
 
 import logging
 import asyncio
+import re
 import time
 import random
+from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, Union
 from enum import Enum
 from dataclasses import dataclass
@@ -76,6 +78,68 @@ class ErrorContext:
     additional_info: Dict[str, Any]
 
 
+def _keyword_re(*keywords: str) -> "re.Pattern":
+    """关键词列表预编译为交替式正则，一次扫描代替逐个关键词的 in 判断"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# 错误信息关键词（小写）到错误类型的映射，按优先级顺序匹配
+ERROR_KEYWORD_PATTERNS = (
+    # 网络相关错误
+    (ErrorType.NETWORK_ERROR, _keyword_re(
+        'connection', 'network', 'dns', 'resolve', 'unreachable',
+        'connection refused', 'connection reset', 'no route'
+    )),
+    # 超时错误
+    (ErrorType.TIMEOUT_ERROR, _keyword_re(
+        'timeout', 'timed out', 'time out', 'deadline exceeded'
+    )),
+    # 认证错误
+    (ErrorType.AUTHENTICATION_ERROR, _keyword_re(
+        'unauthorized', '401', 'forbidden', '403', 'authentication',
+        'login required', 'access denied'
+    )),
+    # 验证码错误
+    (ErrorType.CAPTCHA_ERROR, _keyword_re(
+        'captcha', 'verification', 'verify', 'robot', 'challenge'
+    )),
+    # 限流错误
+    (ErrorType.RATE_LIMIT_ERROR, _keyword_re(
+        'rate limit', 'too many requests', '429', 'throttle',
+        'quota exceeded', 'api limit'
+    )),
+    # 解析错误
+    (ErrorType.PARSING_ERROR, _keyword_re(
+        'parse', 'json', 'xml', 'decode', 'format', 'invalid response'
+    )),
+    # 页面加载错误
+    (ErrorType.PAGE_LOAD_ERROR, _keyword_re(
+        'page not found', '404', 'not found', 'page load',
+        'navigation', 'goto failed'
+    )),
+    # 元素未找到
+    (ErrorType.ELEMENT_NOT_FOUND, _keyword_re(
+        'element not found', 'selector', 'element is not attached',
+        'no such element', 'element not visible'
+    )),
+    # 浏览器错误
+    (ErrorType.BROWSER_ERROR, _keyword_re(
+        'browser', 'chrome', 'chromium', 'playwright',
+        'browser closed', 'context closed'
+    )),
+)
+
+# 全部关键词合并为一个忽略大小写的正则，一次扫描完成分类：每个位置上用零宽前瞻按优先级顺序尝试各类型，
+# 匹配结果给出从该位置开始的最高优先级类型（不消耗字符，关键词相互重叠时不会被跳过），取所有位置中优先级最高的
+ERROR_KEYWORD_RE = re.compile(
+    '(?=%s)' % '|'.join(
+        f'(?P<{error_type.name}>{keyword_re.pattern})' for error_type, keyword_re in ERROR_KEYWORD_PATTERNS
+    ),
+    re.IGNORECASE
+)
+ERROR_TYPE_PRIORITY = {error_type.name: priority for priority, (error_type, _) in enumerate(ERROR_KEYWORD_PATTERNS)}
+
+
 class ErrorClassifier:
     """错误分类器"""
     
@@ -91,68 +155,16 @@ class ErrorClassifier:
         Returns:
             ErrorType: 错误类型
         """
-        error_msg = str(exception).lower()
-        exception_type = type(exception).__name__
-        
-        # 网络相关错误
-        if any(keyword in error_msg for keyword in [
-            'connection', 'network', 'dns', 'resolve', 'unreachable',
-            'connection refused', 'connection reset', 'no route'
-        ]):
-            return ErrorType.NETWORK_ERROR
-        
-        # 超时错误
-        if any(keyword in error_msg for keyword in [
-            'timeout', 'timed out', 'time out', 'deadline exceeded'
-        ]):
-            return ErrorType.TIMEOUT_ERROR
-        
-        # 认证错误
-        if any(keyword in error_msg for keyword in [
-            'unauthorized', '401', 'forbidden', '403', 'authentication',
-            'login required', 'access denied'
-        ]):
-            return ErrorType.AUTHENTICATION_ERROR
-        
-        # 验证码错误
-        if any(keyword in error_msg for keyword in [
-            'captcha', 'verification', 'verify', 'robot', 'challenge'
-        ]):
-            return ErrorType.CAPTCHA_ERROR
-        
-        # 限流错误
-        if any(keyword in error_msg for keyword in [
-            'rate limit', 'too many requests', '429', 'throttle',
-            'quota exceeded', 'api limit'
-        ]):
-            return ErrorType.RATE_LIMIT_ERROR
-        
-        # 解析错误
-        if any(keyword in error_msg for keyword in [
-            'parse', 'json', 'xml', 'decode', 'format', 'invalid response'
-        ]):
-            return ErrorType.PARSING_ERROR
-        
-        # 页面加载错误
-        if any(keyword in error_msg for keyword in [
-            'page not found', '404', 'not found', 'page load',
-            'navigation', 'goto failed'
-        ]):
-            return ErrorType.PAGE_LOAD_ERROR
+        best_priority = None
+        for match in ERROR_KEYWORD_RE.finditer(str(exception)):
+            priority = ERROR_TYPE_PRIORITY[match.lastgroup]
+            if best_priority is None or priority < best_priority:
+                best_priority = priority
+                if priority == 0:
+                    break
         
-        # 元素未找到
-        if any(keyword in error_msg for keyword in [
-            'element not found', 'selector', 'element is not attached',
-            'no such element', 'element not visible'
-        ]):
-            return ErrorType.ELEMENT_NOT_FOUND
-        
-        # 浏览器错误
-        if any(keyword in error_msg for keyword in [
-            'browser', 'chrome', 'chromium', 'playwright',
-            'browser closed', 'context closed'
-        ]):
-            return ErrorType.BROWSER_ERROR
+        if best_priority is not None:
+            return ERROR_KEYWORD_PATTERNS[best_priority][0]
         
         # 默认为未知错误
         return ErrorType.UNKNOWN_ERROR
@@ -168,7 +180,7 @@ class RetryHandler:
             'total_retries': 0,
             'successful_retries': 0,
             'failed_operations': 0,
-            'error_counts': {}
+            'error_counts': defaultdict(int)
         }
     
     def calculate_delay(self, attempt: int, config: RetryConfig) -> float:
@@ -196,11 +208,9 @@ class RetryHandler:
         # 限制最大延迟
         delay = min(delay, config.max_delay)
         
-        # 添加随机抖动
+        # 添加随机抖动：在 [0.9, 1.1) 倍之间均匀浮动（10%的抖动，结果始终非负）
         if config.jitter and delay > 0:
-            jitter_amount = delay * 0.1  # 10%的抖动
-            delay += random.uniform(-jitter_amount, jitter_amount)
-            delay = max(0, delay)  # 确保延迟非负
+            delay *= 0.9 + 0.2 * random.random()
         
         return delay
     
@@ -235,7 +245,7 @@ class RetryHandler:
         **kwargs
     ) -> Any:
         """
-        带重试机制执行函数
+        带重试机制执行函数（同步函数在线程池中执行，不阻塞事件循环上的其他任务）
         
         Args:
             func: 要执行的函数
@@ -251,18 +261,19 @@ class RetryHandler:
             Exception: 最后一次尝试的异常
         """
         retry_config = config or self.default_config
-        start_time = time.time()
+        start_time = time.monotonic()
         last_exception = None
+        is_coroutine_func = asyncio.iscoroutinefunction(func)
         
         for attempt in range(retry_config.max_attempts):
             try:
-                logger.debug(f"执行 {func.__name__} - 尝试 {attempt + 1}/{retry_config.max_attempts}")
+                logger.debug("执行 %s - 尝试 %d/%d", func.__name__, attempt + 1, retry_config.max_attempts)
                 
                 # 执行函数
-                if asyncio.iscoroutinefunction(func):
+                if is_coroutine_func:
                     result = await func(*args, **kwargs)
                 else:
-                    result = func(*args, **kwargs)
+                    result = await asyncio.to_thread(func, *args, **kwargs)
                 
                 # 成功执行，更新统计
                 if attempt > 0:
@@ -273,7 +284,7 @@ class RetryHandler:
                 
             except Exception as e:
                 last_exception = e
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 
                 # 分类错误
                 error_type = self.error_classifier.classify_error(e, context)
@@ -292,8 +303,7 @@ class RetryHandler:
                 )
                 
                 # 更新错误统计
-                self.retry_stats['error_counts'][error_type.value] = \
-                    self.retry_stats['error_counts'].get(error_type.value, 0) + 1
+                self.retry_stats['error_counts'][error_type.value] += 1
                 
                 # 判断是否应该重试
                 if not self.should_retry(error_type, attempt, retry_config):
@@ -366,7 +376,7 @@ class RetryHandler:
             'successful_retries': self.retry_stats['successful_retries'],
             'failed_operations': self.retry_stats['failed_operations'],
             'success_rate': success_rate,
-            'error_counts': self.retry_stats['error_counts'].copy(),
+            'error_counts': dict(self.retry_stats['error_counts']),
             'most_common_error': self._get_most_common_error()
         }
     
@@ -383,10 +393,49 @@ class RetryHandler:
             'total_retries': 0,
             'successful_retries': 0,
             'failed_operations': 0,
-            'error_counts': {}
+            'error_counts': defaultdict(int)
         }
 
 
+class RateLimiter:
+    """请求速率限制器（令牌桶）：平均每 1/rate 秒一个请求配额，空闲时最多积累 burst 个
+    
+    配额可用时立即放行，不像固定sleep那样在每个请求后都等待；空闲一段时间后的一批请求
+    可以连续放行 burst 个，之后按平均速率排队。并发的调用者按到达顺序排队。
+    jitter>0 时每个间隔在 ±jitter 比例内随机浮动（平均速率不变），避免请求呈现固定周期。
+    """
+    
+    def __init__(self, requests_per_second: float, jitter: float = 0.0, burst: int = 1):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.burst = max(1, int(burst))
+        self._next_allowed = 0.0  # 配额全部用完时下一个请求的理论放行时间
+        self._lock: Optional[asyncio.Lock] = None  # 首次使用时创建，绑定当时的事件循环
+    
+    async def acquire(self) -> None:
+        """等待下一个请求配额"""
+        if self.interval <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            now = time.monotonic()
+            next_allowed = max(self._next_allowed, now)
+            # 积累的配额可以提前放行 burst-1 个间隔
+            wait_time = next_allowed - (self.burst - 1) * self.interval - now
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            interval = self.interval
+            if self.jitter:
+                interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_allowed = next_allowed + interval
+
+
+# retry_on_error 装饰的函数共用的重试处理器（处理器不保存单次调用的状态，重试统计汇总在一处）
+DEFAULT_RETRY_HANDLER = RetryHandler()
+
+
 def retry_on_error(
     max_attempts: int = 3,
     base_delay: float = 1.0,
@@ -403,17 +452,17 @@ def retry_on_error(
         allowed_errors: 允许重试的错误类型
     """
     def decorator(func):
+        # 配置在装饰时创建一次，被装饰函数的每次调用共用
+        config = RetryConfig(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            strategy=strategy,
+            allowed_error_types=allowed_errors
+        )
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            config = RetryConfig(
-                max_attempts=max_attempts,
-                base_delay=base_delay,
-                strategy=strategy,
-                allowed_error_types=allowed_errors
-            )
-            
-            handler = RetryHandler()
-            return await handler.execute_with_retry(func, *args, config=config, **kwargs)
+            return await DEFAULT_RETRY_HANDLER.execute_with_retry(func, *args, config=config, **kwargs)
         
         return wrapper
     return decorator
@@ -5,6 +5,7 @@
 """
 
 import os
+import re
 import json
 import logging
 import time
@@ -15,6 +16,143 @@ from playwright.async_api import Page, BrowserContext
 
 logger = logging.getLogger(__name__)
 
+# Boss直聘已登录的用户元素（按优先级排序）
+ZHIPIN_USER_SELECTORS = [
+    '.nav-figure img[src*="avatar"]',  # 用户头像
+    '.geek-nav .figure img',           # 求职者导航头像
+    '.dropdown-avatar',                # 下拉头像
+    '[class*="avatar"][src]',          # 任何有src的头像元素
+    '.user-name'                       # 用户名元素
+]
+
+# Boss直聘未登录时出现的登录入口
+ZHIPIN_LOGIN_SELECTORS = [
+    'a[href*="login"]',
+    '.login-btn',
+    '.sign-in-btn'
+]
+ZHIPIN_LOGIN_BUTTON_TEXT = "登录"  # 文本为"登录"的按钮（原 button:has-text("登录")）
+
+# 在浏览器内依次探测用户元素和登录入口，返回第一个可见的匹配
+ZHIPIN_LOGIN_PROBE_JS = """
+([userSelectors, loginSelectors, loginButtonText]) => {
+    const isVisible = el => {
+        if (!el || !el.getClientRects().length) return false;
+        return getComputedStyle(el).visibility !== 'hidden';
+    };
+    const query = selector => {
+        try {
+            return document.querySelector(selector);
+        } catch (e) {
+            return null;
+        }
+    };
+    for (const selector of userSelectors) {
+        const el = query(selector);
+        if (!isVisible(el)) continue;
+        if (selector.includes('img')) {
+            const src = el.getAttribute('src') || '';
+            if (src.includes('avatar') || src.includes('head')) {
+                return {logged_in: true, kind: 'avatar', selector: selector, detail: src};
+            }
+        } else {
+            const text = (el.innerText || '').trim();
+            if (text) {
+                return {logged_in: true, kind: 'text', selector: selector, detail: text.slice(0, 20)};
+            }
+        }
+    }
+    for (const selector of loginSelectors) {
+        if (isVisible(query(selector))) {
+            return {logged_in: false, kind: 'login', selector: selector, detail: ''};
+        }
+    }
+    for (const button of document.querySelectorAll('button')) {
+        if ((button.innerText || '').includes(loginButtonText) && isVisible(button)) {
+            return {logged_in: false, kind: 'login', selector: 'button:has-text("' + loginButtonText + '")', detail: ''};
+        }
+    }
+    return {logged_in: null, kind: '', selector: '', detail: ''};
+}
+"""
+
+# 保存会话时提取用户信息的候选元素（头像取src，其余取文本）
+USER_INFO_SELECTORS = [
+    '.nav-figure img',  # 用户头像
+    '.user-name',       # 用户名
+    '.geek-name',       # Boss直聘求职者名称
+    '.dropdown-avatar', # 下拉头像
+    '[class*="avatar"]' # 包含avatar的元素
+]
+
+# 在浏览器内依次检查用户信息元素，取到头像或用户名即停止
+USER_INFO_JS = """
+(selectors) => {
+    const info = {name: '', avatar: ''};
+    for (const selector of selectors) {
+        let el;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {
+            continue;
+        }
+        if (!el) continue;
+        if (selector.includes('img')) {
+            info.avatar = el.getAttribute('src') || info.avatar;
+        } else {
+            info.name = (el.innerText || '').trim() || info.name;
+        }
+        if (info.name || info.avatar) break;
+    }
+    return info;
+}
+"""
+
+# 通用站点的已登录标识，合并为一个选择器列表
+GENERIC_LOGGED_IN_SELECTOR = (
+    '[class*="user"], [class*="profile"], [class*="avatar"], '
+    '[class*="logout"], [class*="account"], [class*="dashboard"]'
+)
+
+# 是否存在可见的已登录标识（在浏览器内遍历匹配元素，不为每个元素单独调用is_visible）
+GENERIC_LOGGED_IN_JS = """
+(selector) => Array.from(document.querySelectorAll(selector)).some(el =>
+    el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden'
+)
+"""
+
+
+# 保留的关键cookies
+USEFUL_COOKIE_PATTERNS = (
+    'login', 'session', 'token', 'auth', 'user', 'uid', 'sid',
+    'boss', 'zhipin', 'geek', 'wt2', 'suc', '__zp_stoken__'
+)
+# 过滤掉的无用cookies
+USELESS_COOKIE_PATTERNS = (
+    'ga', 'gtm', 'utm', 'track', 'analytics', 'advertisement',
+    'ads', '_gid', '_gat', '__utma', '__utmb', '__utmc', '__utmz'
+)
+USEFUL_COOKIE_RE = re.compile('|'.join(map(re.escape, USEFUL_COOKIE_PATTERNS)))
+USELESS_COOKIE_RE = re.compile('|'.join(map(re.escape, USELESS_COOKIE_PATTERNS)))
+
+# 登录/注册页的URL路径（等待登录时每轮都要检查当前URL）
+LOGIN_PAGE_PATHS = ('/login', '/signin', '/register')
+LOGIN_PAGE_URL_RE = re.compile('|'.join(map(re.escape, LOGIN_PAGE_PATHS)))
+
+
+def _read_json_file(path: str) -> Any:
+    """读取JSON文件（在线程池中执行）"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_file_atomic(path: str, data: Any) -> None:
+    """原子写入JSON文件（在线程池中执行），先写临时文件再替换，避免写入中断导致文件损坏"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
 
 class SessionManager:
     """会话管理器 - 负责登录状态和Cookie管理"""
@@ -50,8 +188,8 @@ class SessionManager:
             return False
         
         try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            # 文件读取和JSON解析放到线程池，避免阻塞事件循环
+            session_data = await asyncio.to_thread(_read_json_file, session_file)
             
             # 检查会话是否过期
             if self._is_session_expired(session_data):
@@ -74,11 +212,51 @@ class SessionManager:
             # 删除损坏的会话文件
             try:
                 os.remove(session_file)
-            except:
+            except Exception:
                 pass
         
         return False
     
+    async def load_storage_state(self, domain: str = "zhipin.com") -> Optional[Dict]:
+        """
+        读取保存的会话并转换为Playwright的storage_state格式，
+        用于创建上下文时一次性恢复cookies和localStorage（无需再add_cookies+刷新页面）
+        
+        Args:
+            domain: 域名
+            
+        Returns:
+            storage_state字典，没有可用会话时返回None
+        """
+        session_file = self.get_session_file_path(domain)
+        
+        if not os.path.exists(session_file):
+            logger.info(f"📄 会话文件不存在: {session_file}")
+            return None
+        
+        try:
+            session_data = await asyncio.to_thread(_read_json_file, session_file)
+            
+            if self._is_session_expired(session_data):
+                logger.warning("⏰ 会话已过期，需要重新登录")
+                os.remove(session_file)
+                return None
+            
+            cookies = session_data.get('cookies', [])
+            if not cookies:
+                return None
+            
+            self.current_session = session_data
+            logger.info(f"✅ 已读取保存的会话: {len(cookies)} 个cookies")
+            return {
+                'cookies': cookies,
+                'origins': session_data.get('origins', [])
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ 读取会话失败: {e}")
+            return None
+    
     async def save_session(self, context: BrowserContext, page: Page, domain: str = "zhipin.com") -> bool:
         """
         保存当前会话
@@ -92,39 +270,49 @@ class SessionManager:
             bool: 是否成功保存会话
         """
         try:
-            # 获取cookies
-            cookies = await context.cookies()
+            # storage_state同时包含cookies和localStorage，一次调用取回
+            storage_state = await context.storage_state()
             
             # 过滤并清洗cookies
-            cleaned_cookies = self._clean_cookies(cookies, domain)
+            cleaned_cookies = self._clean_cookies(storage_state.get('cookies', []), domain)
             
             if not cleaned_cookies:
                 logger.warning("⚠️ 没有有效的cookies可保存")
                 return False
             
-            # 获取用户信息（如果可用）
-            user_info = await self._extract_user_info(page)
+            # 保存相关域名的localStorage，恢复会话时随storage_state一起加载
+            origins = [
+                origin for origin in storage_state.get('origins', [])
+                if domain in origin.get('origin', '')
+            ]
+            
+            # 用户信息、浏览器版本、屏幕信息相互独立，并发获取
+            user_info, browser_version, screen_info = await asyncio.gather(
+                self._extract_user_info(page),
+                self._get_browser_version(page),
+                self._get_screen_info(page)
+            )
             
             # 构建会话数据
             session_data = {
                 'domain': domain,
                 'cookies': cleaned_cookies,
+                'origins': origins,
                 'user_info': user_info,
                 'save_time': datetime.now().isoformat(),
                 'expires_at': (datetime.now() + timedelta(days=7)).isoformat(),  # 7天后过期
                 'page_url': page.url,
-                'user_agent': await page.evaluate('navigator.userAgent'),
+                'user_agent': browser_version,
                 'session_metadata': {
-                    'browser_version': await self._get_browser_version(page),
-                    'screen_resolution': await self._get_screen_info(page),
+                    'browser_version': browser_version,
+                    'screen_resolution': screen_info,
                     'login_method': 'auto_detected'
                 }
             }
             
             # 保存到文件
             session_file = self.get_session_file_path(domain)
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, ensure_ascii=False, indent=2)
+            await asyncio.to_thread(_write_json_file_atomic, session_file, session_data)
             
             self.current_session = session_data
             logger.info(f"✅ 会话已保存: {session_file}")
@@ -170,66 +358,22 @@ class SessionManager:
     
     def _is_useful_cookie(self, cookie_name: str) -> bool:
         """判断cookie是否有用"""
-        # 保留的关键cookies
-        useful_patterns = [
-            'login', 'session', 'token', 'auth', 'user', 'uid', 'sid',
-            'boss', 'zhipin', 'geek', 'wt2', 'suc', '__zp_stoken__'
-        ]
-        
-        # 过滤掉的无用cookies
-        useless_patterns = [
-            'ga', 'gtm', 'utm', 'track', 'analytics', 'advertisement',
-            'ads', '_gid', '_gat', '__utma', '__utmb', '__utmc', '__utmz'
-        ]
-        
         cookie_lower = cookie_name.lower()
         
         # 检查是否是有用的cookie
-        for pattern in useful_patterns:
-            if pattern in cookie_lower:
-                return True
-        
-        # 检查是否是无用的cookie
-        for pattern in useless_patterns:
-            if pattern in cookie_lower:
-                return False
+        if USEFUL_COOKIE_RE.search(cookie_lower):
+            return True
         
-        # 默认保留未知的cookie
-        return True
+        # 检查是否是无用的cookie，默认保留未知的cookie
+        return not USELESS_COOKIE_RE.search(cookie_lower)
     
     async def _extract_user_info(self, page: Page) -> Dict[str, Any]:
         """从页面提取用户信息"""
         user_info = {'name': '', 'avatar': '', 'company': ''}
         
         try:
-            # 尝试多种用户信息选择器
-            user_selectors = [
-                '.nav-figure img',  # 用户头像
-                '.user-name',       # 用户名
-                '.geek-name',       # Boss直聘求职者名称
-                '.dropdown-avatar', # 下拉头像
-                '[class*="avatar"]' # 包含avatar的元素
-            ]
-            
-            for selector in user_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        if 'img' in selector:
-                            # 获取头像URL
-                            src = await element.get_attribute('src')
-                            if src:
-                                user_info['avatar'] = src
-                        else:
-                            # 获取用户名
-                            text = await element.inner_text()
-                            if text and text.strip():
-                                user_info['name'] = text.strip()
-                        
-                        if user_info['name'] or user_info['avatar']:
-                            break
-                except:
-                    continue
+            # 多种用户信息选择器在浏览器内一次检查完
+            user_info.update(await page.evaluate(USER_INFO_JS, USER_INFO_SELECTORS))
             
             # 尝试从页面标题或其他位置获取用户信息
             if not user_info['name']:
@@ -246,7 +390,7 @@ class SessionManager:
         """获取浏览器版本信息"""
         try:
             return await page.evaluate('navigator.userAgent')
-        except:
+        except Exception:
             return 'unknown'
     
     async def _get_screen_info(self, page: Page) -> Dict[str, int]:
@@ -258,7 +402,7 @@ class SessionManager:
                 viewport_width: window.innerWidth,
                 viewport_height: window.innerHeight
             })''')
-        except:
+        except Exception:
             return {'width': 1920, 'height': 1080, 'viewport_width': 1280, 'viewport_height': 800}
     
     def _is_session_expired(self, session_data: Dict) -> bool:
@@ -302,55 +446,27 @@ class SessionManager:
             return False
     
     async def _check_zhipin_login_status(self, page: Page) -> bool:
-        """检查Boss直聘登录状态"""
+        """检查Boss直聘登录状态 - 所有选择器在一次page.evaluate中探测"""
         try:
-            # 检查用户相关元素
-            user_selectors = [
-                '.nav-figure img[src*="avatar"]',  # 用户头像
-                '.geek-nav .figure img',           # 求职者导航头像
-                '.dropdown-avatar',                # 下拉头像
-                '[class*="avatar"][src]',          # 任何有src的头像元素
-                '.user-name'                       # 用户名元素
-            ]
-            
-            for selector in user_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        # 进一步验证元素内容
-                        if 'img' in selector:
-                            src = await element.get_attribute('src')
-                            if src and ('avatar' in src or 'head' in src):
-                                logger.info(f"✓ 检测到用户头像: {selector}")
-                                return True
-                        else:
-                            text = await element.inner_text()
-                            if text and len(text.strip()) > 0:
-                                logger.info(f"✓ 检测到用户信息: {text[:20]}...")
-                                return True
-                except:
-                    continue
-            
-            # 检查是否有登录按钮（反向验证）
-            login_selectors = [
-                'a[href*="login"]',
-                'button:has-text("登录")',
-                '.login-btn',
-                '.sign-in-btn'
-            ]
+            probe = await page.evaluate(
+                ZHIPIN_LOGIN_PROBE_JS,
+                [ZHIPIN_USER_SELECTORS, ZHIPIN_LOGIN_SELECTORS, ZHIPIN_LOGIN_BUTTON_TEXT]
+            )
+            
+            if probe['logged_in'] is True:
+                if probe['kind'] == 'avatar':
+                    logger.info(f"✓ 检测到用户头像: {probe['selector']}")
+                else:
+                    logger.info(f"✓ 检测到用户信息: {probe['detail']}...")
+                return True
             
-            for selector in login_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        logger.info(f"✗ 检测到登录按钮: {selector}")
-                        return False
-                except:
-                    continue
+            if probe['logged_in'] is False:
+                logger.info(f"✗ 检测到登录按钮: {probe['selector']}")
+                return False
             
             # 检查URL是否包含登录相关路径
             current_url = page.url
-            if any(path in current_url for path in ['/login', '/signin', '/register']):
+            if LOGIN_PAGE_URL_RE.search(current_url):
                 logger.info(f"✗ 当前在登录页面: {current_url}")
                 return False
             
@@ -365,23 +481,8 @@ class SessionManager:
     async def _check_generic_login_status(self, page: Page) -> bool:
         """通用登录状态检查"""
         try:
-            # 通用的已登录指示器
-            logged_in_selectors = [
-                '[class*="user"]', '[class*="profile"]', '[class*="avatar"]',
-                '[class*="logout"]', '[class*="account"]', '[class*="dashboard"]'
-            ]
-            
-            for selector in logged_in_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements:
-                        for element in elements:
-                            if await element.is_visible():
-                                return True
-                except:
-                    continue
-            
-            return False
+            # 通用的已登录指示器：任意一个可见即视为已登录
+            return await page.evaluate(GENERIC_LOGGED_IN_JS, GENERIC_LOGGED_IN_SELECTOR)
             
         except Exception as e:
             logger.debug(f"通用登录状态检查失败: {e}")
@@ -4,14 +4,220 @@
 提供动态选择器检测、自适应机制和数据质量验证
 """
 
+import asyncio
+import functools
 import logging
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from playwright.async_api import Page, ElementHandle
 
 logger = logging.getLogger(__name__)
 
+# 薪资文本标准化：'·' 替换为 '-'，去掉 '薪'（如 "15-25K·13薪"）
+SALARY_TEXT_TRANS = str.maketrans({'·': '-', '薪': None})
+# Boss直聘反爬虫导致的不完整薪资显示，如 "-K" / "K-"
+INCOMPLETE_SALARY_RE = re.compile(r'^(?:-[Kk]|[Kk]-)$')
+SALARY_RANGE_RE = re.compile(r'\d+[KkWw万千][\-~]\d+[KkWw万千]')
+BRACKET_CONTENT_RE = re.compile(r'\s*\(.*?\)\s*')
+CN_BRACKET_CONTENT_RE = re.compile(r'\s*（.*?）\s*')
+# 所有选择器都未能提取到数据时各字段的默认值
+DEFAULT_FIELD_VALUES = {
+    "job_title": "职位信息获取失败",
+    "company_name": "公司信息获取失败",
+    "salary": "薪资面议",
+    "location": "地点待确认",
+    "job_link": ""
+}
+
+# 地点标准化时识别的城市
+LOCATION_CITY_RE = re.compile('北京|上海|广州|深圳|杭州|南京|武汉|成都')
+
+# 选择器测试：返回匹配元素总数和前N个元素的文本
+SAMPLE_TEXTS_JS = "(els, n) => ({count: els.length, texts: els.slice(0, n).map(e => e.innerText || '')})"
+
+# 一次调用读取元素内各候选选择器第一个匹配的文本：未匹配为 null，
+# 原生querySelector不支持的选择器（如Playwright扩展语法）为 false
+CANDIDATE_TEXTS_JS = """
+(el, selectors) => selectors.map(selector => {
+    try {
+        const match = el.querySelector(selector);
+        return match ? match.innerText : null;
+    } catch (e) {
+        return false;
+    }
+})
+"""
+
+# find_best_selectors 同时测试的最大选择器数
+SELECTOR_TEST_CONCURRENCY = 8
+
+
+# 预定义的选择器配置，按优先级排序
+SELECTOR_CONFIGS = {
+    "job_container": {
+        "primary": [
+            'li.job-card-wrapper',            # Boss直聘最新结构
+            'li[data-jid]',                   # Boss直聘岗位ID
+            '.job-card-left',                 # 左侧卡片
+            'li:has(a[href*="job_detail"])',  # 包含岗位链接的li
+            '.job-detail-box',                # Boss直聘特有
+            'a[ka*="search_list"]',           # ka属性标识
+            '[data-jobid]',                   # 数据属性标识
+            '.job-list-item',                 # 列表项目
+        ],
+        "fallback": [
+            '.job-card-wrapper', '.job-card-container',
+            'li.job-card-container', '.job-card-left', 
+            '.job-info-box', '.job-list-box .job-card-body',
+            '.job-card', '.job-item', '.search-job-result',
+            'div[data-jobid]', 'a[data-jobid]'
+        ],
+        "generic": [
+            'li[class*="job"]', 'div[class*="job-card"]',
+            '.job-primary', '.job-content',
+            'li', 'article', '.result-item',
+            'div[class*="item"]', 'div[class*="card"]'
+        ]
+    },
+    "job_title": {
+        "primary": [
+            '.job-name', '.job-title', 
+            'a .job-name', 'h3.job-name',
+            '.job-card-body .name a',  # Boss直聘新结构
+            'span.job-name',            # 可能是span元素
+            '.job-info .name'           # 岗位信息名称
+        ],
+        "fallback": [
+            '.job-info h3', '.job-primary .name',
+            '.job-card-body .job-name', '[class*="job"][class*="name"]',
+            'a[href*="job_detail"]:first-child',  # 第一个岗位链接
+            '.name:not(.company-name)',           # 排除公司名的name类
+            'h3:first-child'                      # 第一个h3元素
+        ],
+        "generic": [
+            '.position-name', 'h3', '.title',
+            'a:first-child', 'span:first-child'  # 第一个链接或span
+        ]
+    },
+    "company_name": {
+        "primary": [
+            '.company-name', '.company-text',
+            '.job-company', '.company-info .name'
+        ],
+        "fallback": [
+            'h3:not(.job-name):not([class*="salary"])',
+            '.company-info h3', '.job-info .company'
+        ],
+        "generic": [
+            'span:not([class*="salary"]):not([class*="location"])',
+            'div:not([class*="salary"]):not([class*="location"])'
+        ]
+    },
+    "salary": {
+        "primary": [
+            '.job-salary',                    # Boss直聘主要薪资类名
+            'span.job-salary',                # span版本
+            '[class*="salary"]',              # 包含salary的类
+            '.red',                           # 红色文字（薪资常用）
+            '.salary',                        # 通用salary类
+            '.job-limit .red',                # 岗位限制中的红色文字
+            '.job-primary .red',              # 主要信息中的红色文字
+            '.text-warning',                  # 警告色文字
+            '.text-orange'                    # 橙色文字
+        ],
+        "fallback": [
+            'span:has-text("K")',             # 包含K的span
+            'span:has-text("万")',            # 包含万的span
+            'div:has-text("K")',              # 包含K的div
+            '.job-info span.red',             # 岗位信息中的红色span
+            '.job-info .salary'               # 岗位信息中的薪资
+        ],
+        "generic": [
+            'em', 'span[class*="pay"]', '.money', '.price',
+            'span[class*="wage"]', 'span[class*="salary"]'
+        ]
+    },
+    "location": {
+        "primary": [
+            '[class*="location"]', '[class*="area"]', 
+            '.job-area', '.work-addr', '.job-location'
+        ],
+        "fallback": [
+            '.job-primary .job-area', '.job-area-wrapper',
+            '.area-district', '.job-city', 'span[class*="area"]'
+        ],
+        "generic": [
+            'span:last-child', 'div:last-child'
+        ]
+    },
+    "job_link": {
+        "primary": [
+            'a.job-card-body', 'a.job-card-left',
+            'a[ka^="search_list"]', 'a[href*="job_detail"]'
+        ],
+        "fallback": [
+            '.job-card-wrapper > a', '.job-primary > a',
+            'a:has(.job-name)', 'a:has(.job-title)'
+        ],
+        "generic": [
+            'a[href*="/job"]', 'a'
+        ]
+    }
+}
+
+# 数据验证规则
+VALIDATION_RULES = {
+    "job_title": {
+        "min_length": 2,
+        "max_length": 50, 
+        "forbidden_words": ["筛选", "排序", "更多", "加载", "搜索"],
+        "required_pattern": None
+    },
+    "company_name": {
+        "min_length": 2,
+        "max_length": 30,
+        "forbidden_words": ["K·薪", "万·薪", "经验", "学历", "岗位", "区", "市"],
+        "forbidden_chars": ["·", "年"]
+    },
+    "salary": {
+        "min_length": 2,
+        "max_length": 20,
+        "required_chars": ["K", "k", "万", "千", "元", "¥", "$"],
+        "pattern": r'\d+[KkWw万千]'
+    },
+    "location": {
+        "min_length": 2,
+        "max_length": 50,
+        "required_words": ["市", "区", "县", "街", "路", "镇", "村", "·"],
+        "forbidden_words": ["K", "经验", "学历", "岗位", "职位", "万", "千"]
+    }
+}
+
+
+
+def _compile_rule_patterns(rules: Dict[str, Dict]) -> Dict[str, Dict[str, "re.Pattern"]]:
+    """将验证规则中的词表预编译为正则交替式，一次扫描代替逐词的 in 判断"""
+    compiled = {}
+    for field_type, field_rules in rules.items():
+        patterns = {}
+        for key in ("forbidden_words", "required_chars", "required_words"):
+            if field_rules.get(key):
+                patterns[key] = re.compile("|".join(map(re.escape, field_rules[key])))
+        if field_rules.get("pattern"):
+            patterns["pattern"] = re.compile(field_rules["pattern"])
+        compiled[field_type] = patterns
+    return compiled
+
+
+RULE_PATTERNS = _compile_rule_patterns(VALIDATION_RULES)
+
+@functools.lru_cache(maxsize=None)
+def candidate_selectors(field_type: str, tiers: Tuple[str, ...] = ("primary", "fallback")) -> Tuple[str, ...]:
+    """按优先级合并字段在指定层级的候选选择器（结果缓存，相同参数返回同一个元组）"""
+    config = SELECTOR_CONFIGS.get(field_type, {})
+    return tuple(selector for tier in tiers for selector in config.get(tier, []))
+
 
 @dataclass
 class SelectorResult:
@@ -37,146 +243,10 @@ class SmartSelector:
     """智能选择器管理器"""
     
     def __init__(self):
-        # 预定义的选择器配置，按优先级排序
-        self.selector_configs = {
-            "job_container": {
-                "primary": [
-                    'li.job-card-wrapper',            # Boss直聘最新结构
-                    'li[data-jid]',                   # Boss直聘岗位ID
-                    '.job-card-left',                 # 左侧卡片
-                    'li:has(a[href*="job_detail"])',  # 包含岗位链接的li
-                    '.job-detail-box',                # Boss直聘特有
-                    'a[ka*="search_list"]',           # ka属性标识
-                    '[data-jobid]',                   # 数据属性标识
-                    '.job-list-item',                 # 列表项目
-                ],
-                "fallback": [
-                    '.job-card-wrapper', '.job-card-container',
-                    'li.job-card-container', '.job-card-left', 
-                    '.job-info-box', '.job-list-box .job-card-body',
-                    '.job-card', '.job-item', '.search-job-result',
-                    'div[data-jobid]', 'a[data-jobid]'
-                ],
-                "generic": [
-                    'li[class*="job"]', 'div[class*="job-card"]',
-                    '.job-primary', '.job-content',
-                    'li', 'article', '.result-item',
-                    'div[class*="item"]', 'div[class*="card"]'
-                ]
-            },
-            "job_title": {
-                "primary": [
-                    '.job-name', '.job-title', 
-                    'a .job-name', 'h3.job-name',
-                    '.job-card-body .name a',  # Boss直聘新结构
-                    'span.job-name',            # 可能是span元素
-                    '.job-info .name'           # 岗位信息名称
-                ],
-                "fallback": [
-                    '.job-info h3', '.job-primary .name',
-                    '.job-card-body .job-name', '[class*="job"][class*="name"]',
-                    'a[href*="job_detail"]:first-child',  # 第一个岗位链接
-                    '.name:not(.company-name)',           # 排除公司名的name类
-                    'h3:first-child'                      # 第一个h3元素
-                ],
-                "generic": [
-                    '.position-name', 'h3', '.title',
-                    'a:first-child', 'span:first-child'  # 第一个链接或span
-                ]
-            },
-            "company_name": {
-                "primary": [
-                    '.company-name', '.company-text',
-                    '.job-company', '.company-info .name'
-                ],
-                "fallback": [
-                    'h3:not(.job-name):not([class*="salary"])',
-                    '.company-info h3', '.job-info .company'
-                ],
-                "generic": [
-                    'span:not([class*="salary"]):not([class*="location"])',
-                    'div:not([class*="salary"]):not([class*="location"])'
-                ]
-            },
-            "salary": {
-                "primary": [
-                    '.job-salary',                    # Boss直聘主要薪资类名
-                    'span.job-salary',                # span版本
-                    '[class*="salary"]',              # 包含salary的类
-                    '.red',                           # 红色文字（薪资常用）
-                    '.salary',                        # 通用salary类
-                    '.job-limit .red',                # 岗位限制中的红色文字
-                    '.job-primary .red',              # 主要信息中的红色文字
-                    '.text-warning',                  # 警告色文字
-                    '.text-orange'                    # 橙色文字
-                ],
-                "fallback": [
-                    'span:has-text("K")',             # 包含K的span
-                    'span:has-text("万")',            # 包含万的span
-                    'div:has-text("K")',              # 包含K的div
-                    '.job-info span.red',             # 岗位信息中的红色span
-                    '.job-info .salary'               # 岗位信息中的薪资
-                ],
-                "generic": [
-                    'em', 'span[class*="pay"]', '.money', '.price',
-                    'span[class*="wage"]', 'span[class*="salary"]'
-                ]
-            },
-            "location": {
-                "primary": [
-                    '[class*="location"]', '[class*="area"]', 
-                    '.job-area', '.work-addr', '.job-location'
-                ],
-                "fallback": [
-                    '.job-primary .job-area', '.job-area-wrapper',
-                    '.area-district', '.job-city', 'span[class*="area"]'
-                ],
-                "generic": [
-                    'span:last-child', 'div:last-child'
-                ]
-            },
-            "job_link": {
-                "primary": [
-                    'a.job-card-body', 'a.job-card-left',
-                    'a[ka^="search_list"]', 'a[href*="job_detail"]'
-                ],
-                "fallback": [
-                    '.job-card-wrapper > a', '.job-primary > a',
-                    'a:has(.job-name)', 'a:has(.job-title)'
-                ],
-                "generic": [
-                    'a[href*="/job"]', 'a'
-                ]
-            }
-        }
-        
-        # 数据验证规则
-        self.validation_rules = {
-            "job_title": {
-                "min_length": 2,
-                "max_length": 50, 
-                "forbidden_words": ["筛选", "排序", "更多", "加载", "搜索"],
-                "required_pattern": None
-            },
-            "company_name": {
-                "min_length": 2,
-                "max_length": 30,
-                "forbidden_words": ["K·薪", "万·薪", "经验", "学历", "岗位", "区", "市"],
-                "forbidden_chars": ["·", "年"]
-            },
-            "salary": {
-                "min_length": 2,
-                "max_length": 20,
-                "required_chars": ["K", "k", "万", "千", "元", "¥", "$"],
-                "pattern": r'\d+[KkWw万千]'
-            },
-            "location": {
-                "min_length": 2,
-                "max_length": 50,
-                "required_words": ["市", "区", "县", "街", "路", "镇", "村", "·"],
-                "forbidden_words": ["K", "经验", "学历", "岗位", "职位", "万", "千"]
-            }
-        }
+        # 选择器配置和验证规则为模块级常量，所有实例共享，不再每次实例化时重建
+        self.selector_configs = SELECTOR_CONFIGS
+        self.validation_rules = VALIDATION_RULES
+        self.rule_patterns = RULE_PATTERNS
         
         # 选择器性能统计
         self.selector_stats = {}
@@ -197,19 +267,25 @@ class SmartSelector:
             logger.warning(f"未知字段类型: {field_type}")
             return []
         
-        selectors = self.selector_configs[field_type]
-        all_selectors = selectors["primary"] + selectors["fallback"] + selectors["generic"]
+        all_selectors = candidate_selectors(field_type, ("primary", "fallback", "generic"))
+        
+        # 各选择器的测试相互独立，有限并发执行
+        semaphore = asyncio.Semaphore(SELECTOR_TEST_CONCURRENCY)
         
-        results = []
+        async def test_one(selector: str) -> Optional[SelectorResult]:
+            async with semaphore:
+                try:
+                    result = await self._test_selector(page, selector, field_type, sample_size)
+                    logger.debug("选择器测试: %s -> 成功率: %.2f, 质量: %.2f", selector, result.success_rate, result.avg_quality_score)
+                    return result
+                except Exception as e:
+                    logger.debug("选择器测试失败: %s - %s", selector, e)
+                    return None
         
-        for selector in all_selectors:
-            try:
-                result = await self._test_selector(page, selector, field_type, sample_size)
-                results.append(result)
-                logger.debug(f"选择器测试: {selector} -> 成功率: {result.success_rate:.2f}, 质量: {result.avg_quality_score:.2f}")
-                
-            except Exception as e:
-                logger.debug(f"选择器测试失败: {selector} - {e}")
+        results = [
+            result for result in await asyncio.gather(*(test_one(selector) for selector in all_selectors))
+            if result is not None
+        ]
         
         # 按综合评分排序（成功率 * 0.6 + 质量分 * 0.4）
         results.sort(key=lambda x: x.success_rate * 0.6 + x.avg_quality_score * 0.4, reverse=True)
@@ -229,8 +305,9 @@ class SmartSelector:
         start_time = time.time()
         
         try:
-            elements = await page.query_selector_all(selector)
-            found_count = len(elements)
+            # 一次调用取回匹配数量和前sample_size个元素的文本
+            probe = await page.eval_on_selector_all(selector, SAMPLE_TEXTS_JS, sample_size)
+            found_count = probe["count"]
             
             if found_count == 0:
                 return SelectorResult(
@@ -243,19 +320,11 @@ class SmartSelector:
                 )
             
             # 测试前几个元素的数据质量
-            test_elements = elements[:min(sample_size, found_count)]
-            quality_scores = []
+            quality_scores = [
+                self._calculate_quality_score(text.strip(), field_type) for text in probe["texts"]
+            ]
             errors = []
             
-            for element in test_elements:
-                try:
-                    text = await element.inner_text()
-                    quality_score = self._calculate_quality_score(text.strip(), field_type)
-                    quality_scores.append(quality_score)
-                except Exception as e:
-                    errors.append(f"文本提取失败: {e}")
-                    quality_scores.append(0.0)
-            
             success_rate = len([s for s in quality_scores if s > 0.3]) / len(quality_scores)
             avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
             
@@ -278,12 +347,15 @@ class SmartSelector:
                 errors=[str(e)]
             )
     
-    def _calculate_quality_score(self, text: str, field_type: str) -> float:
-        """计算文本数据的质量评分（0-1）"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _calculate_quality_score(text: str, field_type: str) -> float:
+        """计算文本数据的质量评分（0-1）- 纯函数，同一页面上大量重复的文本直接命中缓存"""
         if not text:
             return 0.0
         
-        rules = self.validation_rules.get(field_type, {})
+        rules = VALIDATION_RULES.get(field_type, {})
+        patterns = RULE_PATTERNS.get(field_type, {})
         score = 1.0
         
         # 长度检查
@@ -293,11 +365,8 @@ class SmartSelector:
             score -= 0.2
         
         # 禁用词检查
-        if "forbidden_words" in rules:
-            for word in rules["forbidden_words"]:
-                if word in text:
-                    score -= 0.4
-                    break
+        if "forbidden_words" in patterns and patterns["forbidden_words"].search(text):
+            score -= 0.4
         
         # 禁用字符检查
         if "forbidden_chars" in rules:
@@ -306,18 +375,15 @@ class SmartSelector:
                     score -= 0.2
         
         # 必需字符/词检查
-        if "required_chars" in rules:
-            if not any(char in text for char in rules["required_chars"]):
-                score -= 0.5
+        if "required_chars" in patterns and not patterns["required_chars"].search(text):
+            score -= 0.5
         
-        if "required_words" in rules:
-            if not any(word in text for word in rules["required_words"]):
-                score -= 0.3
+        if "required_words" in patterns and not patterns["required_words"].search(text):
+            score -= 0.3
         
         # 模式匹配检查
-        if "pattern" in rules and rules["pattern"]:
-            if not re.search(rules["pattern"], text):
-                score -= 0.4
+        if "pattern" in patterns and not patterns["pattern"].search(text):
+            score -= 0.4
         
         return max(0.0, score)
     
@@ -336,47 +402,91 @@ class SmartSelector:
         """
         if not best_selectors:
             # 如果没有提供最佳选择器，使用默认选择器
-            selectors = self.selector_configs.get(field_type, {})
-            best_selectors = selectors.get("primary", []) + selectors.get("fallback", [])
-        
-        for selector in best_selectors:
-            try:
-                sub_element = await element.query_selector(selector)
-                if sub_element:
-                    text = await sub_element.inner_text()
-                    if text and text.strip():
-                        clean_text = text.strip()
-                        quality_score = self._calculate_quality_score(clean_text, field_type)
-                        
-                        # 对于job_title，增加调试信息
-                        if field_type == "job_title":
-                            logger.debug(f"职位标题选择器 {selector} 找到文本: '{clean_text}', 质量分: {quality_score}")
-                        
-                        if quality_score > 0.3:  # 质量阈值
-                            # 进行字段特定的清洗
-                            cleaned_text = self._clean_field_text(clean_text, field_type)
-                            validation_errors = self._validate_field(cleaned_text, field_type)
-                            
-                            return ExtractedField(
-                                value=cleaned_text,
-                                confidence=quality_score,
-                                source_selector=selector,
-                                validation_errors=validation_errors
-                            )
-                        elif field_type == "job_title" and quality_score > 0:
-                            # 对于职位标题，放宽质量要求
-                            cleaned_text = self._clean_field_text(clean_text, field_type)
-                            return ExtractedField(
-                                value=cleaned_text,
-                                confidence=quality_score,
-                                source_selector=selector,
-                                validation_errors=["质量分较低"]
-                            )
-            except Exception as e:
-                logger.debug(f"选择器 {selector} 提取失败: {e}")
-                continue
-        
-        # 如果所有选择器都失败，返回默认值
+            best_selectors = candidate_selectors(field_type)
+        
+        # 所有候选选择器的文本一次取回，不再为每个选择器分别往返查询元素和读取文本
+        try:
+            texts = await element.evaluate(CANDIDATE_TEXTS_JS, list(best_selectors))
+        except Exception as e:
+            logger.debug("批量读取候选文本失败: %s", e)
+            texts = [False] * len(best_selectors)
+        
+        for selector, text in zip(best_selectors, texts):
+            if text is False:
+                text = await self._query_inner_text(element, selector)
+            extracted_field = self._evaluate_candidate(text, field_type, selector)
+            if extracted_field:
+                return extracted_field
+        
+        return self._default_field(field_type)
+    
+    @staticmethod
+    async def _query_inner_text(element: ElementHandle, selector: str) -> Optional[str]:
+        """通过Playwright查询单个选择器的文本（用于原生querySelector不支持的选择器）"""
+        try:
+            sub_element = await element.query_selector(selector)
+            if sub_element:
+                return await sub_element.inner_text()
+        except Exception as e:
+            logger.debug("选择器 %s 提取失败: %s", selector, e)
+        return None
+    
+    def select_field_value(self, field_type: str,
+                           candidates: Iterable[Tuple[str, Optional[str]]]) -> ExtractedField:
+        """
+        从批量取回的候选文本中选出字段值，规则与 extract_field_smart 一致
+        
+        Args:
+            field_type: 字段类型
+            candidates: (选择器, 文本) 序列，未匹配的选择器文本为 None
+            
+        Returns:
+            提取的字段数据和置信度
+        """
+        for selector, text in candidates:
+            extracted_field = self._evaluate_candidate(text, field_type, selector)
+            if extracted_field:
+                return extracted_field
+        
+        return self._default_field(field_type)
+    
+    def _evaluate_candidate(self, text: Optional[str], field_type: str, selector: str) -> Optional[ExtractedField]:
+        """评估单个候选文本，质量不达标时返回None"""
+        clean_text = (text or "").strip()
+        if not clean_text:
+            return None
+        
+        quality_score = self._calculate_quality_score(clean_text, field_type)
+        
+        # 对于job_title，增加调试信息
+        if field_type == "job_title":
+            logger.debug("职位标题选择器 %s 找到文本: '%s', 质量分: %s", selector, clean_text, quality_score)
+        
+        if quality_score > 0.3:  # 质量阈值
+            # 进行字段特定的清洗
+            cleaned_text = self._clean_field_text(clean_text, field_type)
+            validation_errors = self._validate_field(cleaned_text, field_type)
+            
+            return ExtractedField(
+                value=cleaned_text,
+                confidence=quality_score,
+                source_selector=selector,
+                validation_errors=validation_errors
+            )
+        elif field_type == "job_title" and quality_score > 0:
+            # 对于职位标题，放宽质量要求
+            cleaned_text = self._clean_field_text(clean_text, field_type)
+            return ExtractedField(
+                value=cleaned_text,
+                confidence=quality_score,
+                source_selector=selector,
+                validation_errors=["质量分较低"]
+            )
+        
+        return None
+    
+    def _default_field(self, field_type: str) -> ExtractedField:
+        """所有选择器都失败时的默认字段"""
         default_value = self._get_default_value(field_type)
         return ExtractedField(
             value=default_value,
@@ -385,47 +495,51 @@ class SmartSelector:
             validation_errors=["所有选择器都未能提取到有效数据"]
         )
     
-    def _clean_field_text(self, text: str, field_type: str) -> str:
-        """对提取的文本进行字段特定的清洗"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _clean_field_text(text: str, field_type: str) -> str:
+        """对提取的文本进行字段特定的清洗（纯函数，结果缓存）"""
         if field_type == "salary":
             # 清理薪资文本中的异常字符
-            text = text.replace('·', '-').replace('薪', '').strip()
+            text = text.translate(SALARY_TEXT_TRANS).strip()
             
             # 修复"-K"这种显示异常（Boss直聘的反爬虫导致的不完整显示）
-            if re.match(r'^-[Kk]$', text) or re.match(r'^[Kk]-$', text):
+            if INCOMPLETE_SALARY_RE.match(text):
                 # 这种情况下薪资信息不完整，标记为需要从详情页获取
-                logger.debug(f"检测到不完整的薪资格式: {text}")
+                logger.debug("检测到不完整的薪资格式: %s", text)
                 return "薪资待更新"  # 特殊标记，后续从详情页更新
             
             # 尝试从更完整的文本中提取
-            match = re.search(r'\d+[KkWw万千][\-~]\d+[KkWw万千]', text)
+            match = SALARY_RANGE_RE.search(text)
             if match:
                 text = match.group()
         
         elif field_type == "company_name":
             # 移除公司名中的多余信息
-            text = re.sub(r'\s*\(.*?\)\s*', '', text)  # 去掉括号内容
-            text = re.sub(r'\s*（.*?）\s*', '', text)  # 去掉中文括号内容
+            text = BRACKET_CONTENT_RE.sub('', text)  # 去掉括号内容
+            text = CN_BRACKET_CONTENT_RE.sub('', text)  # 去掉中文括号内容
         
         elif field_type == "location":
             # 地点信息标准化
             if '·' not in text:
                 # 为没有·分隔符的地点添加格式化
-                cities = ['北京', '上海', '广州', '深圳', '杭州', '南京', '武汉', '成都']
-                for city in cities:
-                    if city in text and not text.startswith(city):
+                for city_match in LOCATION_CITY_RE.finditer(text):
+                    # 已经以该城市开头的不处理（即使后文再次出现同一城市名）
+                    if city_match.start() > 0 and not text.startswith(city_match.group()):
                         # 将城市名移到前面
-                        text = re.sub(city, '', text)
+                        city = city_match.group()
+                        text = text.replace(city, '')
                         text = f"{city}·{text.strip()}"
                         break
         
         elif field_type == "job_title":
             # 岗位标题清洗
-            if '-' in text and len(text.split('-')) >= 2:
-                # 处理"职位名称-地点"格式
-                parts = text.split('-')
-                if len(parts[0].strip()) > len(parts[1].strip()):
-                    text = parts[0].strip()  # 取较长的部分作为职位名称
+            # 处理"职位名称-地点"格式：只需要前两段，partition 在第一个分隔符处即停，不必切分整串
+            head, sep, rest = text.partition('-')
+            if sep:
+                head = head.strip()
+                if len(head) > len(rest.partition('-')[0].strip()):
+                    text = head  # 取较长的部分作为职位名称
         
         return text.strip()
     
@@ -444,14 +558,7 @@ class SmartSelector:
     
     def _get_default_value(self, field_type: str) -> str:
         """获取字段的默认值"""
-        defaults = {
-            "job_title": "职位信息获取失败",
-            "company_name": "公司信息获取失败", 
-            "salary": "薪资面议",
-            "location": "地点待确认",
-            "job_link": ""
-        }
-        return defaults.get(field_type, "信息获取失败")
+        return DEFAULT_FIELD_VALUES.get(field_type, "信息获取失败")
     
     def update_selector_stats(self, field_type: str, selector: str, success: bool, quality_score: float):
         """更新选择器性能统计"""